@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Set, Union
+from typing import TYPE_CHECKING, Optional, Set, Union
 
 from docling_core.types.doc import DoclingDocument
 
@@ -51,6 +51,16 @@ class PaginatedDocumentBackend(AbstractDocumentBackend):
     def page_count(self) -> int:
         pass
 
+    @classmethod
+    def probe_page_count(
+        cls, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]
+    ) -> Optional[int]:
+        """Read the page count of a document without loading the backend.
+
+        Returns None if it can't be known cheaply.
+        """
+        return None
+
 
 class DeclarativeDocumentBackend(AbstractDocumentBackend):
     """DeclarativeDocumentBackend.
@@ -4,6 +4,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Iterable, List, Optional, Union
 
+import numpy as np
 import pypdfium2 as pdfium
 from docling_core.types.doc import BoundingBox, CoordOrigin, Size
 from docling_parse.docling_parse import pdf_parser_v1
@@ -13,6 +14,8 @@ from pypdfium2 import PdfPage
 from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
 from docling.datamodel.base_models import Cell
 from docling.datamodel.document import InputDocument
+from docling.utils.locks import pypdfium2_lock
+from docling.utils.text_index import TextCellIndex
 
 _log = logging.getLogger(__name__)
 
@@ -22,6 +25,8 @@ class DoclingParsePageBackend(PdfPageBackend):
         self, parser: pdf_parser_v1, document_hash: str, page_no: int, page_obj: PdfPage
     ):
         self._ppage = page_obj
+        self._size: Optional[Size] = None
+        self._text_index: Optional[TextCellIndex] = None
         parsed_page = parser.parse_pdf_from_key_on_page(document_hash, page_no)
 
         self.valid = "pages" in parsed_page
@@ -35,38 +40,38 @@ class DoclingParsePageBackend(PdfPageBackend):
     def is_valid(self) -> bool:
         return self.valid
 
+    def _get_text_index(self) -> TextCellIndex:
+        # The cells of the parsed page are converted once, on the first query.
+        if self._text_index is None:
+            page_size = self.get_size()
+            parser_width = self._dpage["width"]
+            parser_height = self._dpage["height"]
+
+            coords = np.array(
+                [cell["box"]["device"] for cell in self._dpage["cells"]],
+                dtype=np.float64,
+            ).reshape(-1, 4)
+            x0, y0, x1, y1 = coords.T
+            boxes = np.stack(
+                [
+                    x0 * page_size.width / parser_width,
+                    page_size.height - y1 * page_size.height / parser_height,
+                    x1 * page_size.width / parser_width,
+                    page_size.height - y0 * page_size.height / parser_height,
+                ],
+                axis=1,
+            )
+            self._text_index = TextCellIndex(
+                [cell["content"]["rnormalized"] for cell in self._dpage["cells"]],
+                boxes,
+            )
+        return self._text_index
+
     def get_text_in_rect(self, bbox: BoundingBox) -> str:
         if not self.valid:
             return ""
         # Find intersecting cells on the page
-        text_piece = ""
-        page_size = self.get_size()
-        parser_width = self._dpage["width"]
-        parser_height = self._dpage["height"]
-
-        scale = (
-            1  # FIX - Replace with param in get_text_in_rect across backends (optional)
-        )
-
-        for i in range(len(self._dpage["cells"])):
-            rect = self._dpage["cells"][i]["box"]["device"]
-            x0, y0, x1, y1 = rect
-            cell_bbox = BoundingBox(
-                l=x0 * scale * page_size.width / parser_width,
-                b=y0 * scale * page_size.height / parser_height,
-                r=x1 * scale * page_size.width / parser_width,
-                t=y1 * scale * page_size.height / parser_height,
-                coord_origin=CoordOrigin.BOTTOMLEFT,
-            ).to_top_left_origin(page_height=page_size.height * scale)
-
-            overlap_frac = cell_bbox.intersection_area_with(bbox) / cell_bbox.area()
-
-            if overlap_frac > 0.5:
-                if len(text_piece) > 0:
-                    text_piece += " "
-                text_piece += self._dpage["cells"][i]["content"]["rnormalized"]
-
-        return text_piece
+        return self._get_text_index().get_text_in_rect(bbox)
 
     def get_text_cells(self) -> Iterable[Cell]:
         cells: List[Cell] = []
@@ -167,31 +172,42 @@ class DoclingParsePageBackend(PdfPageBackend):
             padbox.r = page_size.width - padbox.r
             padbox.t = page_size.height - padbox.t
 
-        image = (
-            self._ppage.render(
-                scale=scale * 1.5,
-                rotation=0,  # no additional rotation
-                crop=padbox.as_tuple(),
-            )
-            .to_pil()
-            .resize(size=(round(cropbox.width * scale), round(cropbox.height * scale)))
-        )  # We resize the image from 1.5x the given scale to make it sharper.
+        with pypdfium2_lock:
+            image = (
+                self._ppage.render(
+                    scale=scale * 1.5,
+                    rotation=0,  # no additional rotation
+                    crop=padbox.as_tuple(),
+                )
+                .to_pil()
+                .resize(
+                    size=(round(cropbox.width * scale), round(cropbox.height * scale))
+                )
+            )  # We resize the image from 1.5x the given scale to make it sharper.
 
         return image
 
     def get_size(self) -> Size:
-        return Size(width=self._ppage.get_width(), height=self._ppage.get_height())
+        if self._size is None:
+            with pypdfium2_lock:
+                self._size = Size(
+                    width=self._ppage.get_width(), height=self._ppage.get_height()
+                )
+        return self._size
 
     def unload(self):
-        self._ppage = None
+        with pypdfium2_lock:
+            self._ppage = None
         self._dpage = None
+        self._text_index = None
 
 
 class DoclingParseDocumentBackend(PdfDocumentBackend):
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
-        self._pdoc = pdfium.PdfDocument(self.path_or_stream)
+        with pypdfium2_lock:
+            self._pdoc = pdfium.PdfDocument(self._pdfium_input)
         self.parser = pdf_parser_v1()
 
         success = False
@@ -210,12 +226,14 @@ class DoclingParseDocumentBackend(PdfDocumentBackend):
             )
 
     def page_count(self) -> int:
-        return len(self._pdoc)  # To be replaced with docling-parse API
+        with pypdfium2_lock:
+            return len(self._pdoc)  # To be replaced with docling-parse API
 
     def load_page(self, page_no: int) -> DoclingParsePageBackend:
-        return DoclingParsePageBackend(
-            self.parser, self.document_hash, page_no, self._pdoc[page_no]
-        )
+        with pypdfium2_lock:
+            ppage = self._pdoc[page_no]
+
+        return DoclingParsePageBackend(self.parser, self.document_hash, page_no, ppage)
 
     def is_valid(self) -> bool:
         return self.page_count() > 0
@@ -223,5 +241,6 @@ class DoclingParseDocumentBackend(PdfDocumentBackend):
     def unload(self):
         super().unload()
         self.parser.unload_document(self.document_hash)
-        self._pdoc.close()
+        with pypdfium2_lock:
+            self._pdoc.close()
         self._pdoc = None
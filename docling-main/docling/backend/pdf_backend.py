@@ -3,12 +3,17 @@ from io import BytesIO
 from pathlib import Path
 from typing import Iterable, Optional, Set, Union
 
+import numpy as np
+import pypdfium2 as pdfium
 from docling_core.types.doc import BoundingBox, Size
 from PIL import Image
+from pypdfium2._helpers.misc import PdfiumError
 
 from docling.backend.abstract_backend import PaginatedDocumentBackend
 from docling.datamodel.base_models import Cell, InputFormat
 from docling.datamodel.document import InputDocument
+from docling.utils.locks import pypdfium2_lock
+from docling.utils.utils import FileData
 
 
 class PdfPageBackend(ABC):
@@ -31,6 +36,11 @@ class PdfPageBackend(ABC):
     ) -> Image.Image:
         pass
 
+    def get_page_array(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> np.ndarray:
+        return np.asarray(self.get_page_image(scale=scale, cropbox=cropbox))
+
     @abstractmethod
     def get_size(self) -> Size:
         pass
@@ -49,6 +59,11 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     def __init__(self, in_doc: InputDocument, path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
+        # Input of pdfium: the content already read by the InputDocument, if any.
+        self._pdfium_input: Union[BytesIO, Path, FileData] = (
+            in_doc._data if in_doc._data is not None else path_or_stream
+        )
+
         if self.input_format is not InputFormat.PDF:
             if self.input_format is InputFormat.IMAGE:
                 buf = BytesIO()
@@ -56,11 +71,17 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
                 img.save(buf, "PDF")
                 buf.seek(0)
                 self.path_or_stream = buf
+                self._pdfium_input = buf
             else:
                 raise RuntimeError(
                     f"Incompatible file format {self.input_format} was passed to a PdfDocumentBackend."
                 )
 
+    def unload(self):
+        super().unload()
+        # Lets go of the mapped file, which is closed once pdfium is done with it.
+        self._pdfium_input = None  # type: ignore[assignment]
+
     @abstractmethod
     def load_page(self, page_no: int) -> PdfPageBackend:
         pass
@@ -69,6 +90,27 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     def page_count(self) -> int:
         pass
 
+    @classmethod
+    def probe_page_count(
+        cls, in_doc: InputDocument, path_or_stream: Union[BytesIO, Path]
+    ) -> Optional[int]:
+        # pdfium only reads the cross-reference table, the trailer and the root of
+        # the page tree, the pages themselves are not parsed.
+        if in_doc.format is not InputFormat.PDF:
+            return None
+
+        try:
+            with pypdfium2_lock:
+                pdoc = pdfium.PdfDocument(
+                    in_doc._data if in_doc._data is not None else path_or_stream
+                )
+                try:
+                    return len(pdoc)
+                finally:
+                    pdoc.close()
+        except PdfiumError:
+            return None
+
     @classmethod
     def supported_formats(cls) -> Set[InputFormat]:
         return {InputFormat.PDF}
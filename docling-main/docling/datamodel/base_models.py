@@ -1,7 +1,8 @@
 from enum import Enum, auto
 from io import BytesIO
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from docling_core.types.doc import (
     BoundingBox,
     DocItemLabel,
@@ -190,14 +191,111 @@ class Page(BaseModel):
     _image_cache: Dict[float, Image] = (
         {}
     )  # Cache of images in different scales. By default it is cleared during assembling.
+    _image_array_cache: Dict[float, np.ndarray] = (
+        {}
+    )  # Arrays of the cached images, cleared together with the images.
 
-    def get_image(self, scale: float = 1.0) -> Optional[Image]:
-        if self._backend is None:
-            return self._image_cache.get(scale, None)
+    def get_image(
+        self, scale: float = 1.0, cropbox: Optional[BoundingBox] = None
+    ) -> Optional[Image]:
+        if cropbox is not None:
+            return self._get_image_crop(scale, cropbox)
         if not scale in self._image_cache:
-            self._image_cache[scale] = self._backend.get_page_image(scale=scale)
+            # Thumbnails are downsampled from the page image at scale 1. The other
+            # scales are inputs of the models and always rendered by the backend.
+            if scale < 1.0 and 1.0 in self._image_cache:
+                source = self._image_cache[1.0]
+                if self.size is not None:
+                    width, height = self.size.width, self.size.height
+                else:
+                    width, height = source.width, source.height
+                self._image_cache[scale] = source.resize(
+                    size=(round(width * scale), round(height * scale))
+                )
+            elif self._backend is None:
+                return None
+            else:
+                self._image_cache[scale] = self._backend.get_page_image(scale=scale)
         return self._image_cache[scale]
 
+    def _get_image_crop(self, scale: float, cropbox: BoundingBox) -> Optional[Image]:
+        crop_box = self._get_cached_crop_box(scale, cropbox)
+        if crop_box is not None:
+            # Sliced from the page image, which is kept for the other stages.
+            image = self.get_image(scale=scale)
+            if image is None:
+                return None
+            return image.crop(crop_box)
+        if self._backend is None:
+            return None
+        # Rendering only the crop is cheaper than a page image at a larger scale.
+        return self._backend.get_page_image(scale=scale, cropbox=cropbox)
+
+    def _get_cached_crop_box(
+        self, scale: float, cropbox: BoundingBox
+    ) -> Optional[Tuple[int, int, int, int]]:
+        # Pixel box of the crop in the page image at the scale, if the crop
+        # can be taken from a cached page image instead of being rendered.
+        if scale not in self._image_cache and not (
+            scale < 1.0 and 1.0 in self._image_cache
+        ):
+            return None
+        if self.size is not None:
+            cropbox = cropbox.to_top_left_origin(self.size.height)
+        return (
+            round(cropbox.l * scale),
+            round(cropbox.t * scale),
+            round(cropbox.r * scale),
+            round(cropbox.b * scale),
+        )
+
+    def get_image_array(
+        self, scale: float = 1.0, cropbox: Optional[BoundingBox] = None
+    ) -> Optional[np.ndarray]:
+        # Read-only array of the page image. The array of each scale is converted
+        # once, crops of the cached page image are views into it.
+        if cropbox is not None:
+            crop_box = self._get_cached_crop_box(scale, cropbox)
+            if crop_box is None:
+                if self._backend is None:
+                    return None
+                return self._backend.get_page_array(scale=scale, cropbox=cropbox)
+            page_array = self.get_image_array(scale=scale)
+            if page_array is None:
+                return None
+            l, t, r, b = crop_box
+            height, width = page_array.shape[:2]
+            if l >= 0 and t >= 0 and r <= width and b <= height:
+                return page_array[t:b, l:r]
+
+            # Like Image.crop, the area outside of the page is filled with zeros.
+            crop = np.zeros(
+                (max(0, b - t), max(0, r - l)) + page_array.shape[2:],
+                dtype=page_array.dtype,
+            )
+            src_t, src_l = max(0, t), max(0, l)
+            src = page_array[src_t : min(b, height), src_l : min(r, width)]
+            crop[
+                src_t - t : src_t - t + src.shape[0],
+                src_l - l : src_l - l + src.shape[1],
+            ] = src
+            crop.flags.writeable = False
+            return crop
+
+        if not scale in self._image_array_cache:
+            image = self.get_image(scale=scale)
+            if image is None:
+                return None
+            self._image_array_cache[scale] = np.asarray(image)
+        return self._image_array_cache[scale]
+
+    def _release_image(self, scale: float):
+        # Drops an image scale once the stages using it have run. The default
+        # scale is kept for the output.
+        if scale != self._default_image_scale:
+            self._image_cache.pop(scale, None)
+            self._image_array_cache.pop(scale, None)
+
     @property
     def image(self) -> Optional[Image]:
         return self.get_image(scale=self._default_image_scale)
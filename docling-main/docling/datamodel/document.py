@@ -1,9 +1,10 @@
 import logging
 import re
+import sys
 from enum import Enum
 from io import BytesIO
 from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import filetype
 from docling_core.types.doc import (
@@ -32,7 +33,6 @@ from docling_core.types.legacy_doc.document import (
 )
 from docling_core.types.legacy_doc.document import CCSFileInfoObject as DsFileInfoObject
 from docling_core.types.legacy_doc.document import ExportedCCSDocument as DsDocument
-from docling_core.utils.file import resolve_file_source
 from pydantic import BaseModel
 from typing_extensions import deprecated
 
@@ -51,9 +51,10 @@ from docling.datamodel.base_models import (
     MimeTypeToFormat,
     Page,
 )
-from docling.datamodel.settings import DocumentLimits
+from docling.datamodel.settings import DocumentLimits, settings
+from docling.utils.fetch import fetch_sources
 from docling.utils.profiling import ProfilingItem
-from docling.utils.utils import create_file_hash, create_hash
+from docling.utils.utils import FileData, create_data_hash, create_hash, map_file_data
 
 if TYPE_CHECKING:
     from docling.document_converter import FormatOption
@@ -93,6 +94,12 @@ class InputDocument(BaseModel):
     page_count: int = 0
 
     _backend: AbstractDocumentBackend  # Internal PDF backend used
+    _backend_args: Optional[
+        Tuple[Type[AbstractDocumentBackend], Union[BytesIO, Path]]
+    ] = None  # Backend initialization deferred to load_backend()
+    _data: Optional[FileData] = (
+        None  # Content read once, for hashing and the pdfium input of PDF backends
+    )
 
     def __init__(
         self,
@@ -101,6 +108,7 @@ class InputDocument(BaseModel):
         backend: Type[AbstractDocumentBackend],
         filename: Optional[str] = None,
         limits: Optional[DocumentLimits] = None,
+        defer_backend: bool = False,
     ):
         super().__init__(
             file="", document_hash="", format=InputFormat.PDF
@@ -116,8 +124,8 @@ class InputDocument(BaseModel):
                 if self.filesize > self.limits.max_file_size:
                     self.valid = False
                 else:
-                    self.document_hash = create_file_hash(path_or_stream)
-                    self._init_doc(backend, path_or_stream)
+                    self._data = map_file_data(path_or_stream)
+                    self.document_hash = create_data_hash(self._data)
 
             elif isinstance(path_or_stream, BytesIO):
                 assert (
@@ -129,21 +137,66 @@ class InputDocument(BaseModel):
                 if self.filesize > self.limits.max_file_size:
                     self.valid = False
                 else:
-                    self.document_hash = create_file_hash(path_or_stream)
-                    self._init_doc(backend, path_or_stream)
+                    self._data = map_file_data(path_or_stream)
+                    self.document_hash = create_data_hash(self._data)
             else:
                 raise RuntimeError(
                     f"Unexpected type path_or_stream: {type(path_or_stream)}"
                 )
 
+        except (FileNotFoundError, OSError) as e:
+            self.valid = False
+            _log.exception(
+                f"File {self.file.name} not found or cannot be opened.", exc_info=e
+            )
+            # raise
+        except RuntimeError as e:
+            self.valid = False
+            _log.exception(
+                f"An unexpected error occurred while opening the document {self.file.name}",
+                exc_info=e,
+            )
+            # raise
+
+        # Reject documents over the page limit before loading their backend.
+        if (
+            self.valid
+            and self.limits.max_num_pages < sys.maxsize
+            and backend is not None
+            and issubclass(backend, PaginatedDocumentBackend)
+        ):
+            page_count = backend.probe_page_count(self, path_or_stream)
+            if page_count is not None:
+                self.page_count = page_count
+                self._check_page_limits()
+
+        if self.valid:
+            self._backend_args = (backend, path_or_stream)
+            # Deferred documents keep the mapped file until load_backend(), or
+            # until release() if the backend is not loaded, e.g. on cache hits.
+            if not defer_backend:
+                self.load_backend()
+        else:
+            self._data = None
+
+    def load_backend(self) -> None:
+        """Initialize the backend of a document created with defer_backend=True."""
+        if self._backend_args is None:  # already loaded, or invalid document
+            return
+
+        backend, path_or_stream = self._backend_args
+        self._backend_args = None
+
+        try:
+            self._init_doc(backend, path_or_stream)
+
             # For paginated backends, check if the maximum page count is exceeded.
             if self.valid and self._backend.is_valid():
                 if self._backend.supports_pagination() and isinstance(
                     self._backend, PaginatedDocumentBackend
                 ):
                     self.page_count = self._backend.page_count()
-                    if not self.page_count <= self.limits.max_num_pages:
-                        self.valid = False
+                    self._check_page_limits()
 
         except (FileNotFoundError, OSError) as e:
             self.valid = False
@@ -158,6 +211,26 @@ class InputDocument(BaseModel):
                 exc_info=e,
             )
             # raise
+        finally:
+            # The backend holds on to the data it needs.
+            self._data = None
+
+    def release(self) -> None:
+        """Drop the input of a deferred document whose backend won't be loaded."""
+        self._backend_args = None
+        self._data = None
+
+    def get_page_nos(self) -> List[int]:
+        """page_no (from 0) of the pages to convert, as selected by the limits."""
+        return self.limits.select_pages(self.page_count)
+
+    def _check_page_limits(self) -> None:
+        num_pages = len(self.get_page_nos())
+        if not num_pages <= self.limits.max_num_pages:
+            self.valid = False
+        elif num_pages == 0 and self.page_count > 0:
+            _log.info(f"No pages of document {self.file.name} are selected.")
+            self.valid = False
 
     def _init_doc(
         self,
@@ -456,10 +529,11 @@ class _DocumentConversionInput(BaseModel):
     limits: Optional[DocumentLimits] = DocumentLimits()
 
     def docs(
-        self, format_options: Dict[InputFormat, "FormatOption"]
+        self,
+        format_options: Dict[InputFormat, "FormatOption"],
+        defer_backend: bool = False,
     ) -> Iterable[InputDocument]:
-        for item in self.path_or_stream_iterator:
-            obj = resolve_file_source(item) if isinstance(item, str) else item
+        for obj in self.sources():
             format = self._guess_format(obj)
             if format not in format_options.keys():
                 _log.info(
@@ -476,6 +550,7 @@ class _DocumentConversionInput(BaseModel):
                     filename=obj.name,
                     limits=self.limits,
                     backend=backend,
+                    defer_backend=defer_backend,
                 )
             elif isinstance(obj, DocumentStream):
                 yield InputDocument(
@@ -484,10 +559,22 @@ class _DocumentConversionInput(BaseModel):
                     filename=obj.name,
                     limits=self.limits,
                     backend=backend,
+                    defer_backend=defer_backend,
                 )
             else:
                 raise RuntimeError(f"Unexpected obj type in iterator: {type(obj)}")
 
+    def sources(self) -> Iterable[Union[Path, DocumentStream]]:
+        # URL sources are downloaded concurrently, ahead of their conversion.
+        return fetch_sources(
+            self.path_or_stream_iterator,
+            max_size=(self.limits or DocumentLimits()).max_file_size,
+            concurrency=settings.perf.fetch_concurrency,
+            retries=settings.perf.fetch_retries,
+            timeout=settings.perf.fetch_timeout,
+            ordered=settings.perf.doc_batch_ordered,
+        )
+
     def _guess_format(self, obj: Union[Path, DocumentStream]):
         content = b""  # empty binary blob
         format = None
@@ -26,6 +26,13 @@ class OcrOptions(BaseModel):
     bitmap_area_threshold: float = (
         0.05  # percentage of the area for a bitmap to processed with OCR
     )
+    # Render each region at the lowest scale keeping its text lines at the optimal
+    # height for the OCR engine, instead of always at the engine scale.
+    adaptive_scale: bool = False
+    # OCR the full page regions on a thumbnail at this scale first, and skip them if
+    # no text of at least thumbnail_confidence (0 to 1) is found, e.g. on blank pages.
+    thumbnail_scale: Optional[float] = None
+    thumbnail_confidence: float = 0.5
 
 
 class EasyOcrOptions(OcrOptions):
@@ -1,22 +1,75 @@
 import sys
 from pathlib import Path
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+DEFAULT_PAGE_RANGE: Tuple[int, int] = (1, sys.maxsize)
+
 
 class DocumentLimits(BaseModel):
     max_num_pages: int = sys.maxsize
     max_file_size: int = sys.maxsize
 
+    # Pages to convert, numbered from 1 as in the DoclingDocument: the inclusive
+    # (first, last) range, restricted to page_numbers if given. max_num_pages
+    # applies to the selected pages.
+    page_range: Tuple[int, int] = DEFAULT_PAGE_RANGE
+    page_numbers: Optional[List[int]] = None
+
+    @model_validator(mode="after")
+    def check_pages(self) -> "DocumentLimits":
+        first, last = self.page_range
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range {self.page_range}.")
+        if self.page_numbers is not None and any(n < 1 for n in self.page_numbers):
+            raise ValueError(f"Invalid page numbers {self.page_numbers}.")
+        return self
+
+    def has_page_selection(self) -> bool:
+        return self.page_range != DEFAULT_PAGE_RANGE or self.page_numbers is not None
+
+    def select_pages(self, page_count: int) -> List[int]:
+        # page_no (from 0) of the selected pages of a document, in order.
+        first, last = self.page_range
+        page_nos = range(first - 1, min(last, page_count))
+        if self.page_numbers is None:
+            return list(page_nos)
+        selected = {n - 1 for n in self.page_numbers}
+        return [page_no for page_no in page_nos if page_no in selected]
+
 
 class BatchConcurrencySettings(BaseModel):
     doc_batch_size: int = 2
-    doc_batch_concurrency: int = 2
+    doc_batch_concurrency: int = 1  # >1: convert documents in a pool of processes
     page_batch_size: int = 4
-    page_batch_concurrency: int = 2
+    page_batch_concurrency: int = 1  # >1: run the page stages in their own threads
     elements_batch_size: int = 16
 
+    # Order of the results when documents are converted in a process pool.
+    # True: yield in input order, False: yield in completion order.
+    doc_batch_ordered: bool = True
+
+    # Load the models in the parent process and fork the pool processes, which
+    # share the model weights copy-on-write. Requires the "fork" start method.
+    doc_batch_prefork: bool = False
+
+    # Input documents opened ahead (source resolution, hashing, backend loading) in
+    # a background thread while the current one converts. 0: open them on demand.
+    doc_prefetch: int = 0
+
+    # URL sources downloaded in parallel ahead of their conversion, attempts after a
+    # failed download, and timeout (seconds) of the connection and of each read.
+    fetch_concurrency: int = 4
+    fetch_retries: int = 3
+    fetch_timeout: Optional[float] = 60.0
+
+    # Page regions recognized in a single call of the OCR engines which support it,
+    # and number of such calls running in parallel.
+    ocr_batch_size: int = 16
+    ocr_concurrency: int = 1
+
     # doc_batch_size: int = 1
     # doc_batch_concurrency: int = 1
     # page_batch_size: int = 1
@@ -39,11 +92,28 @@ class DebugSettings(BaseModel):
     debug_output_path: str = str(Path.cwd() / "debug")
 
 
+class CacheSettings(BaseModel):
+    # Root directory of the persistent caches, caching is disabled if not set.
+    cache_dir: Optional[str] = None
+
+    # Maximum size of the cached conversion results, in bytes. 0 disables the cache.
+    doc_cache_max_size: int = 2 * 1024**3
+
+    # Maximum size of the cached pages of paginated pipelines, in bytes. 0 disables the cache.
+    page_cache_max_size: int = 2 * 1024**3
+
+    # Maximum size of the cached OCR results of page regions, in bytes. 0 disables the cache.
+    ocr_cache_max_size: int = 512 * 1024**2
+
+
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DOCLING_", env_nested_delimiter="_")
 
     perf: BatchConcurrencySettings
     debug: DebugSettings
+    cache: CacheSettings
 
 
-settings = AppSettings(perf=BatchConcurrencySettings(), debug=DebugSettings())
+settings = AppSettings(
+    perf=BatchConcurrencySettings(), debug=DebugSettings(), cache=CacheSettings()
+)
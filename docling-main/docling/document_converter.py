@@ -1,9 +1,27 @@
 import logging
+import multiprocessing
+import queue
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Type
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel, ConfigDict, model_validator, validate_call
 
@@ -21,14 +39,27 @@ from docling.datamodel.document import (
     _DocumentConversionInput,
 )
 from docling.datamodel.pipeline_options import PipelineOptions
-from docling.datamodel.settings import DocumentLimits, settings
-from docling.pipeline.base_pipeline import BasePipeline
+from docling.datamodel.settings import (
+    DEFAULT_PAGE_RANGE,
+    BatchConcurrencySettings,
+    CacheSettings,
+    DebugSettings,
+    DocumentLimits,
+    settings,
+)
+from docling.pipeline.base_pipeline import BasePipeline, PaginatedPipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.cache import ConversionResultCache
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
+_PREFETCH_END = object()  # Marks the end of the prefetched items.
+_PREFETCH_POLL_INTERVAL = 0.1  # Seconds between checks for an aborted prefetch.
+
+_T = TypeVar("_T")
+
 
 class FormatOption(BaseModel):
     pipeline_cls: Type[BasePipeline]
@@ -138,6 +169,7 @@ class DocumentConverter:
                 self.format_to_options.pop(f)
 
         self.initialized_pipelines: Dict[Type[BasePipeline], BasePipeline] = {}
+        self._conversion_cache: Optional[ConversionResultCache] = None
 
     def initialize_pipeline(self, format: InputFormat):
         """Initialize the conversion pipeline for the selected format."""
@@ -150,6 +182,8 @@ class DocumentConverter:
         raises_on_error: bool = True,
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
+        page_range: Tuple[int, int] = DEFAULT_PAGE_RANGE,
+        page_numbers: Optional[List[int]] = None,
     ) -> ConversionResult:
 
         all_res = self.convert_all(
@@ -157,6 +191,8 @@ class DocumentConverter:
             raises_on_error=raises_on_error,
             max_num_pages=max_num_pages,
             max_file_size=max_file_size,
+            page_range=page_range,
+            page_numbers=page_numbers,
         )
         return next(all_res)
 
@@ -167,14 +203,18 @@ class DocumentConverter:
         raises_on_error: bool = True,  # True: raises on first conversion error; False: does not raise on conv error
         max_num_pages: int = sys.maxsize,
         max_file_size: int = sys.maxsize,
+        page_range: Tuple[int, int] = DEFAULT_PAGE_RANGE,
+        page_numbers: Optional[List[int]] = None,
     ) -> Iterator[ConversionResult]:
         limits = DocumentLimits(
             max_num_pages=max_num_pages,
             max_file_size=max_file_size,
+            page_range=page_range,
+            page_numbers=page_numbers,
         )
         conv_input = _DocumentConversionInput(
             path_or_stream_iterator=source,
-            limit=limits,
+            limits=limits,
         )
         conv_res_iter = self._convert(conv_input, raises_on_error=raises_on_error)
         for conv_res in conv_res_iter:
@@ -188,25 +228,96 @@ class DocumentConverter:
             else:
                 yield conv_res
 
+    @validate_call(config=ConfigDict(strict=True))
+    def convert_streaming(
+        self,
+        source: Path | str | DocumentStream,
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+        page_range: Tuple[int, int] = DEFAULT_PAGE_RANGE,
+        page_numbers: Optional[List[int]] = None,
+    ) -> Iterator[ConversionResult]:
+        """Convert a single document, yielding it in fragments of consecutive pages.
+
+        Paginated formats (PDF, images) yield one ConversionResult per page batch
+        (settings.perf.page_batch_size), whose document only holds these pages.
+        These fragments are not cached. Other formats yield a single, complete
+        ConversionResult, which goes through the conversion cache.
+        """
+        assert self.allowed_formats is not None
+        assert self.format_to_options is not None
+
+        limits = DocumentLimits(
+            max_num_pages=max_num_pages,
+            max_file_size=max_file_size,
+            page_range=page_range,
+            page_numbers=page_numbers,
+        )
+        conv_input = _DocumentConversionInput(
+            path_or_stream_iterator=[source], limits=limits
+        )
+
+        defer_backend = self._get_conversion_cache() is not None
+
+        for in_doc in conv_input.docs(
+            self.format_to_options, defer_backend=defer_backend
+        ):
+            assert in_doc.format in self.allowed_formats
+            pipeline_cls = self.format_to_options[in_doc.format].pipeline_cls
+
+            conv_res_iter: Iterable[ConversionResult]
+            if in_doc.valid and issubclass(pipeline_cls, PaginatedPipeline):
+                in_doc.load_backend()
+                pipeline = self._get_pipeline(in_doc.format)
+                assert isinstance(pipeline, PaginatedPipeline)
+                conv_res_iter = pipeline.execute_pages(
+                    in_doc, raises_on_error=raises_on_error
+                )
+            else:
+                conv_res = self._process_document(
+                    in_doc, raises_on_error=raises_on_error
+                )
+                conv_res_iter = [conv_res] if conv_res is not None else []
+
+            for conv_res in conv_res_iter:
+                if raises_on_error and conv_res.status not in {
+                    ConversionStatus.SUCCESS,
+                    ConversionStatus.PARTIAL_SUCCESS,
+                }:
+                    raise RuntimeError(
+                        f"Conversion failed for: {conv_res.input.file} with status: {conv_res.status}"
+                    )
+                yield conv_res
+
     def _convert(
         self, conv_input: _DocumentConversionInput, raises_on_error: bool
     ) -> Iterator[ConversionResult]:
         assert self.format_to_options is not None
 
+        if settings.perf.doc_batch_concurrency > 1:
+            yield from self._convert_in_process_pool(
+                conv_input, raises_on_error=raises_on_error
+            )
+            return
+
         start_time = time.monotonic()
 
+        # With a conversion cache, backends are only loaded for the cache misses.
+        defer_backend = self._get_conversion_cache() is not None
+
+        in_docs = conv_input.docs(self.format_to_options, defer_backend=defer_backend)
+        if settings.perf.doc_prefetch > 0:
+            in_docs = _prefetch(in_docs, settings.perf.doc_prefetch, _unload_input_doc)
+
         for input_batch in chunkify(
-            conv_input.docs(self.format_to_options),
+            in_docs,
             settings.perf.doc_batch_size,  # pass format_options
         ):
             _log.info(f"Going to convert document batch...")
 
-            # parallel processing only within input_batch
-            # with ThreadPoolExecutor(
-            #    max_workers=settings.perf.doc_batch_concurrency
-            # ) as pool:
-            #   yield from pool.map(self.process_document, input_batch)
-            # Note: PDF backends are not thread-safe, thread pool usage was disabled.
+            # Note: PDF backends are not thread-safe, parallel processing is done
+            # in worker processes instead, see _convert_in_process_pool().
 
             for item in map(
                 partial(self._process_document, raises_on_error=raises_on_error),
@@ -223,6 +334,89 @@ class DocumentConverter:
                 else:
                     _log.info(f"Skipped a document. We lost {elapsed:.2f} sec.")
 
+    def _convert_in_process_pool(
+        self, conv_input: _DocumentConversionInput, raises_on_error: bool
+    ) -> Iterator[ConversionResult]:
+        # Each spawned worker process builds its own DocumentConverter, hence owns
+        # its pipelines, backends and models. Forked workers (doc_batch_prefork)
+        # share this converter and its models instead. Only the input sources are
+        # sent to the workers and the (backend-free) conversion results sent back.
+        num_workers = settings.perf.doc_batch_concurrency
+        max_in_flight = num_workers * settings.perf.doc_batch_size
+
+        if settings.perf.doc_batch_prefork:
+            if "fork" not in multiprocessing.get_all_start_methods():
+                raise RuntimeError(
+                    "doc_batch_prefork requires the fork start method, which is not available on this platform."
+                )
+
+            # Forked workers inherit this converter with its loaded models instead.
+            assert self.allowed_formats is not None
+            for doc_format in self.allowed_formats:
+                pipeline = self._get_pipeline(doc_format)
+                if pipeline is not None:
+                    pipeline.load_models()
+
+            pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_forked_worker_converter,
+                initargs=(self,),
+            )
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_converter,
+                initargs=(
+                    self.allowed_formats,
+                    self.format_to_options,
+                    settings.perf.model_dump(),
+                    settings.debug.model_dump(),
+                    settings.cache.model_dump(),
+                ),
+            )
+
+        # URL sources are downloaded here, like for the sequential conversion, and
+        # sent to the workers as streams.
+        sources: Iterable[Path | DocumentStream] = conv_input.sources()
+        if settings.perf.doc_prefetch > 0:
+            sources = _prefetch(sources, settings.perf.doc_prefetch)
+
+        try:
+            submit = partial(
+                pool.submit,
+                _convert_in_worker,
+                limits=conv_input.limits,
+                raises_on_error=raises_on_error,
+            )
+
+            if settings.perf.doc_batch_ordered:
+                ordered: Deque[Future] = deque()
+                for item in sources:
+                    ordered.append(submit(item))
+                    if len(ordered) >= max_in_flight:
+                        yield from ordered.popleft().result()
+                while ordered:
+                    yield from ordered.popleft().result()
+
+            else:
+                in_flight: Set[Future] = set()
+                for item in sources:
+                    in_flight.add(submit(item))
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+
+        finally:
+            # Don't convert the queued documents when the results are not consumed.
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         assert self.format_to_options is not None
 
@@ -246,14 +440,45 @@ class DocumentConverter:
             )
         return self.initialized_pipelines[pipeline_class]
 
+    def _get_conversion_cache(self) -> Optional[ConversionResultCache]:
+        if settings.cache.cache_dir is None or settings.cache.doc_cache_max_size <= 0:
+            return None
+
+        cache_dir = Path(settings.cache.cache_dir) / "documents"
+        if (
+            self._conversion_cache is None
+            or self._conversion_cache.cache_dir != cache_dir
+        ):
+            self._conversion_cache = ConversionResultCache(
+                cache_dir, max_size=settings.cache.doc_cache_max_size
+            )
+        self._conversion_cache.max_size = settings.cache.doc_cache_max_size
+
+        return self._conversion_cache
+
     def _process_document(
         self, in_doc: InputDocument, raises_on_error: bool
     ) -> Optional[ConversionResult]:
         assert self.allowed_formats is not None
+        assert self.format_to_options is not None
         assert in_doc.format in self.allowed_formats
 
+        fopt = self.format_to_options[in_doc.format]
+        cache = self._get_conversion_cache()
+
+        if cache is not None and in_doc.valid:
+            conv_res = cache.get_result(in_doc, fopt)
+            if conv_res is not None:
+                _log.info(f"Loaded document {in_doc.file.name} from the cache.")
+                in_doc.release()
+                return conv_res
+
+        in_doc.load_backend()
         conv_res = self._execute_pipeline(in_doc, raises_on_error=raises_on_error)
 
+        if cache is not None:
+            cache.put_result(conv_res, fopt)
+
         return conv_res
 
     def _execute_pipeline(
@@ -284,3 +509,130 @@ class DocumentConverter:
                 # TODO add error log why it failed.
 
         return conv_res
+
+
+# Converter owned by a worker process of DocumentConverter._convert_in_process_pool
+_worker_converter: Optional[DocumentConverter] = None
+
+
+def _init_worker_converter(
+    allowed_formats: List[InputFormat],
+    format_options: Dict[InputFormat, FormatOption],
+    perf_settings: Dict[str, Any],
+    debug_settings: Dict[str, Any],
+    cache_settings: Dict[str, Any],
+) -> None:
+    global _worker_converter
+
+    # Spawned workers start from the default settings, carry over the parent ones.
+    # Documents are processed sequentially inside each worker, one per task.
+    settings.perf = BatchConcurrencySettings.model_validate(
+        {**perf_settings, "doc_batch_concurrency": 1, "doc_prefetch": 0}
+    )
+    settings.debug = DebugSettings.model_validate(debug_settings)
+    settings.cache = CacheSettings.model_validate(cache_settings)
+
+    _worker_converter = DocumentConverter(
+        allowed_formats=allowed_formats, format_options=format_options
+    )
+
+
+def _init_forked_worker_converter(converter: DocumentConverter) -> None:
+    global _worker_converter
+
+    # Forked workers inherit the settings, only switch to sequential processing.
+    settings.perf = settings.perf.model_copy(
+        update={"doc_batch_concurrency": 1, "doc_prefetch": 0}
+    )
+
+    _worker_converter = converter
+
+
+def _convert_in_worker(
+    source: Path | str | DocumentStream,
+    limits: Optional[DocumentLimits],
+    raises_on_error: bool,
+) -> List[ConversionResult]:
+    assert _worker_converter is not None
+
+    conv_input = _DocumentConversionInput(
+        path_or_stream_iterator=[source], limits=limits
+    )
+
+    results = []
+    for conv_res in _worker_converter._convert(
+        conv_input, raises_on_error=raises_on_error
+    ):
+        # Backends hold native parser and pdfium handles, which can't be sent
+        # back to the parent process.
+        conv_res.input._backend = None  # type: ignore[assignment]
+        for page in conv_res.pages:
+            page._backend = None
+        results.append(conv_res)
+
+    return results
+
+
+def _unload_input_doc(in_doc: InputDocument) -> None:
+    in_doc.release()
+    backend = getattr(in_doc, "_backend", None)  # unset for deferred backends
+    if backend is not None:
+        backend.unload()
+
+
+def _prefetch(
+    items: Iterable[_T],
+    lookahead: int,
+    release: Optional[Callable[[_T], None]] = None,
+) -> Iterator[_T]:
+    # Open the next input documents (or fetch the next sources) in a background
+    # thread, while the current one converts. Up to lookahead items wait in the
+    # queue, the ones which are not consumed are passed to release.
+    prepared: queue.Queue = queue.Queue(maxsize=lookahead)
+    aborted = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(item: Any) -> bool:
+        while not aborted.is_set():
+            try:
+                prepared.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def run_prefetch():
+        try:
+            for item in items:
+                if not put(item):
+                    if release is not None:
+                        release(item)
+                    break
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            put(_PREFETCH_END)
+
+    thread = threading.Thread(
+        target=run_prefetch, name="docling-doc-prefetch", daemon=True
+    )
+    thread.start()
+
+    try:
+        while (item := prepared.get()) is not _PREFETCH_END:
+            yield item
+    finally:
+        # Stop the prefetch if the documents are not consumed until the end, and
+        # release the ones which were opened already.
+        aborted.set()
+        thread.join()
+        while True:
+            try:
+                item = prepared.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _PREFETCH_END and release is not None:
+                release(item)
+
+    if errors:
+        raise errors[0]
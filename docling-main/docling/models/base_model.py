@@ -14,6 +14,11 @@ class BasePageModel(ABC):
     ) -> Iterable[Page]:
         pass
 
+    def on_page_restored(self, conv_res: ConversionResult, page: Page) -> None:
+        # Called instead of the model for the pages whose output of the model is
+        # restored from the page cache.
+        pass
+
 
 class BaseEnrichmentModel(ABC):
 
@@ -1,28 +1,155 @@
 import copy
+import json
 import logging
+import math
 from abc import abstractmethod
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 from docling_core.types.doc import BoundingBox, CoordOrigin
 from PIL import Image, ImageDraw
 from rtree import index
-from scipy.ndimage import find_objects, label
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import OcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
+from docling.utils.cache import OcrCache, get_docling_version
+from docling.utils.profiling import TimeRecorder, count_event
 
 _log = logging.getLogger(__name__)
 
 
+def _bitmap_components(
+    boxes: np.ndarray, width: int, height: int
+) -> Tuple[int, np.ndarray]:
+    # Geometric equivalent of drawing the inclusive pixel boxes [x0, y0, x1, y1] on
+    # a width x height binary image and labeling its 4-connected components.
+    # Returns the number of set pixels and the bounding boxes of the components,
+    # in the raster order of their first pixel.
+    boxes = boxes.reshape(-1, 4)
+    boxes = np.stack(
+        [
+            np.maximum(np.minimum(boxes[:, 0], boxes[:, 2]), 0),
+            np.maximum(np.minimum(boxes[:, 1], boxes[:, 3]), 0),
+            np.minimum(np.maximum(boxes[:, 0], boxes[:, 2]), width - 1),
+            np.minimum(np.maximum(boxes[:, 1], boxes[:, 3]), height - 1),
+        ],
+        axis=1,
+    )
+    boxes = boxes[(boxes[:, 0] <= boxes[:, 2]) & (boxes[:, 1] <= boxes[:, 3])]
+    if len(boxes) == 0:
+        return 0, np.zeros((0, 4), dtype=np.int64)
+
+    x0, y0, x1, y1 = boxes.T
+
+    # Area of the union, on the grid of the half-open box edges
+    xs = np.unique(np.concatenate([x0, x1 + 1]))
+    ys = np.unique(np.concatenate([y0, y1 + 1]))
+    if len(xs) * len(ys) < width * height:
+        ix0, ix1 = np.searchsorted(xs, x0), np.searchsorted(xs, x1 + 1)
+        iy0, iy1 = np.searchsorted(ys, y0), np.searchsorted(ys, y1 + 1)
+        counts = np.zeros((len(ys), len(xs)), dtype=np.int64)
+        np.add.at(counts, (iy0, ix0), 1)
+        np.add.at(counts, (iy0, ix1), -1)
+        np.add.at(counts, (iy1, ix0), -1)
+        np.add.at(counts, (iy1, ix1), 1)
+        covered = counts.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] > 0
+        covered_pixels = int(np.outer(np.diff(ys), np.diff(xs))[covered].sum())
+    else:  # so many boxes that the page bitmap is smaller than the grid
+        mask = np.zeros((height, width), dtype=bool)
+        for bx0, by0, bx1, by1 in boxes.tolist():
+            mask[by0 : by1 + 1, bx0 : bx1 + 1] = True
+        covered_pixels = int(mask.sum())
+
+    parents = list(range(len(boxes)))
+
+    def find(ix):
+        while parents[ix] != ix:
+            parents[ix] = parents[parents[ix]]
+            ix = parents[ix]
+        return ix
+
+    # Boxes are 4-connected if they overlap in one axis and overlap or touch in
+    # the other one. The pairs are compared in chunks to bound the memory.
+    chunk_size = 1024
+    for start in range(0, len(boxes), chunk_size):
+        cx0, cy0, cx1, cy1 = (v[:, None] for v in boxes[start : start + chunk_size].T)
+        x_overlap = (cx0 <= x1) & (x0 <= cx1)
+        y_overlap = (cy0 <= y1) & (y0 <= cy1)
+        x_touch = (cx0 <= x1 + 1) & (x0 <= cx1 + 1)
+        y_touch = (cy0 <= y1 + 1) & (y0 <= cy1 + 1)
+        connected = (x_overlap & y_touch) | (x_touch & y_overlap)
+
+        for ix, jx in zip(*np.nonzero(connected)):
+            root_i, root_j = find(start + int(ix)), find(int(jx))
+            if root_i != root_j:
+                parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    roots = np.array([find(ix) for ix in range(len(boxes))])
+    components = []
+    for root in np.unique(roots):
+        members = boxes[roots == root]
+        first_pixel = min(zip(members[:, 1].tolist(), members[:, 0].tolist()))
+        components.append(
+            (
+                first_pixel,
+                [
+                    members[:, 0].min(),
+                    members[:, 1].min(),
+                    members[:, 2].max(),
+                    members[:, 3].max(),
+                ],
+            )
+        )
+    components.sort(key=lambda c: c[0])
+
+    return covered_pixels, np.array(
+        [box for _, box in components], dtype=np.int64
+    ).reshape(-1, 4)
+
+
+def _estimate_text_height(
+    image: Optional[np.ndarray], num_strips: int = 4
+) -> Optional[float]:
+    # Median height in pixels of the text lines of an image, from the runs of
+    # rows holding ink in vertical strips, such that lines of side by side
+    # columns are not merged. None if no text lines are found.
+    if image is None or image.size == 0:
+        return None
+    gray = image.mean(axis=2) if image.ndim == 3 else image.astype(np.float64)
+
+    low, high = np.percentile(gray, [5, 95])
+    if high - low < 32:  # blank or uniform region
+        return None
+    ink = gray < (low + high) / 2
+
+    heights: List[int] = []
+    for strip in np.array_split(ink, num_strips, axis=1):
+        if strip.shape[1] == 0:
+            continue
+        rows = np.concatenate([[False], strip.any(axis=1), [False]])
+        edges = np.flatnonzero(rows[1:] != rows[:-1])
+        run_heights = edges[1::2] - edges[::2]
+        heights.extend(h for h in run_heights.tolist() if h >= 3)
+
+    if len(heights) == 0:
+        return None
+    return float(np.median(heights))
+
+
 class BaseOcrModel(BasePageModel):
     def __init__(self, enabled: bool, options: OcrOptions):
         self.enabled = enabled
         self.options = options
+        self.scale: float = 1.0  # page image scale for OCR, set by the engines
+        # Height of the text lines in pixels at which the engine works best, used
+        # with the adaptive scale.
+        self.optimal_text_height: float = 32.0
+        self.max_confidence: float = 1.0  # confidence of a certain OCR cell
+        self._ocr_cache: Optional[OcrCache] = None
 
     # Computes the optimum amount and coordinates of rectangles to OCR on a given page
     def get_ocr_rects(self, page: Page) -> List[BoundingBox]:
@@ -30,61 +157,54 @@ class BaseOcrModel(BasePageModel):
         assert page.size is not None
 
         def find_ocr_rects(size, bitmap_rects):
-            image = Image.new(
-                "1", (round(size.width), round(size.height))
-            )  # '1' mode is binary
-
-            # Draw all bitmap rects into a binary image
-            draw = ImageDraw.Draw(image)
-            for rect in bitmap_rects:
-                x0, y0, x1, y1 = rect.as_tuple()
-                x0, y0, x1, y1 = round(x0), round(y0), round(x1), round(y1)
-                draw.rectangle([(x0, y0), (x1, y1)], fill=1)
-
-            np_image = np.array(image)
-
-            # Find the connected components
-            labeled_image, num_features = label(
-                np_image > 0
-            )  # Label black (0 value) regions
+            # Pixel boxes of the bitmaps, as they would be drawn on a page bitmap
+            pixel_boxes = np.array(
+                [[round(v) for v in rect.as_tuple()] for rect in bitmap_rects],
+                dtype=np.int64,
+            ).reshape(-1, 4)
+            covered_pixels, components = _bitmap_components(
+                pixel_boxes, round(size.width), round(size.height)
+            )
 
             # Find enclosing bounding boxes for each connected component.
-            slices = find_objects(labeled_image)
             bounding_boxes = [
                 BoundingBox(
-                    l=slc[1].start,
-                    t=slc[0].start,
-                    r=slc[1].stop - 1,
-                    b=slc[0].stop - 1,
+                    l=x0,
+                    t=y0,
+                    r=x1,
+                    b=y1,
                     coord_origin=CoordOrigin.TOPLEFT,
                 )
-                for slc in slices
+                for x0, y0, x1, y1 in components.tolist()
             ]
 
             # Compute area fraction on page covered by bitmaps
-            area_frac = np.sum(np_image > 0) / (size.width * size.height)
+            area_frac = covered_pixels / (size.width * size.height)
 
             return (area_frac, bounding_boxes)  # fraction covered  # boxes
 
+        full_page_rect = BoundingBox(
+            l=0,
+            t=0,
+            r=page.size.width,
+            b=page.size.height,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+        if self.options.force_full_page_ocr:
+            return [full_page_rect]
+
         if page._backend is not None:
-            bitmap_rects = page._backend.get_bitmap_rects()
+            bitmap_rects = list(page._backend.get_bitmap_rects())
         else:
             bitmap_rects = []
+        if len(bitmap_rects) == 0:
+            # Born-digital page without bitmaps, nothing to OCR.
+            return []
         coverage, ocr_rects = find_ocr_rects(page.size, bitmap_rects)
 
         # return full-page rectangle if sufficiently covered with bitmaps
-        if self.options.force_full_page_ocr or coverage > max(
-            BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold
-        ):
-            return [
-                BoundingBox(
-                    l=0,
-                    t=0,
-                    r=page.size.width,
-                    b=page.size.height,
-                    coord_origin=CoordOrigin.TOPLEFT,
-                )
-            ]
+        if coverage > max(BITMAP_COVERAGE_TRESHOLD, self.options.bitmap_area_threshold):
+            return [full_page_rect]
         # return individual rectangles if the bitmap coverage is smaller
         else:  # coverage <= BITMAP_COVERAGE_TRESHOLD:
 
@@ -97,6 +217,171 @@ class BaseOcrModel(BasePageModel):
             ]
             return ocr_rects
 
+    # OCR of the region image of a page rendered at the scale, the cells have page
+    # coordinates.
+    @abstractmethod
+    def _ocr_region(
+        self, image: Union[Image.Image, np.ndarray], ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        pass
+
+    # OCR of several region images, engines may override it to batch the regions.
+    def _ocr_regions(
+        self,
+        images: List[Union[Image.Image, np.ndarray]],
+        ocr_rects: List[BoundingBox],
+        scales: List[float],
+    ) -> List[List[OcrCell]]:
+        return [
+            self._ocr_region(image, ocr_rect, scale)
+            for image, ocr_rect, scale in zip(images, ocr_rects, scales)
+        ]
+
+    # OCR of a page region, through the OCR cache if it is enabled.
+    def ocr_region(
+        self,
+        image: Union[Image.Image, np.ndarray],
+        ocr_rect: BoundingBox,
+        scale: Optional[float] = None,
+    ) -> List[OcrCell]:
+        return self.ocr_regions(
+            [image], [ocr_rect], None if scale is None else [scale]
+        )[0]
+
+    # OCR of page regions, only the regions missing in the OCR cache are recognized.
+    # The images are rendered at the given scales, by default at the engine scale.
+    def ocr_regions(
+        self,
+        images: List[Union[Image.Image, np.ndarray]],
+        ocr_rects: List[BoundingBox],
+        scales: Optional[List[float]] = None,
+    ) -> List[List[OcrCell]]:
+        if scales is None:
+            scales = [self.scale] * len(images)
+
+        ocr_cache = self._get_ocr_cache()
+        if ocr_cache is None:
+            return self._ocr_regions(images, ocr_rects, scales)
+
+        fingerprints = [self._get_ocr_fingerprint(scale) for scale in scales]
+        results = [
+            ocr_cache.get_cells(image, fingerprint, ocr_rect)
+            for image, fingerprint, ocr_rect in zip(images, fingerprints, ocr_rects)
+        ]
+        missing = [ix for ix, cells in enumerate(results) if cells is None]
+        if missing:
+            missing_results = self._ocr_regions(
+                [images[ix] for ix in missing],
+                [ocr_rects[ix] for ix in missing],
+                [scales[ix] for ix in missing],
+            )
+            for ix, cells in zip(missing, missing_results):
+                ocr_cache.put_cells(images[ix], fingerprints[ix], ocr_rects[ix], cells)
+                results[ix] = cells
+
+        return results  # type: ignore
+
+    # Image of a page region in the format taken by the engine.
+    def _get_region_image(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> Union[Image.Image, np.ndarray, None]:
+        return page.get_image(scale=scale, cropbox=ocr_rect)
+
+    # Drops the full page regions without confident text on a thumbnail, if enabled.
+    def skip_blank_regions(
+        self, conv_res: ConversionResult, page: Page, ocr_rects: List[BoundingBox]
+    ) -> List[BoundingBox]:
+        thumbnail_scale = self.options.thumbnail_scale
+        if thumbnail_scale is None:
+            return ocr_rects
+        assert page.size is not None
+
+        kept_rects = []
+        for ocr_rect in ocr_rects:
+            if (
+                ocr_rect.l > 0
+                or ocr_rect.t > 0
+                or ocr_rect.r < page.size.width
+                or ocr_rect.b < page.size.height
+            ):
+                kept_rects.append(ocr_rect)
+                continue
+
+            with TimeRecorder(conv_res, "ocr_thumbnail"):
+                image = self._get_region_image(page, ocr_rect, thumbnail_scale)
+                cells = (
+                    []
+                    if image is None
+                    else self.ocr_region(image, ocr_rect, thumbnail_scale)
+                )
+                page._release_image(thumbnail_scale)
+
+            if any(
+                cell.text.strip() != ""
+                and cell.confidence / self.max_confidence
+                >= self.options.thumbnail_confidence
+                for cell in cells
+            ):
+                kept_rects.append(ocr_rect)
+            else:
+                _log.debug(f"Skipping the OCR of the blank page {page.page_no}.")
+                count_event(conv_res, "ocr_thumbnail_skipped")
+
+        return kept_rects
+
+    # Scale at which a page region is rendered for OCR.
+    def get_region_scale(self, page: Page, ocr_rect: BoundingBox) -> float:
+        if not self.options.adaptive_scale:
+            return self.scale
+
+        # The text height is estimated on the page image at scale 1, which is
+        # rendered by the pre-processing anyway.
+        text_height = _estimate_text_height(
+            page.get_image_array(scale=1.0, cropbox=ocr_rect)
+        )
+        if text_height is None:
+            return self.scale
+
+        # Lowest scale, in steps of 0.5, which renders the text lines at least at
+        # the optimal height for the engine.
+        scale = math.ceil(2 * self.optimal_text_height / text_height) / 2
+        return min(self.scale, max(1.0, scale))
+
+    def _get_ocr_cache(self) -> Optional[OcrCache]:
+        if settings.cache.cache_dir is None or settings.cache.ocr_cache_max_size <= 0:
+            return None
+
+        cache_dir = Path(settings.cache.cache_dir) / "ocr"
+        if self._ocr_cache is None or self._ocr_cache.cache_dir != cache_dir:
+            self._ocr_cache = OcrCache(
+                cache_dir, max_size=settings.cache.ocr_cache_max_size
+            )
+        self._ocr_cache.max_size = settings.cache.ocr_cache_max_size
+
+        return self._ocr_cache
+
+    def _get_ocr_fingerprint(self, scale: float) -> str:
+        # Options deciding which regions are OCRed, or at which scale, do not
+        # change their results.
+        return json.dumps(
+            {
+                "docling_version": get_docling_version(),
+                "engine": type(self).__qualname__,
+                "scale": scale,
+                "options": self.options.model_dump(
+                    mode="json",
+                    exclude={
+                        "force_full_page_ocr",
+                        "bitmap_area_threshold",
+                        "adaptive_scale",
+                        "thumbnail_scale",
+                        "thumbnail_confidence",
+                    },
+                ),
+            },
+            sort_keys=True,
+        )
+
     # Filters OCR cells by dropping any OCR cell that intersects with an existing programmatic cell.
     def _filter_ocr_cells(self, ocr_cells, programmatic_cells):
         # Create R-tree index for programmatic cells
@@ -166,6 +451,59 @@ class BaseOcrModel(BasePageModel):
             out_file = out_path / f"ocr_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    # Recognizes the regions of several pages together, such that engines which
+    # batch the regions (see _ocr_regions) do so over all the pages.
+    def _process_pages(
+        self, conv_res: ConversionResult, pages: List[Page]
+    ) -> Iterable[Page]:
+        page_ocr_rects: Dict[int, List[BoundingBox]] = {}
+        images: List[Union[Image.Image, np.ndarray]] = []
+        ocr_rects: List[BoundingBox] = []
+        scales: List[float] = []
+        region_pages: List[int] = []
+
+        with TimeRecorder(conv_res, "ocr"):
+            for page_ix, page in enumerate(pages):
+                assert page._backend is not None
+                if not page._backend.is_valid():
+                    continue
+
+                page_ocr_rects[page_ix] = self.skip_blank_regions(
+                    conv_res, page, self.get_ocr_rects(page)
+                )
+                for ocr_rect in page_ocr_rects[page_ix]:
+                    # Skip zero area boxes
+                    if ocr_rect.area() == 0:
+                        continue
+                    scale = self.get_region_scale(page, ocr_rect)
+                    images.append(self._get_region_image(page, ocr_rect, scale))
+                    ocr_rects.append(ocr_rect)
+                    scales.append(scale)
+                    region_pages.append(page_ix)
+
+            all_ocr_cells: Dict[int, List[OcrCell]] = {
+                page_ix: [] for page_ix in page_ocr_rects
+            }
+            for page_ix, cells in zip(
+                region_pages, self.ocr_regions(images, ocr_rects, scales)
+            ):
+                all_ocr_cells[page_ix].extend(cells)
+
+            del images
+
+            # Post-process the cells
+            for page_ix, ocr_cells in all_ocr_cells.items():
+                pages[page_ix].cells = self.post_process_cells(
+                    ocr_cells, pages[page_ix].cells
+                )
+
+        for page_ix, page in enumerate(pages):
+            # DEBUG code:
+            if settings.debug.visualize_ocr and page_ix in page_ocr_rects:
+                self.draw_ocr_rects_and_cells(conv_res, page, page_ocr_rects[page_ix])
+
+            yield page
+
     @abstractmethod
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
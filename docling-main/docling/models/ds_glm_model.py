@@ -1,7 +1,7 @@
 import copy
 import random
 from pathlib import Path
-from typing import List, Union
+from typing import Any, List, Optional, Union
 
 from deepsearch_glm.nlp_utils import init_nlp_model
 from deepsearch_glm.utils.doc_utils import to_docling_document
@@ -42,10 +42,16 @@ class GlmOptions(BaseModel):
 class GlmModel:
     def __init__(self, options: GlmOptions):
         self.options = options
-
-        if self.options.model_names != "":
-            load_pretrained_nlp_models()
-        self.model = init_nlp_model(model_names=self.options.model_names)
+        self._model: Optional[Any] = None
+
+    @property
+    def model(self):
+        # The NLP models are loaded when the first document is assembled.
+        if self._model is None:
+            if self.options.model_names != "":
+                load_pretrained_nlp_models()
+            self._model = init_nlp_model(model_names=self.options.model_names)
+        return self._model
 
     def _to_legacy_document(self, conv_res) -> DsDocument:
         title = ""
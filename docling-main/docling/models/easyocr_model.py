@@ -1,8 +1,8 @@
+import importlib.util
 import logging
-from typing import Iterable
+from typing import Any, Iterable, List, Optional
 
 import numpy
-import torch
 from docling_core.types.doc import BoundingBox, CoordOrigin
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
@@ -22,21 +22,57 @@ class EasyOcrModel(BaseOcrModel):
 
         self.scale = 3  # multiplier for 72 dpi == 216 dpi.
 
+        self._reader: Optional[Any] = None
+
         if self.enabled:
-            try:
-                import easyocr
-            except ImportError:
+            # Only check the installation here, easyocr (and torch) is imported
+            # once the first page region needs OCR.
+            if importlib.util.find_spec("easyocr") is None:
                 raise ImportError(
                     "EasyOCR is not installed. Please install it via `pip install easyocr` to use this OCR engine. "
                     "Alternatively, Docling has support for other OCR engines. See the documentation."
                 )
 
-            self.reader = easyocr.Reader(
+    @property
+    def reader(self):
+        if self._reader is None:
+            import easyocr
+
+            self._reader = easyocr.Reader(
                 lang_list=self.options.lang,
                 gpu=self.options.use_gpu,
                 model_storage_directory=self.options.model_storage_directory,
                 download_enabled=self.options.download_enabled,
             )
+        return self._reader
+
+    def _get_region_image(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> Optional[numpy.ndarray]:
+        return page.get_image_array(scale=scale, cropbox=ocr_rect)
+
+    def _ocr_region(
+        self, image: numpy.ndarray, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        result = self.reader.readtext(image)
+
+        return [
+            OcrCell(
+                id=ix,
+                text=line[1],
+                confidence=line[2],
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        (line[0][0][0] / scale) + ocr_rect.l,
+                        (line[0][0][1] / scale) + ocr_rect.t,
+                        (line[0][2][0] / scale) + ocr_rect.l,
+                        (line[0][2][1] / scale) + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            for ix, line in enumerate(result)
+        ]
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -53,39 +89,21 @@ class EasyOcrModel(BaseOcrModel):
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    ocr_rects = self.get_ocr_rects(page)
+                    ocr_rects = self.skip_blank_regions(
+                        conv_res, page, self.get_ocr_rects(page)
+                    )
 
                     all_ocr_cells = []
                     for ocr_rect in ocr_rects:
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result = self.reader.readtext(im)
+                        scale = self.get_region_scale(page, ocr_rect)
+                        im = self._get_region_image(page, ocr_rect, scale)
+                        cells = self.ocr_region(im, ocr_rect, scale)
 
-                        del high_res_image
                         del im
 
-                        cells = [
-                            OcrCell(
-                                id=ix,
-                                text=line[1],
-                                confidence=line[2],
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (line[0][0][0] / self.scale) + ocr_rect.l,
-                                        (line[0][0][1] / self.scale) + ocr_rect.t,
-                                        (line[0][2][0] / self.scale) + ocr_rect.l,
-                                        (line[0][2][1] / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
-                                ),
-                            )
-                            for ix, line in enumerate(result)
-                        ]
                         all_ocr_cells.extend(cells)
 
                     # Post-process the cells
@@ -2,12 +2,13 @@ import copy
 import logging
 import random
 import time
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Iterable, List, Optional
 
+import numpy as np
 from docling_core.types.doc import CoordOrigin, DocItemLabel
-from docling_ibm_models.layoutmodel.layout_predictor import LayoutPredictor
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
 from docling.datamodel.base_models import (
     BoundingBox,
@@ -21,9 +22,55 @@ from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.utils import layout_utils as lu
 from docling.utils.profiling import TimeRecorder
+from docling.utils.utils import chunkify
+
+if TYPE_CHECKING:
+    from docling_ibm_models.layoutmodel.layout_predictor import LayoutPredictor
 
 _log = logging.getLogger(__name__)
 
+# LayoutPredictor internals used by LayoutModel._predict_batch.
+_PREDICTOR_INTERNALS = ("model", "_classes_map", "_black_classes", "_threshold")
+
+
+def _supports_batched_predict(predictor: "LayoutPredictor") -> bool:
+    # The batched prediction re-implements LayoutPredictor.predict() on top of
+    # its internals, which are only known for the 2.x releases.
+    try:
+        major = version("docling-ibm-models").split(".")[0]
+    except PackageNotFoundError:
+        return False
+    return major == "2" and all(
+        hasattr(predictor, name) for name in _PREDICTOR_INTERNALS
+    )
+
+
+def _cell_bboxes_bottom_left(cells: List[Cell], page_height: float) -> np.ndarray:
+    # Same as [c.bbox.to_bottom_left_origin(page_height).as_tuple() for c in cells]
+    coords = np.array(
+        [(c.bbox.l, c.bbox.t, c.bbox.r, c.bbox.b) for c in cells], dtype=np.float64
+    ).reshape(-1, 4)
+    is_top_left = np.array(
+        [c.bbox.coord_origin == CoordOrigin.TOPLEFT for c in cells], dtype=bool
+    )
+    l, t, r, b = coords.T
+    return np.where(
+        is_top_left[:, None],
+        np.stack([l, page_height - b, r, page_height - t], axis=1),
+        np.stack([l, b, r, t], axis=1),
+    )
+
+
+def _bboxes_to_top_left(bboxes: np.ndarray, page_height: float) -> np.ndarray:
+    # Same as BoundingBox.from_tuple(bbox, CoordOrigin.BOTTOMLEFT)
+    # .to_top_left_origin(page_height).as_tuple() for the rows of [l, b, r, t]
+    bboxes = bboxes.reshape(-1, 4)
+    l = np.minimum(bboxes[:, 0], bboxes[:, 2])
+    r = np.maximum(bboxes[:, 0], bboxes[:, 2])
+    b = np.minimum(bboxes[:, 1], bboxes[:, 3])
+    t = np.maximum(bboxes[:, 1], bboxes[:, 3])
+    return np.stack([l, page_height - t, r, page_height - b], axis=1)
+
 
 class LayoutModel(BasePageModel):
 
@@ -47,7 +94,20 @@ class LayoutModel(BasePageModel):
     FORMULA_LABEL = DocItemLabel.FORMULA
 
     def __init__(self, artifacts_path: Path):
-        self.layout_predictor = LayoutPredictor(artifacts_path)  # TODO temporary
+        self.artifacts_path = artifacts_path
+        self._layout_predictor: Optional["LayoutPredictor"] = None
+        self._batched_predict: Optional[bool] = None  # Resolved with the predictor
+
+    @property
+    def layout_predictor(self) -> "LayoutPredictor":
+        # Loaded on first use, importing torch only when a page is processed.
+        if self._layout_predictor is None:
+            from docling_ibm_models.layoutmodel.layout_predictor import LayoutPredictor
+
+            self._layout_predictor = LayoutPredictor(
+                self.artifacts_path
+            )  # TODO temporary
+        return self._layout_predictor
 
     def postprocess(self, clusters_in: List[Cluster], cells: List[Cell], page_height):
         MIN_INTERSECTION = 0.2
@@ -122,15 +182,15 @@ class LayoutModel(BasePageModel):
 
         del clusters_mod
 
+        # Cell coordinates as a (n, 4) array of [l, b, r, t] with bottom left origin
+        cell_bboxes = _cell_bboxes_bottom_left(cells, page_height)
         raw_cells = [
             {
                 "id": c.id,
-                "bbox": list(
-                    c.bbox.to_bottom_left_origin(page_height).as_tuple()
-                ),  # TODO
+                "bbox": bbox,
                 "text": c.text,
             }
-            for c in cells
+            for c, bbox in zip(cells, cell_bboxes.tolist())
         ]
         cell_count = len(raw_cells)
 
@@ -243,23 +303,31 @@ class LayoutModel(BasePageModel):
         end_time = time.time() - start_time
         _log.debug(f"Finished post processing in seconds={end_time:.3f}")
 
+        # The pydantic objects are only built for the output, from the coordinates array
         cells_out_new = [
-            Cell(
-                id=c["id"],  # type: ignore
-                bbox=BoundingBox.from_tuple(
-                    coord=c["bbox"], origin=CoordOrigin.BOTTOMLEFT  # type: ignore
-                ).to_top_left_origin(page_height),
-                text=c["text"],  # type: ignore
+            Cell.model_construct(
+                id=c["id"],
+                bbox=BoundingBox.model_construct(
+                    l=l, t=t, r=r, b=b, coord_origin=CoordOrigin.TOPLEFT
+                ),
+                text=c["text"],
+            )
+            for c, (l, t, r, b) in zip(
+                cells_out,
+                _bboxes_to_top_left(
+                    np.array([c["bbox"] for c in cells_out], dtype=np.float64),
+                    page_height,
+                ).tolist(),
             )
-            for c in cells_out
         ]
 
         del cells_out
 
         clusters_out_new = []
         for c in clusters_out:
+            cluster_cell_ids = set(c["cell_ids"])
             cluster_cells = [
-                ccell for ccell in cells_out_new if ccell.id in c["cell_ids"]  # type: ignore
+                ccell for ccell in cells_out_new if ccell.id in cluster_cell_ids
             ]
             c_new = Cluster(
                 id=c["id"],  # type: ignore
@@ -274,97 +342,163 @@ class LayoutModel(BasePageModel):
 
         return clusters_out_new, cells_out_new
 
+    def _predict_batch(self, images: List[Image.Image]) -> List[List[dict]]:
+        """Run one forward pass of the layout model over a batch of page images.
+
+        Mirrors LayoutPredictor.predict(), which only accepts a single image.
+        """
+        import torch
+        import torchvision.transforms as T
+
+        predictor = self.layout_predictor
+
+        page_imgs = [img.convert("RGB") for img in images]
+        orig_sizes = torch.tensor([img.size for img in page_imgs])
+        transforms = T.Compose(
+            [
+                T.Resize((640, 640)),
+                T.ToTensor(),
+            ]
+        )
+        img_batch = torch.stack([transforms(img) for img in page_imgs])
+
+        with torch.no_grad():
+            labels, boxes, scores = predictor.model(img_batch, orig_sizes)
+
+        batch_predictions = []
+        for (w, h), img_labels, img_boxes, img_scores in zip(
+            orig_sizes.tolist(), labels, boxes, scores
+        ):
+            predictions = []
+            for label_idx, box, score in zip(img_labels, img_boxes, img_scores):
+                label = predictor._classes_map[int(label_idx.item()) + 1]
+                confidence = float(score.item())
+                if label in predictor._black_classes:
+                    continue
+                if confidence > predictor._threshold:
+                    predictions.append(
+                        {
+                            "l": min(w, max(0, box[0])),
+                            "t": min(h, max(0, box[1])),
+                            "r": min(w, max(0, box[2])),
+                            "b": min(h, max(0, box[3])),
+                            "label": label,
+                            "confidence": confidence,
+                        }
+                    )
+            batch_predictions.append(predictions)
+
+        return batch_predictions
+
+    def _predict_pages(self, pages: List[Page]) -> List[List[dict]]:
+        images = [page.get_image(scale=1.0) for page in pages]
+
+        if self._batched_predict is None:
+            self._batched_predict = _supports_batched_predict(self.layout_predictor)
+            if not self._batched_predict:
+                _log.info(
+                    "Batched layout inference is not supported by the installed "
+                    "docling-ibm-models, predicting one page at a time."
+                )
+
+        if self._batched_predict and len(images) > 1:
+            try:
+                return self._predict_batch(images)
+            except RuntimeError:
+                # E.g. out of memory, only this batch is predicted page by page.
+                _log.warning(
+                    "Batched layout inference failed, falling back to one page "
+                    "at a time for this batch.",
+                    exc_info=True,
+                )
+
+        return [list(self.layout_predictor.predict(image)) for image in images]
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "layout"):
-                    assert page.size is not None
-
-                    clusters = []
-                    for ix, pred_item in enumerate(
-                        self.layout_predictor.predict(page.get_image(scale=1.0))
-                    ):
-                        label = DocItemLabel(
-                            pred_item["label"]
-                            .lower()
-                            .replace(" ", "_")
-                            .replace("-", "_")
-                        )  # Temporary, until docling-ibm-model uses docling-core types
-                        cluster = Cluster(
-                            id=ix,
-                            label=label,
-                            confidence=pred_item["confidence"],
-                            bbox=BoundingBox.model_validate(pred_item),
-                            cells=[],
+        for pages in chunkify(page_batch, settings.perf.page_batch_size):
+            valid_pages = []
+            for page in pages:
+                assert page._backend is not None
+                if page._backend.is_valid():
+                    valid_pages.append(page)
+
+            # Single forward pass for all the valid pages of the batch
+            with TimeRecorder(conv_res, "layout"):
+                batch_predictions = self._predict_pages(valid_pages)
+            page_predictions = dict(zip(map(id, valid_pages), batch_predictions))
+
+            for page in pages:
+                if id(page) not in page_predictions:
+                    yield page
+                else:
+                    self._postprocess_page(conv_res, page, page_predictions[id(page)])
+                    page._release_image(1.0)
+                    yield page
+
+    def _postprocess_page(
+        self, conv_res: ConversionResult, page: Page, pred_items: List[dict]
+    ):
+        with TimeRecorder(conv_res, "layout_postprocess"):
+            assert page.size is not None
+
+            clusters = []
+            for ix, pred_item in enumerate(pred_items):
+                label = DocItemLabel(
+                    pred_item["label"].lower().replace(" ", "_").replace("-", "_")
+                )  # Temporary, until docling-ibm-model uses docling-core types
+                cluster = Cluster(
+                    id=ix,
+                    label=label,
+                    confidence=pred_item["confidence"],
+                    bbox=BoundingBox.model_validate(pred_item),
+                    cells=[],
+                )
+                clusters.append(cluster)
+
+            # The cells are mapped to the clusters in postprocess.
+
+            # Pre-sort clusters
+            # clusters = self.sort_clusters_by_cell_order(clusters)
+
+            # DEBUG code:
+            def draw_clusters_and_cells(show: bool = False):
+                image = copy.deepcopy(page.image)
+                if image is not None:
+                    draw = ImageDraw.Draw(image)
+                    for c in clusters:
+                        x0, y0, x1, y1 = c.bbox.as_tuple()
+                        draw.rectangle([(x0, y0), (x1, y1)], outline="green")
+
+                        cell_color = (
+                            random.randint(30, 140),
+                            random.randint(30, 140),
+                            random.randint(30, 140),
                         )
-                        clusters.append(cluster)
-
-                    # Map cells to clusters
-                    # TODO: Remove, postprocess should take care of it anyway.
-                    for cell in page.cells:
-                        for cluster in clusters:
-                            if not cell.bbox.area() > 0:
-                                overlap_frac = 0.0
-                            else:
-                                overlap_frac = (
-                                    cell.bbox.intersection_area_with(cluster.bbox)
-                                    / cell.bbox.area()
-                                )
-
-                            if overlap_frac > 0.5:
-                                cluster.cells.append(cell)
-
-                    # Pre-sort clusters
-                    # clusters = self.sort_clusters_by_cell_order(clusters)
-
-                    # DEBUG code:
-                    def draw_clusters_and_cells(show: bool = False):
-                        image = copy.deepcopy(page.image)
-                        if image is not None:
-                            draw = ImageDraw.Draw(image)
-                            for c in clusters:
-                                x0, y0, x1, y1 = c.bbox.as_tuple()
-                                draw.rectangle([(x0, y0), (x1, y1)], outline="green")
-
-                                cell_color = (
-                                    random.randint(30, 140),
-                                    random.randint(30, 140),
-                                    random.randint(30, 140),
-                                )
-                                for tc in c.cells:  # [:1]:
-                                    x0, y0, x1, y1 = tc.bbox.as_tuple()
-                                    draw.rectangle(
-                                        [(x0, y0), (x1, y1)], outline=cell_color
-                                    )
-                            if show:
-                                image.show()
-                            else:
-                                out_path: Path = (
-                                    Path(settings.debug.debug_output_path)
-                                    / f"debug_{conv_res.input.file.stem}"
-                                )
-                                out_path.mkdir(parents=True, exist_ok=True)
-
-                                out_file = (
-                                    out_path / f"layout_page_{page.page_no:05}.png"
-                                )
-                                image.save(str(out_file), format="png")
-
-                    # draw_clusters_and_cells()
-
-                    clusters, page.cells = self.postprocess(
-                        clusters, page.cells, page.size.height
-                    )
+                        for tc in c.cells:  # [:1]:
+                            x0, y0, x1, y1 = tc.bbox.as_tuple()
+                            draw.rectangle([(x0, y0), (x1, y1)], outline=cell_color)
+                    if show:
+                        image.show()
+                    else:
+                        out_path: Path = (
+                            Path(settings.debug.debug_output_path)
+                            / f"debug_{conv_res.input.file.stem}"
+                        )
+                        out_path.mkdir(parents=True, exist_ok=True)
 
-                    page.predictions.layout = LayoutPrediction(clusters=clusters)
+                        out_file = out_path / f"layout_page_{page.page_no:05}.png"
+                        image.save(str(out_file), format="png")
+
+            # draw_clusters_and_cells()
+
+            clusters, page.cells = self.postprocess(
+                clusters, page.cells, page.size.height
+            )
 
-                if settings.debug.visualize_layout:
-                    draw_clusters_and_cells()
+            page.predictions.layout = LayoutPrediction(clusters=clusters)
 
-                yield page
+        if settings.debug.visualize_layout:
+            draw_clusters_and_cells()
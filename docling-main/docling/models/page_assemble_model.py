@@ -164,11 +164,28 @@ class PageAssembleModel(BasePageModel):
                         elements=elements, headers=headers, body=body
                     )
 
-                    # Remove page images (can be disabled)
-                    if not self.options.keep_images:
-                        page._image_cache = {}
-
-                    # Unload backend
-                    page._backend.unload()
+                    self._release_page(page)
 
                 yield page
+
+    def on_page_restored(self, conv_res: ConversionResult, page: Page) -> None:
+        # Pages assembled from the page cache release their resources all the same.
+        self._release_page(page)
+
+    def _release_page(self, page: Page) -> None:
+        assert page._backend is not None
+
+        # Remove page images (can be disabled)
+        page._image_array_cache = {}
+        if not self.options.keep_images:
+            page._image_cache = {}
+        else:
+            # Only the default scale is used after assembling
+            page._image_cache = {
+                scale: image
+                for scale, image in page._image_cache.items()
+                if scale == page._default_image_scale
+            }
+
+        # Unload backend
+        page._backend.unload()
@@ -1,19 +1,19 @@
-import copy
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
-import numpy
 from docling_core.types.doc import BoundingBox, DocItemLabel, TableCell
-from docling_ibm_models.tableformer.data_management.tf_predictor import TFPredictor
 from PIL import ImageDraw
 
-from docling.datamodel.base_models import Page, Table, TableStructurePrediction
+from docling.datamodel.base_models import Cluster, Page, Table, TableStructurePrediction
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import TableFormerMode, TableStructureOptions
 from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.utils.profiling import TimeRecorder
 
+if TYPE_CHECKING:
+    from docling_ibm_models.tableformer.data_management.tf_predictor import TFPredictor
+
 
 class TableStructureModel(BasePageModel):
     def __init__(
@@ -28,15 +28,26 @@ class TableStructureModel(BasePageModel):
             if self.mode == TableFormerMode.ACCURATE:
                 artifacts_path = artifacts_path / "fat"
 
+            self.artifacts_path = artifacts_path
+            self._tf_predictor: Optional["TFPredictor"] = None
+            self.scale = 2.0  # Scale up table input images to 144 dpi
+
+    @property
+    def tf_predictor(self) -> "TFPredictor":
+        # Loaded on first use, i.e. only once a page with tables is found.
+        if self._tf_predictor is None:
             # Third Party
             import docling_ibm_models.tableformer.common as c
+            from docling_ibm_models.tableformer.data_management.tf_predictor import (
+                TFPredictor,
+            )
 
-            self.tm_config = c.read_config(f"{artifacts_path}/tm_config.json")
-            self.tm_config["model"]["save_dir"] = artifacts_path
+            self.tm_config = c.read_config(f"{self.artifacts_path}/tm_config.json")
+            self.tm_config["model"]["save_dir"] = self.artifacts_path
             self.tm_model_type = self.tm_config["model"]["type"]
 
-            self.tf_predictor = TFPredictor(self.tm_config)
-            self.scale = 2.0  # Scale up table input images to 144 dpi
+            self._tf_predictor = TFPredictor(self.tm_config)
+        return self._tf_predictor
 
     def draw_table_and_cells(
         self,
@@ -82,6 +93,94 @@ class TableStructureModel(BasePageModel):
             out_file = out_path / f"table_struct_page_{page.page_no:05}.png"
             image.save(str(out_file), format="png")
 
+    def _get_table_input(
+        self, page: Page
+    ) -> Optional[Tuple[dict, List[Cluster], List[List[float]]]]:
+        assert page.predictions.layout is not None
+        assert page.size is not None
+
+        in_tables = [
+            (
+                cluster,
+                [
+                    round(cluster.bbox.l) * self.scale,
+                    round(cluster.bbox.t) * self.scale,
+                    round(cluster.bbox.r) * self.scale,
+                    round(cluster.bbox.b) * self.scale,
+                ],
+            )
+            for cluster in page.predictions.layout.clusters
+            if cluster.label == DocItemLabel.TABLE
+        ]
+        if not len(in_tables):
+            return None
+
+        tokens = []
+        for c in page.cells:
+            for cluster, _ in in_tables:
+                if c.bbox.area() > 0:
+                    if (
+                        c.bbox.intersection_area_with(cluster.bbox) / c.bbox.area()
+                        > 0.2
+                    ):
+                        # Only allow non empty stings (spaces) into the cells of a table
+                        if len(c.text.strip()) > 0:
+                            new_cell = c.model_copy(
+                                update={"bbox": c.bbox.scaled(scale=self.scale)}
+                            )
+                            tokens.append(new_cell.model_dump())
+
+        page_input = {
+            "tokens": tokens,
+            "width": page.size.width * self.scale,
+            "height": page.size.height * self.scale,
+        }
+        page_input["image"] = page.get_image_array(scale=self.scale)
+
+        table_clusters, table_bboxes = zip(*in_tables)
+
+        return page_input, list(table_clusters), list(table_bboxes)
+
+    def _set_table_predictions(
+        self, page: Page, table_clusters: List[Cluster], tf_output: List[dict]
+    ):
+        assert page._backend is not None
+        assert page.predictions.tablestructure is not None
+
+        for table_cluster, table_out in zip(table_clusters, tf_output):
+            table_cells = []
+            for element in table_out["tf_responses"]:
+
+                if not self.do_cell_matching:
+                    the_bbox = BoundingBox.model_validate(element["bbox"]).scaled(
+                        1 / self.scale
+                    )
+                    text_piece = page._backend.get_text_in_rect(the_bbox)
+                    element["bbox"]["token"] = text_piece
+
+                tc = TableCell.model_validate(element)
+                if self.do_cell_matching and tc.bbox is not None:
+                    tc.bbox = tc.bbox.scaled(1 / self.scale)
+                table_cells.append(tc)
+
+            # Retrieving cols/rows, after post processing:
+            num_rows = table_out["predict_details"]["num_rows"]
+            num_cols = table_out["predict_details"]["num_cols"]
+            otsl_seq = table_out["predict_details"]["prediction"]["rs_seq"]
+
+            tbl = Table(
+                otsl_seq=otsl_seq,
+                table_cells=table_cells,
+                num_rows=num_rows,
+                num_cols=num_cols,
+                id=table_cluster.id,
+                page_no=page.page_no,
+                cluster=table_cluster,
+                label=DocItemLabel.TABLE,
+            )
+
+            page.predictions.tablestructure.table_map[table_cluster.id] = tbl
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -96,104 +195,23 @@ class TableStructureModel(BasePageModel):
                 yield page
             else:
                 with TimeRecorder(conv_res, "table_structure"):
-
-                    assert page.predictions.layout is not None
-                    assert page.size is not None
-
                     page.predictions.tablestructure = (
                         TableStructurePrediction()
                     )  # dummy
 
-                    in_tables = [
-                        (
-                            cluster,
-                            [
-                                round(cluster.bbox.l) * self.scale,
-                                round(cluster.bbox.t) * self.scale,
-                                round(cluster.bbox.r) * self.scale,
-                                round(cluster.bbox.b) * self.scale,
-                            ],
-                        )
-                        for cluster in page.predictions.layout.clusters
-                        if cluster.label == DocItemLabel.TABLE
-                    ]
-                    if not len(in_tables):
+                    table_input = self._get_table_input(page)
+                    if table_input is None:
                         yield page
                         continue
 
-                    tokens = []
-                    for c in page.cells:
-                        for cluster, _ in in_tables:
-                            if c.bbox.area() > 0:
-                                if (
-                                    c.bbox.intersection_area_with(cluster.bbox)
-                                    / c.bbox.area()
-                                    > 0.2
-                                ):
-                                    # Only allow non empty stings (spaces) into the cells of a table
-                                    if len(c.text.strip()) > 0:
-                                        new_cell = copy.deepcopy(c)
-                                        new_cell.bbox = new_cell.bbox.scaled(
-                                            scale=self.scale
-                                        )
-
-                                        tokens.append(new_cell.model_dump())
-
-                    page_input = {
-                        "tokens": tokens,
-                        "width": page.size.width * self.scale,
-                        "height": page.size.height * self.scale,
-                    }
-                    page_input["image"] = numpy.asarray(
-                        page.get_image(scale=self.scale)
+                    # TFPredictor takes the tables of a single page image, the
+                    # pages can't be predicted in one batched call.
+                    page_input, table_clusters, table_bboxes = table_input
+                    tf_output = self.tf_predictor.multi_table_predict(
+                        page_input, table_bboxes, do_matching=self.do_cell_matching
                     )
-
-                    table_clusters, table_bboxes = zip(*in_tables)
-
-                    if len(table_bboxes):
-                        tf_output = self.tf_predictor.multi_table_predict(
-                            page_input, table_bboxes, do_matching=self.do_cell_matching
-                        )
-
-                        for table_cluster, table_out in zip(table_clusters, tf_output):
-                            table_cells = []
-                            for element in table_out["tf_responses"]:
-
-                                if not self.do_cell_matching:
-                                    the_bbox = BoundingBox.model_validate(
-                                        element["bbox"]
-                                    ).scaled(1 / self.scale)
-                                    text_piece = page._backend.get_text_in_rect(
-                                        the_bbox
-                                    )
-                                    element["bbox"]["token"] = text_piece
-
-                                tc = TableCell.model_validate(element)
-                                if self.do_cell_matching and tc.bbox is not None:
-                                    tc.bbox = tc.bbox.scaled(1 / self.scale)
-                                table_cells.append(tc)
-
-                            # Retrieving cols/rows, after post processing:
-                            num_rows = table_out["predict_details"]["num_rows"]
-                            num_cols = table_out["predict_details"]["num_cols"]
-                            otsl_seq = table_out["predict_details"]["prediction"][
-                                "rs_seq"
-                            ]
-
-                            tbl = Table(
-                                otsl_seq=otsl_seq,
-                                table_cells=table_cells,
-                                num_rows=num_rows,
-                                num_cols=num_cols,
-                                id=table_cluster.id,
-                                page_no=page.page_no,
-                                cluster=table_cluster,
-                                label=DocItemLabel.TABLE,
-                            )
-
-                            page.predictions.tablestructure.table_map[
-                                table_cluster.id
-                            ] = tbl
+                    self._set_table_predictions(page, table_clusters, tf_output)
+                    page._release_image(self.scale)
 
                     # For debugging purposes:
                     if settings.debug.visualize_tables:
@@ -1,22 +1,42 @@
 import io
 import logging
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import DEVNULL, PIPE, Popen
-from typing import Iterable, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-import pandas as pd
 from docling_core.types.doc import BoundingBox, CoordOrigin
+from PIL import Image
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import TesseractCliOcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
-from docling.utils.profiling import TimeRecorder
+from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
 
+def parse_tesseract_tsv(data: str) -> List[Dict[str, str]]:
+    # Rows of the TSV output of tesseract, keyed by the header columns. The
+    # text column is missing on the rows of the page, block, paragraph and line levels.
+    lines = data.splitlines()
+    if len(lines) == 0:
+        return []
+
+    header = lines[0].split("\t")
+    return [dict(zip(header, line.split("\t"))) for line in lines[1:] if line]
+
+
+def _get_tmpfs_dir() -> Optional[str]:
+    # Shared memory, such that the image files are not written to disk.
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
 class TesseractOcrCliModel(BaseOcrModel):
 
     def __init__(self, enabled: bool, options: TesseractCliOcrOptions):
@@ -71,7 +91,9 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         return name, version
 
-    def _run_tesseract(self, ifilename: str):
+    def _run_tesseract(
+        self, ifilename: str, input_data: Optional[bytes] = None
+    ) -> List[Dict[str, str]]:
 
         cmd = [self.options.tesseract_cmd]
 
@@ -85,25 +107,118 @@ class TesseractOcrCliModel(BaseOcrModel):
         cmd += [ifilename, "stdout", "tsv"]
         _log.info("command: {}".format(" ".join(cmd)))
 
-        proc = Popen(cmd, stdout=PIPE, stderr=DEVNULL)
-        output, _ = proc.communicate()
-
-        # _log.info(output)
+        proc = Popen(
+            cmd,
+            stdin=DEVNULL if input_data is None else PIPE,
+            stdout=PIPE,
+            stderr=DEVNULL,
+        )
+        output, _ = proc.communicate(input=input_data)
 
         # Decode the byte string to a regular string
         decoded_data = output.decode("utf-8")
-        # _log.info(decoded_data)
 
         # Read the TSV file generated by Tesseract
-        df = pd.read_csv(io.StringIO(decoded_data), sep="\t")
-
-        # Display the dataframe (optional)
-        # _log.info("df: ", df.head())
-
-        # Filter rows that contain actual text (ignore header or empty rows)
-        df_filtered = df[df["text"].notnull() & (df["text"].str.strip() != "")]
-
-        return df_filtered
+        return parse_tesseract_tsv(decoded_data)
+
+    def _run_tesseract_batch(
+        self, images: List[Image.Image]
+    ) -> List[List[Dict[str, str]]]:
+        # The images are passed uncompressed, a single one through a pipe and several
+        # ones as a list of files, which tesseract processes in one run.
+        if len(images) == 1:
+            buffer = io.BytesIO()
+            images[0].save(buffer, format="PPM")
+            rows = self._run_tesseract("stdin", input_data=buffer.getvalue())
+        else:
+            with tempfile.TemporaryDirectory(dir=_get_tmpfs_dir()) as tmp_dir:
+                fnames = []
+                for ix, image in enumerate(images):
+                    fname = os.path.join(tmp_dir, f"{ix}.ppm")
+                    image.save(fname, format="PPM")
+                    fnames.append(fname)
+
+                list_fname = os.path.join(tmp_dir, "images.txt")
+                with open(list_fname, "w") as fw:
+                    fw.write("\n".join(fnames) + "\n")
+
+                rows = self._run_tesseract(list_fname)
+
+        # The rows of the images are told apart by their page number.
+        image_rows: List[List[Dict[str, str]]] = [[] for _ in images]
+        for row in rows:
+            image_ix = int(row["page_num"]) - 1
+            if 0 <= image_ix < len(images):
+                image_rows[image_ix].append(row)
+        return image_rows
+
+    def _ocr_regions(
+        self,
+        images: List[Image.Image],
+        ocr_rects: List[BoundingBox],
+        scales: List[float],
+    ) -> List[List[OcrCell]]:
+        batch_size = max(1, settings.perf.ocr_batch_size)
+        batches = [
+            images[ix : ix + batch_size] for ix in range(0, len(images), batch_size)
+        ]
+
+        concurrency = min(settings.perf.ocr_concurrency, len(batches))
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                batch_rows = list(executor.map(self._run_tesseract_batch, batches))
+        else:
+            batch_rows = [self._run_tesseract_batch(batch) for batch in batches]
+
+        return [
+            self._rows_to_cells(rows, ocr_rect, scale)
+            for rows, ocr_rect, scale in zip(
+                (rows for batch in batch_rows for rows in batch), ocr_rects, scales
+            )
+        ]
+
+    def _ocr_region(
+        self, image: Image.Image, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        return self._ocr_regions([image], [ocr_rect], [scale])[0]
+
+    def _rows_to_cells(
+        self, rows: List[Dict[str, str]], ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        cells = []
+        for ix, row in enumerate(rows):
+            text = row.get("text", "")
+            # Filter rows that contain actual text (ignore header or empty rows)
+            if text.strip() == "":
+                continue
+
+            conf = float(row["conf"])
+
+            l = float(row["left"])
+            b = float(row["top"])
+            w = float(row["width"])
+            h = float(row["height"])
+
+            t = b + h
+            r = l + w
+
+            cell = OcrCell(
+                id=ix,
+                text=text,
+                confidence=conf / 100.0,
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        (l / scale) + ocr_rect.l,
+                        (b / scale) + ocr_rect.t,
+                        (r / scale) + ocr_rect.l,
+                        (t / scale) + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            cells.append(cell)
+
+        return cells
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -113,68 +228,8 @@ class TesseractOcrCliModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        with tempfile.NamedTemporaryFile(
-                            suffix=".png", mode="w"
-                        ) as image_file:
-                            fname = image_file.name
-                            high_res_image.save(fname)
-
-                            df = self._run_tesseract(fname)
-
-                        # _log.info(df)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            l = float(row["left"])
-                            b = float(row["top"])
-                            w = float(row["width"])
-                            h = float(row["height"])
-
-                            t = b + h
-                            r = l + w
-
-                            cell = OcrCell(
-                                id=ix,
-                                text=text,
-                                confidence=conf / 100.0,
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (l / self.scale) + ocr_rect.l,
-                                        (b / self.scale) + ocr_rect.t,
-                                        (r / self.scale) + ocr_rect.l,
-                                        (t / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
-                                ),
-                            )
-                            all_ocr_cells.append(cell)
-
-                    # Post-process the cells
-                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+        # The regions of the pages of a chunk (settings.perf.page_batch_size) are
+        # recognized together, such that the full page regions of scanned pages
+        # share the tesseract runs (settings.perf.ocr_batch_size).
+        for pages in chunkify(page_batch, settings.perf.page_batch_size):
+            yield from self._process_pages(conv_res, pages)
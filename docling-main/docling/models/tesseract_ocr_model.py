@@ -1,14 +1,19 @@
 import logging
-from typing import Iterable
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Iterable, List
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
+from PIL import Image
 
 from docling.datamodel.base_models import Cell, OcrCell, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import TesseractOcrOptions
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
-from docling.utils.profiling import TimeRecorder
+from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
@@ -19,7 +24,11 @@ class TesseractOcrModel(BaseOcrModel):
         self.options: TesseractOcrOptions
 
         self.scale = 3  # multiplier for 72 dpi == 216 dpi.
+        self.max_confidence = 100  # MeanTextConf is in percent
         self.reader = None
+        self._readers: List[Any] = []
+        self._idle_readers: queue.SimpleQueue = queue.SimpleQueue()
+        self._readers_lock = threading.Lock()
 
         if self.enabled:
             install_errmsg = (
@@ -51,30 +60,120 @@ class TesseractOcrModel(BaseOcrModel):
             if not tesserocr_languages:
                 raise ImportError(missing_langs_errmsg)
 
-            # Initialize the tesseractAPI
-            _log.debug("Initializing TesserOCR: %s", tesseract_version)
-            lang = "+".join(self.options.lang)
-            if self.options.path is not None:
-                self.reader = tesserocr.PyTessBaseAPI(
-                    path=self.options.path,
-                    lang=lang,
-                    psm=tesserocr.PSM.AUTO,
-                    init=True,
-                    oem=tesserocr.OEM.DEFAULT,
-                )
-            else:
-                self.reader = tesserocr.PyTessBaseAPI(
-                    lang=lang,
-                    psm=tesserocr.PSM.AUTO,
-                    init=True,
-                    oem=tesserocr.OEM.DEFAULT,
-                )
             self.reader_RIL = tesserocr.RIL
 
+    def _create_reader(self):
+        import tesserocr
+
+        _log.debug("Initializing TesserOCR: %s", tesserocr.tesseract_version())
+        lang = "+".join(self.options.lang)
+        if self.options.path is not None:
+            return tesserocr.PyTessBaseAPI(
+                path=self.options.path,
+                lang=lang,
+                psm=tesserocr.PSM.AUTO,
+                init=True,
+                oem=tesserocr.OEM.DEFAULT,
+            )
+        else:
+            return tesserocr.PyTessBaseAPI(
+                lang=lang,
+                psm=tesserocr.PSM.AUTO,
+                init=True,
+                oem=tesserocr.OEM.DEFAULT,
+            )
+
+    def _get_reader(self):
+        # Initialize the tesseractAPI, once the first page region needs OCR.
+        with self._readers_lock:
+            if self.reader is None:
+                self.reader = self._create_reader()
+                self._readers.append(self.reader)
+                self._idle_readers.put(self.reader)
+        return self.reader
+
+    @contextmanager
+    def _acquire_reader(self):
+        # A tesseractAPI is used by one thread at a time. The pool grows up to
+        # settings.perf.ocr_concurrency instances, which are kept for later pages.
+        self._get_reader()
+        try:
+            reader = self._idle_readers.get_nowait()
+        except queue.Empty:
+            with self._readers_lock:
+                if len(self._readers) < settings.perf.ocr_concurrency:
+                    reader = self._create_reader()
+                    self._readers.append(reader)
+                else:
+                    reader = None
+            if reader is None:
+                reader = self._idle_readers.get()
+
+        try:
+            yield reader
+        finally:
+            self._idle_readers.put(reader)
+
     def __del__(self):
-        if self.reader is not None:
+        for reader in self._readers:
             # Finalize the tesseractAPI
-            self.reader.End()
+            reader.End()
+
+    def _ocr_regions(
+        self,
+        images: List[Image.Image],
+        ocr_rects: List[BoundingBox],
+        scales: List[float],
+    ) -> List[List[OcrCell]]:
+        # tesserocr releases the GIL, the regions are recognized in parallel threads.
+        # The results keep the order of the regions.
+        concurrency = min(settings.perf.ocr_concurrency, len(images))
+        if concurrency <= 1:
+            return super()._ocr_regions(images, ocr_rects, scales)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(self._ocr_region, images, ocr_rects, scales))
+
+    def _ocr_region(
+        self, image: Image.Image, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        with self._acquire_reader() as reader:
+            return self._ocr_region_with_reader(reader, image, ocr_rect, scale)
+
+    def _ocr_region_with_reader(
+        self, reader, image: Image.Image, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        # Retrieve text snippets with their bounding boxes
+        reader.SetImage(image)
+        boxes = reader.GetComponentImages(self.reader_RIL.TEXTLINE, True)
+
+        cells = []
+        for ix, (im, box, _, _) in enumerate(boxes):
+            # Set the area of interest. Tesseract uses Bottom-Left for the origin
+            reader.SetRectangle(box["x"], box["y"], box["w"], box["h"])
+
+            # Extract text within the bounding box
+            text = reader.GetUTF8Text().strip()
+            confidence = reader.MeanTextConf()
+            # Cells in page coordinates, as for the other engines
+            left = box["x"] / scale + ocr_rect.l
+            bottom = box["y"] / scale + ocr_rect.t
+            right = (box["x"] + box["w"]) / scale + ocr_rect.l
+            top = (box["y"] + box["h"]) / scale + ocr_rect.t
+
+            cells.append(
+                OcrCell(
+                    id=ix,
+                    text=text,
+                    confidence=confidence,
+                    bbox=BoundingBox.from_tuple(
+                        coord=(left, top, right, bottom),
+                        origin=CoordOrigin.TOPLEFT,
+                    ),
+                )
+            )
+
+        return cells
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -84,67 +183,8 @@ class TesseractOcrModel(BaseOcrModel):
             yield from page_batch
             return
 
-        for page in page_batch:
-            assert page._backend is not None
-            if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "ocr"):
-
-                    assert self.reader is not None
-
-                    ocr_rects = self.get_ocr_rects(page)
-
-                    all_ocr_cells = []
-                    for ocr_rect in ocr_rects:
-                        # Skip zero area boxes
-                        if ocr_rect.area() == 0:
-                            continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        # Retrieve text snippets with their bounding boxes
-                        self.reader.SetImage(high_res_image)
-                        boxes = self.reader.GetComponentImages(
-                            self.reader_RIL.TEXTLINE, True
-                        )
-
-                        cells = []
-                        for ix, (im, box, _, _) in enumerate(boxes):
-                            # Set the area of interest. Tesseract uses Bottom-Left for the origin
-                            self.reader.SetRectangle(
-                                box["x"], box["y"], box["w"], box["h"]
-                            )
-
-                            # Extract text within the bounding box
-                            text = self.reader.GetUTF8Text().strip()
-                            confidence = self.reader.MeanTextConf()
-                            left = box["x"] / self.scale
-                            bottom = box["y"] / self.scale
-                            right = (box["x"] + box["w"]) / self.scale
-                            top = (box["y"] + box["h"]) / self.scale
-
-                            cells.append(
-                                OcrCell(
-                                    id=ix,
-                                    text=text,
-                                    confidence=confidence,
-                                    bbox=BoundingBox.from_tuple(
-                                        coord=(left, top, right, bottom),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    ),
-                                )
-                            )
-
-                        # del high_res_image
-                        all_ocr_cells.extend(cells)
-
-                    # Post-process the cells
-                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
-
-                # DEBUG code:
-                if settings.debug.visualize_ocr:
-                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
-
-                yield page
+        # The regions of the pages of a chunk (settings.perf.page_batch_size) are
+        # recognized together, such that the OCR runs in parallel over the regions
+        # and the pages, while the pages keep streaming through.
+        for pages in chunkify(page_batch, settings.perf.page_batch_size):
+            yield from self._process_pages(conv_res, pages)
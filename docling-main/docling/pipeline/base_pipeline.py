@@ -1,9 +1,12 @@
 import functools
 import logging
+import queue
+import threading
 import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, List
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from docling_core.types.doc import DoclingDocument, NodeItem
 
@@ -18,12 +21,16 @@ from docling.datamodel.base_models import (
 from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import PipelineOptions
 from docling.datamodel.settings import settings
-from docling.models.base_model import BaseEnrichmentModel
+from docling.models.base_model import BaseEnrichmentModel, BasePageModel
+from docling.utils.cache import PageCache, _CachedPage, get_docling_version
 from docling.utils.profiling import ProfilingScope, TimeRecorder
-from docling.utils.utils import chunkify
+from docling.utils.utils import chunkify, create_hash
 
 _log = logging.getLogger(__name__)
 
+_STAGE_END = object()  # Marks the end of the page stream between two stages.
+_QUEUE_POLL_INTERVAL = 0.1  # Seconds between checks for an aborted stage.
+
 
 class BasePipeline(ABC):
     def __init__(self, pipeline_options: PipelineOptions):
@@ -53,6 +60,10 @@ class BasePipeline(ABC):
 
         return conv_res
 
+    def load_models(self) -> None:
+        """Load the models of the pipeline upfront, instead of on first use."""
+        pass
+
     @abstractmethod
     def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
         pass
@@ -106,51 +117,248 @@ class BasePipeline(ABC):
 
 
 class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
+    def __init__(self, pipeline_options: PipelineOptions):
+        super().__init__(pipeline_options)
+        self._page_cache: Optional[PageCache] = None
 
     def _apply_on_pages(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
-        for model in self.build_pipe:
+        for model in self._get_page_stages(conv_res):
             page_batch = model(conv_res, page_batch)
 
         yield from page_batch
 
-    def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
+    def _get_page_stage_fingerprints(self) -> List[Optional[str]]:
+        """Fingerprints of the build_pipe stages, used to key the page cache.
+
+        A fingerprint must cover all the options changing the page output of its
+        stage. Stages without fingerprint are not cached and always run.
+        """
+        return [None] * len(self.build_pipe)
+
+    def _get_page_cache(self) -> Optional[PageCache]:
+        if settings.cache.cache_dir is None or settings.cache.page_cache_max_size <= 0:
+            return None
+
+        cache_dir = Path(settings.cache.cache_dir) / "pages"
+        if self._page_cache is None or self._page_cache.cache_dir != cache_dir:
+            self._page_cache = PageCache(
+                cache_dir, max_size=settings.cache.page_cache_max_size
+            )
+        self._page_cache.max_size = settings.cache.page_cache_max_size
+
+        return self._page_cache
+
+    def _get_page_stages(self, conv_res: ConversionResult) -> List[Callable]:
+        page_cache = self._get_page_cache()
+        fingerprints = self._get_page_stage_fingerprints()
+        if page_cache is None or all(fp is None for fp in fingerprints):
+            return self.build_pipe
+
+        # The key of a stage covers the fingerprints of all the stages up to it,
+        # pages resume from the last stage found in the cache.
+        stage_keys: List[Optional[str]] = []
+        cumulated = [
+            type(conv_res.input._backend).__qualname__,
+            get_docling_version(),
+        ]
+        for fingerprint in fingerprints:
+            cumulated.append(str(fingerprint))
+            stage_keys.append(
+                None if fingerprint is None else create_hash(":".join(cumulated))
+            )
+
+        cached_pages: Dict[int, Tuple[int, Optional[_CachedPage]]] = {}
+        return [
+            functools.partial(
+                self._apply_cached_stage,
+                ix,
+                model,
+                page_cache,
+                stage_keys,
+                cached_pages,
+            )
+            for ix, model in enumerate(self.build_pipe)
+        ]
+
+    def _apply_cached_stage(
+        self,
+        stage_ix: int,
+        model: Callable,
+        page_cache: PageCache,
+        stage_keys: List[Optional[str]],
+        cached_pages: Dict[int, Tuple[int, Optional[_CachedPage]]],
+        conv_res: ConversionResult,
+        pages: Iterable[Page],
+    ) -> Iterable[Page]:
+        def page_key(page: Page, stage_key: str) -> str:
+            page_hash = create_hash(
+                conv_res.input.document_hash + ":" + str(page.page_no)
+            )
+            return create_hash(page_hash + ":" + stage_key)
+
+        for page_batch in chunkify(pages, settings.perf.page_batch_size):
+            pending_pages = []
+            for page in page_batch:
+                is_valid = page._backend is not None and page._backend.is_valid()
+
+                # Look up the last cached stage when the page enters the pipeline.
+                if stage_ix == 0 and is_valid:
+                    for cached_ix in reversed(range(len(stage_keys))):
+                        stage_key = stage_keys[cached_ix]
+                        if stage_key is None:
+                            continue
+                        # Unreadable entries are dropped, the page then resumes
+                        # from an earlier stage.
+                        cached = page_cache.get_page(page_key(page, stage_key))
+                        if cached is not None:
+                            cached_pages[page.page_no] = (cached_ix, cached)
+                            break
+
+                cached_ix, cached = cached_pages.get(page.page_no, (-1, None))
+                if stage_ix == cached_ix:
+                    assert cached is not None
+                    PageCache.restore_page(page, cached)
+                    del cached_pages[page.page_no]
+                    if isinstance(model, BasePageModel):
+                        model.on_page_restored(conv_res, page)
+                elif stage_ix > cached_ix or stage_keys[stage_ix] is None:
+                    pending_pages.append(page)
+
+            stage_key = stage_keys[stage_ix]
+            for page in model(conv_res, pending_pages):
+                if (
+                    stage_key is not None
+                    and page._backend is not None
+                    and page._backend.is_valid()
+                ):
+                    page_cache.put_page(page_key(page, stage_key), page)
+
+            yield from page_batch
+
+    def _initialize_pages(
+        self, conv_res: ConversionResult, pages: Iterable[Page]
+    ) -> Iterable[Page]:
+        return map(functools.partial(self.initialize_page, conv_res), pages)
+
+    def _apply_on_pages_staged(
+        self, conv_res: ConversionResult, pages: Iterable[Page]
+    ) -> Iterable[Page]:
+        # The page initialization and each model of the build_pipe run in their own
+        # thread, connected by bounded queues. Like this, rendering, OCR and model
+        # inference of consecutive pages overlap.
+        stages: List[Callable] = [
+            self._initialize_pages,
+            *self._get_page_stages(conv_res),
+        ]
+        max_queued_pages = (
+            settings.perf.page_batch_size * settings.perf.page_batch_concurrency
+        )
+        aborted = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(out_queue: queue.Queue, item: Any) -> bool:
+            while not aborted.is_set():
+                try:
+                    out_queue.put(item, timeout=_QUEUE_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def consume(in_queue: queue.Queue) -> Iterator[Page]:
+            while not aborted.is_set():
+                try:
+                    item = in_queue.get(timeout=_QUEUE_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _STAGE_END:
+                    return
+                yield item
+
+        def run_stage(stage: Callable, stage_input: Iterable[Page], out_queue):
+            try:
+                for page in stage(conv_res, stage_input):
+                    if not put(out_queue, page):
+                        break
+            except BaseException as e:
+                errors.append(e)
+                aborted.set()
+            finally:
+                put(out_queue, _STAGE_END)
+
+        threads = []
+        stage_input: Iterable[Page] = pages
+        for ix, stage in enumerate(stages):
+            out_queue: queue.Queue = queue.Queue(maxsize=max_queued_pages)
+            threads.append(
+                threading.Thread(
+                    target=run_stage,
+                    args=(stage, stage_input, out_queue),
+                    name=f"docling-page-stage-{ix}",
+                    daemon=True,
+                )
+            )
+            stage_input = consume(out_queue)
 
+        for thread in threads:
+            thread.start()
+
+        try:
+            yield from stage_input
+        finally:
+            # Stop the remaining stages if the output is not consumed until the end.
+            aborted.set()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _process_pages(
+        self, conv_res: ConversionResult, pages: Iterable[Page]
+    ) -> Iterator[Page]:
+        if settings.perf.page_batch_concurrency > 1:
+            # Run the page initialization and pipeline stages concurrently
+            yield from self._apply_on_pages_staged(conv_res, pages)
+
+        else:
+            # Iterate batches of pages (page_batch_size) in the doc
+            for page_batch in chunkify(pages, settings.perf.page_batch_size):
+                start_pb_time = time.time()
+
+                # 1. Initialise the page resources
+                init_pages = self._initialize_pages(conv_res, page_batch)
+
+                # 2. Run pipeline stages
+                yield from self._apply_on_pages(conv_res, init_pages)
+
+                end_pb_time = time.time() - start_pb_time
+                _log.debug(f"Finished converting page batch time={end_pb_time:.3f}")
+
+    def _check_backend(self, conv_res: ConversionResult):
         if not isinstance(conv_res.input._backend, PdfDocumentBackend):
             raise RuntimeError(
                 f"The selected backend {type(conv_res.input._backend).__name__} for {conv_res.input.file} is not a PDF backend. "
                 f"Can not convert this with a PDF pipeline. "
                 f"Please check your format configuration on DocumentConverter."
             )
-            # conv_res.status = ConversionStatus.FAILURE
-            # return conv_res
+
+    def _build_document(self, conv_res: ConversionResult) -> ConversionResult:
+
+        self._check_backend(conv_res)
+        # conv_res.status = ConversionStatus.FAILURE
+        # return conv_res
 
         with TimeRecorder(conv_res, "doc_build", scope=ProfilingScope.DOCUMENT):
 
-            for i in range(0, conv_res.input.page_count):
+            for i in conv_res.input.get_page_nos():
                 conv_res.pages.append(Page(page_no=i))
 
             try:
-                # Iterate batches of pages (page_batch_size) in the doc
-                for page_batch in chunkify(
-                    conv_res.pages, settings.perf.page_batch_size
-                ):
-                    start_pb_time = time.time()
-
-                    # 1. Initialise the page resources
-                    init_pages = map(
-                        functools.partial(self.initialize_page, conv_res), page_batch
-                    )
-
-                    # 2. Run pipeline stages
-                    pipeline_pages = self._apply_on_pages(conv_res, init_pages)
-
-                    for p in pipeline_pages:  # Must exhaust!
-                        pass
-
-                    end_pb_time = time.time() - start_pb_time
-                    _log.debug(f"Finished converting page batch time={end_pb_time:.3f}")
+                for p in self._process_pages(conv_res, conv_res.pages):  # Must exhaust!
+                    pass
 
             except Exception as e:
                 conv_res.status = ConversionStatus.FAILURE
@@ -168,6 +376,42 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
 
         return conv_res
 
+    def execute_pages(
+        self, in_doc: InputDocument, raises_on_error: bool
+    ) -> Iterator[ConversionResult]:
+        """Convert the document in fragments of page_batch_size consecutive pages.
+
+        Each fragment is a ConversionResult with the pages of the batch and their
+        DoclingDocument. The pages are created and released along the conversion,
+        such that the memory is bounded by the batch size instead of the document
+        length. Elements are not merged across the pages of different fragments.
+        """
+        conv_res = ConversionResult(input=in_doc)  # Collects the page timings
+        pages = (Page(page_no=i) for i in in_doc.get_page_nos())
+
+        _log.info(f"Processing document {in_doc.file.name} page by page")
+        try:
+            self._check_backend(conv_res)
+
+            for page_batch in chunkify(
+                self._process_pages(conv_res, pages), settings.perf.page_batch_size
+            ):
+                fragment = ConversionResult(input=in_doc, pages=page_batch)
+                fragment = self._assemble_document(fragment)
+                fragment = self._enrich_document(fragment)
+                fragment.status = self._determine_status(fragment)
+                yield fragment
+
+        except Exception as e:
+            if raises_on_error:
+                raise e
+            yield ConversionResult(input=in_doc, status=ConversionStatus.FAILURE)
+
+        finally:
+            # Always unload the PDF backend, even in case of failure
+            if in_doc._backend:
+                in_doc._backend.unload()
+
     def _determine_status(self, conv_res: ConversionResult) -> ConversionStatus:
         status = ConversionStatus.SUCCESS
         for page in conv_res.pages:
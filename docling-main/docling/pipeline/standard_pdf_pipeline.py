@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
 
@@ -35,6 +35,7 @@ _log = logging.getLogger(__name__)
 class StandardPdfPipeline(PaginatedPipeline):
     _layout_model_path = "model_artifacts/layout/beehive_v0.0.5_pt"
     _table_model_path = "model_artifacts/tableformer"
+    _models_revision = "v2.0.1"
 
     def __init__(self, pipeline_options: PdfPipelineOptions):
         super().__init__(pipeline_options)
@@ -97,11 +98,35 @@ class StandardPdfPipeline(PaginatedPipeline):
             repo_id="ds4sd/docling-models",
             force_download=force,
             local_dir=local_dir,
-            revision="v2.0.1",
+            revision=StandardPdfPipeline._models_revision,
         )
 
         return Path(download_path)
 
+    def load_models(self) -> None:
+        # Accessing the lazily loaded models materializes them.
+        self.glm_model.model
+        for model in self.build_pipe:
+            if isinstance(model, LayoutModel):
+                model.layout_predictor
+            elif isinstance(model, TableStructureModel) and model.enabled:
+                model.tf_predictor
+            elif isinstance(model, EasyOcrModel) and model.enabled:
+                model.reader
+            elif isinstance(model, TesseractOcrModel) and model.enabled:
+                model._get_reader()
+
+    def _get_page_stage_fingerprints(self) -> List[Optional[str]]:
+        ocr_options = self.pipeline_options.ocr_options
+        table_options = self.pipeline_options.table_structure_options
+        return [
+            None,  # Pre-processing, always renders the page images
+            f"ocr:{self.pipeline_options.do_ocr}:{ocr_options.model_dump_json()}",
+            f"layout:{StandardPdfPipeline._models_revision}",
+            f"table:{self.pipeline_options.do_table_structure}:{table_options.model_dump_json()}",
+            "assemble",
+        ]
+
     def get_ocr_model(self) -> Optional[BaseOcrModel]:
         if isinstance(self.pipeline_options.ocr_options, EasyOcrOptions):
             return EasyOcrModel(
@@ -164,6 +189,7 @@ class StandardPdfPipeline(PaginatedPipeline):
                 or self.pipeline_options.generate_table_images
             ):
                 scale = self.pipeline_options.images_scale
+                page_no_to_page = {p.page_no: p for p in conv_res.pages}
                 for element, _level in conv_res.document.iterate_items():
                     if not isinstance(element, DocItem) or len(element.prov) == 0:
                         continue
@@ -175,7 +201,7 @@ class StandardPdfPipeline(PaginatedPipeline):
                         and self.pipeline_options.generate_table_images
                     ):
                         page_ix = element.prov[0].page_no - 1
-                        page = conv_res.pages[page_ix]
+                        page = page_no_to_page[page_ix]
                         assert page.size is not None
                         assert page.image is not None
 
@@ -0,0 +1,336 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+import numpy as np
+from docling_core.types.doc import BoundingBox, CoordOrigin, DoclingDocument
+from PIL import Image
+from pydantic import BaseModel, ValidationError
+
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cell,
+    ConversionStatus,
+    ErrorItem,
+    OcrCell,
+    Page,
+    PagePredictions,
+    Size,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.utils.utils import create_hash
+
+if TYPE_CHECKING:
+    from docling.document_converter import FormatOption
+
+_log = logging.getLogger(__name__)
+
+
+def get_docling_version() -> str:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class DiskCache:
+    """Persistent key-value store of bytes, one file per key.
+
+    The total size of the entries is kept below `max_size` bytes by evicting the
+    least recently used entries. Reads refresh the modification time of an entry,
+    which is used as its last usage time. Writes are atomic, such that several
+    processes can share the same cache directory.
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._total_size = sum(size for _, _, size in self._scan_entries())
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def _scan_entries(self):
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith("."):  # incomplete write
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # evicted by another process
+                    continue
+                yield entry.path, stat.st_mtime, stat.st_size
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._entry_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return data
+
+    def delete(self, key: str):
+        path = self._entry_path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+
+        self._total_size -= size
+
+    def put(self, key: str, data: bytes):
+        if len(data) > self.max_size:
+            _log.debug(f"Not caching entry {key} larger than the cache size.")
+            return
+
+        path = self._entry_path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as fw:
+                fw.write(data)
+            # A replaced entry no longer counts towards the size.
+            try:
+                replaced_size = path.stat().st_size
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._total_size += len(data) - replaced_size
+        if self._total_size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        # Re-scan the directory, since other processes may share the cache.
+        entries = sorted(self._scan_entries(), key=lambda e: e[1])
+        total_size = sum(size for _, _, size in entries)
+
+        for entry_path, _, size in entries:
+            if total_size <= self.max_size:
+                break
+            Path(entry_path).unlink(missing_ok=True)
+            total_size -= size
+
+        self._total_size = total_size
+
+
+class _CachedConversion(BaseModel):
+    status: ConversionStatus
+    errors: List[ErrorItem] = []
+    page_count: int = 0
+    document: DoclingDocument
+
+
+class ConversionResultCache(DiskCache):
+    """Cache of the converted documents.
+
+    Entries are keyed by the document hash and a fingerprint of the conversion
+    setup: pipeline, backend, pipeline options, model revision and docling version.
+    Only the output document is kept, not the intermediate pages.
+    """
+
+    def _key(self, in_doc: InputDocument, format_option: "FormatOption") -> str:
+        assert format_option.pipeline_options is not None
+
+        setup: Dict[str, Any] = {
+            "docling_version": get_docling_version(),
+            "pipeline": format_option.pipeline_cls.__qualname__,
+            "models_revision": getattr(
+                format_option.pipeline_cls, "_models_revision", None
+            ),
+            "backend": format_option.backend.__qualname__,
+            "pipeline_options": format_option.pipeline_options.model_dump(mode="json"),
+        }
+        # Documents converted from a subset of their pages are different entries.
+        if in_doc.limits.has_page_selection():
+            setup["pages"] = in_doc.limits.model_dump(
+                mode="json", include={"page_range", "page_numbers"}
+            )
+        fingerprint = json.dumps(setup, sort_keys=True)
+
+        return create_hash(in_doc.document_hash + ":" + fingerprint)
+
+    def get_result(
+        self, in_doc: InputDocument, format_option: "FormatOption"
+    ) -> Optional[ConversionResult]:
+        key = self._key(in_doc, format_option)
+        data = self.get(key)
+        if data is None:
+            return None
+
+        try:
+            cached = _CachedConversion.model_validate_json(data)
+        except (ValidationError, ValueError) as e:
+            _log.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+        if len(in_doc.limits.select_pages(cached.page_count)) > (
+            in_doc.limits.max_num_pages
+        ):
+            return None
+
+        in_doc.page_count = cached.page_count
+        return ConversionResult(
+            input=in_doc,
+            status=cached.status,
+            errors=cached.errors,
+            document=cached.document,
+        )
+
+    def put_result(self, conv_res: ConversionResult, format_option: "FormatOption"):
+        if conv_res.status not in {
+            ConversionStatus.SUCCESS,
+            ConversionStatus.PARTIAL_SUCCESS,
+        }:
+            return
+
+        cached = _CachedConversion(
+            status=conv_res.status,
+            errors=conv_res.errors,
+            page_count=conv_res.input.page_count,
+            document=conv_res.document,
+        )
+        self.put(
+            self._key(conv_res.input, format_option),
+            cached.model_dump_json().encode("utf-8"),
+        )
+
+
+class _CachedPage(BaseModel):
+    size: Optional[Size] = None
+    cells: List[Union[OcrCell, Cell]] = []
+    predictions: PagePredictions = PagePredictions()
+    assembled: Optional[AssembledUnit] = None
+
+
+class PageCache(DiskCache):
+    """Cache of the pages processed by the stages of a paginated pipeline.
+
+    An entry holds the page state (size, cells, predictions and assembled
+    elements) after a pipeline stage, such that the page can resume the pipeline
+    after that stage.
+    """
+
+    def put_page(self, key: str, page: Page):
+        cached = _CachedPage(
+            size=page.size,
+            cells=page.cells,
+            predictions=page.predictions,
+            assembled=page.assembled,
+        )
+        self.put(key, cached.model_dump_json().encode("utf-8"))
+
+    def get_page(self, key: str) -> Optional[_CachedPage]:
+        data = self.get(key)
+        if data is None:
+            return None
+
+        try:
+            return _CachedPage.model_validate_json(data)
+        except (ValidationError, ValueError) as e:
+            _log.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+
+    @staticmethod
+    def restore_page(page: Page, cached: _CachedPage):
+        page.size = cached.size
+        page.cells = list(cached.cells)
+        page.predictions = cached.predictions
+        page.assembled = cached.assembled
+
+
+class _CachedOcrCells(BaseModel):
+    cells: List[OcrCell] = []
+
+
+class OcrCache(DiskCache):
+    """Cache of the OCR results of page regions.
+
+    Entries are keyed by the hash of the rendered region image and a fingerprint
+    of the OCR engine and its options, such that regions repeated across
+    documents, e.g. letterheads, logos or stamps, are recognized once. The cells
+    are stored relative to the region origin.
+    """
+
+    def _key(self, image: Union[Image.Image, np.ndarray], fingerprint: str) -> str:
+        pixels = np.ascontiguousarray(np.asarray(image))
+        hasher = hashlib.sha256()
+        hasher.update(f"{fingerprint}:{pixels.dtype}:{pixels.shape}:".encode("utf-8"))
+        hasher.update(pixels.data)
+        return hasher.hexdigest()
+
+    def get_cells(
+        self,
+        image: Union[Image.Image, np.ndarray],
+        fingerprint: str,
+        ocr_rect: BoundingBox,
+    ) -> Optional[List[OcrCell]]:
+        key = self._key(image, fingerprint)
+        data = self.get(key)
+        if data is None:
+            return None
+
+        try:
+            cached = _CachedOcrCells.model_validate_json(data)
+        except (ValidationError, ValueError) as e:
+            _log.warning(f"Discarding unreadable cache entry {key}: {e}")
+            self.delete(key)
+            return None
+        return [
+            cell.model_copy(
+                update={
+                    "bbox": BoundingBox(
+                        l=cell.bbox.l + ocr_rect.l,
+                        t=cell.bbox.t + ocr_rect.t,
+                        r=cell.bbox.r + ocr_rect.l,
+                        b=cell.bbox.b + ocr_rect.t,
+                        coord_origin=CoordOrigin.TOPLEFT,
+                    )
+                }
+            )
+            for cell in cached.cells
+        ]
+
+    def put_cells(
+        self,
+        image: Union[Image.Image, np.ndarray],
+        fingerprint: str,
+        ocr_rect: BoundingBox,
+        cells: List[OcrCell],
+    ):
+        cached = _CachedOcrCells(
+            cells=[
+                cell.model_copy(
+                    update={
+                        "bbox": BoundingBox(
+                            l=cell.bbox.l - ocr_rect.l,
+                            t=cell.bbox.t - ocr_rect.t,
+                            r=cell.bbox.r - ocr_rect.l,
+                            b=cell.bbox.b - ocr_rect.t,
+                            coord_origin=CoordOrigin.TOPLEFT,
+                        )
+                    }
+                )
+                for cell in cells
+            ]
+        )
+        self.put(
+            self._key(image, fingerprint), cached.model_dump_json().encode("utf-8")
+        )
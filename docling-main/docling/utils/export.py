@@ -101,9 +101,10 @@ def generate_multimodal_pages(
             )
         return cells
 
+    page_no_to_page = {p.page_no: p for p in doc_result.pages}
+
     def _process_page():
-        page_ix = page_no - 1
-        page = doc_result.pages[page_ix]
+        page = page_no_to_page[page_no - 1]
 
         page_cells = _process_page_cells(page=page)
         page_segments = _process_page_segments(doc_items=doc_items, page=page)
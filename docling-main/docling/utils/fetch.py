@@ -0,0 +1,189 @@
+import importlib.metadata
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from io import BytesIO
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, Optional, Set, Union
+
+import requests
+from docling_core.utils.file import resolve_file_source
+from pydantic import AnyHttpUrl, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+
+from docling.datamodel.base_models import DocumentStream
+
+_log = logging.getLogger(__name__)
+
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled for each next one.
+_CHUNK_SIZE = 65536
+
+Source = Union[Path, str, DocumentStream]
+
+
+def _get_http_url(source: Source) -> Optional[AnyHttpUrl]:
+    if not isinstance(source, str):
+        return None
+    try:
+        return TypeAdapter(AnyHttpUrl).validate_python(source)
+    except ValidationError:
+        return None
+
+
+def _get_file_name(res: requests.Response, http_url: AnyHttpUrl) -> str:
+    # Same naming as resolve_file_source: the Content-Disposition filename, if any,
+    # otherwise the last part of the URL path.
+    if cont_disp := res.headers.get("Content-Disposition"):
+        for par in cont_disp.strip().split(";"):
+            if (split := par.split("=")) and split[0].strip() == "filename":
+                fname = "=".join(split[1:]).strip().strip("'\"")
+                if fname:
+                    return fname
+    return Path(http_url.path or "").name or "file"
+
+
+def fetch_url(
+    session: requests.Session,
+    http_url: AnyHttpUrl,
+    max_size: int,
+    retries: int = 3,
+    timeout: Optional[float] = None,
+) -> DocumentStream:
+    """Download a URL into an in-memory document stream
+
+    Connection errors, timeouts and transient HTTP errors (429, 5xx) are retried
+    up to retries times, with an exponential backoff. The download stops once more
+    than max_size bytes are received, such that the stream exceeds the size limit
+    of the document without holding more of it.
+    """
+    attempt = 0
+    while True:
+        try:
+            with session.get(str(http_url), stream=True, timeout=timeout) as res:
+                res.raise_for_status()
+
+                buf = BytesIO()
+                for chunk in res.iter_content(chunk_size=_CHUNK_SIZE):
+                    buf.write(chunk)
+                    if buf.tell() > max_size:
+                        _log.info(
+                            f"Stopped downloading {http_url}, which is larger than {max_size} bytes."
+                        )
+                        break
+                buf.seek(0)
+
+                return DocumentStream(name=_get_file_name(res, http_url), stream=buf)
+
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error: Exception = e
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in _RETRY_STATUS_CODES:
+                raise
+            error = e
+
+        if attempt >= retries:
+            raise error
+        delay = _RETRY_BACKOFF * 2**attempt
+        attempt += 1
+        _log.info(f"Retrying download of {http_url} in {delay:.1f} sec: {error}")
+        time.sleep(delay)
+
+
+def fetch_sources(
+    sources: Iterable[Source],
+    max_size: int,
+    concurrency: int = 4,
+    retries: int = 3,
+    timeout: Optional[float] = None,
+    ordered: bool = True,
+    headers: Optional[Dict[str, str]] = None,
+) -> Iterator[Union[Path, DocumentStream]]:
+    """Resolve the sources of documents, downloading the URLs concurrently
+
+    The URLs are downloaded by a pool of concurrency threads sharing the
+    connections of one session. Up to twice as many downloads are in flight, such
+    that the next ones proceed while the completed ones are consumed. Other sources
+    are resolved in place. The results are yielded in input order, or as they
+    complete if ordered is False.
+    """
+    req_headers = {k.lower(): v for k, v in (headers or {}).items()}
+    if "user-agent" not in req_headers:
+        agent_name = f"docling-core/{importlib.metadata.version('docling-core')}"
+        req_headers["user-agent"] = agent_name
+
+    max_in_flight = 2 * concurrency
+
+    with (
+        requests.Session() as session,
+        ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="docling-fetch"
+        ) as pool,
+    ):
+        adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(req_headers)
+
+        def submit(http_url: AnyHttpUrl) -> Future:
+            return pool.submit(
+                fetch_url,
+                session,
+                http_url,
+                max_size=max_size,
+                retries=retries,
+                timeout=timeout,
+            )
+
+        def resolve(source: Source) -> Union[Path, DocumentStream]:
+            return resolve_file_source(source) if isinstance(source, str) else source
+
+        try:
+            if ordered:
+                # Local sources wait in line behind the downloads preceding them.
+                pending: Deque[Union[Future, Path, DocumentStream]] = deque()
+                in_flight = 0
+                for source in sources:
+                    if (http_url := _get_http_url(source)) is not None:
+                        pending.append(submit(http_url))
+                        in_flight += 1
+                    else:
+                        pending.append(resolve(source))
+
+                    while pending and (
+                        in_flight >= max_in_flight
+                        or not isinstance(pending[0], Future)
+                        or pending[0].done()
+                    ):
+                        item = pending.popleft()
+                        if isinstance(item, Future):
+                            in_flight -= 1
+                            item = item.result()
+                        yield item
+
+                while pending:
+                    item = pending.popleft()
+                    yield item.result() if isinstance(item, Future) else item
+
+            else:
+                running: Set[Future] = set()
+                for source in sources:
+                    if (http_url := _get_http_url(source)) is None:
+                        yield resolve(source)
+                        continue
+
+                    running.add(submit(http_url))
+                    if len(running) >= max_in_flight:
+                        done, running = wait(running, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+
+                while running:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+        finally:
+            # Don't start the queued downloads when the results are not consumed.
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -2,6 +2,7 @@ import copy
 import logging
 
 import networkx as nx
+import numpy as np
 from docling_core.types.doc import DocItemLabel
 
 logger = logging.getLogger("layout_utils")
@@ -137,26 +138,60 @@ def vertical_overlap_fraction(bboxA, bboxB):
 ## Cluster-and-cell relations
 
 
+def bbox_array(bbox_list):
+    ## Stacks the bounding boxes into a (n, 4) float array
+    return np.array(bbox_list, dtype=np.float64).reshape(-1, 4)
+
+
+def enclosed_cells_matrix(
+    cluster_bboxes, cell_bboxes, min_cell_intersection_with_cluster=0.2
+):
+    ## Vectorized compute_enclosed_cells over all clusters (rows) and cells (columns).
+    ## Returns the enclosed mask, the mask of the cells enclosed by intersection
+    ## and the intersection areas.
+    cl = cluster_bboxes[:, None, :]
+    ce = cell_bboxes[None, :, :]
+
+    ## Same operations as compute_intersection(cell_bbox, cluster_bbox)
+    is_intersecting = ~(
+        (ce[..., 2] < cl[..., 0])
+        | (ce[..., 0] > cl[..., 2])
+        | (ce[..., 3] < cl[..., 1])
+        | (ce[..., 1] > cl[..., 3])
+    )
+    xA = np.maximum(ce[..., 0], cl[..., 0])
+    yA = np.maximum(ce[..., 1], cl[..., 1])
+    xB = np.minimum(ce[..., 2], cl[..., 2])
+    yB = np.minimum(ce[..., 3], cl[..., 3])
+    intersection = (xB - xA) * (yB - yA)
+    intersection = np.where(is_intersecting & (intersection >= 0), intersection, 0.0)
+
+    frac_area = (
+        (cell_bboxes[:, 2] - cell_bboxes[:, 0])
+        * (cell_bboxes[:, 3] - cell_bboxes[:, 1])
+    ) * min_cell_intersection_with_cluster
+    by_intersection = (intersection > frac_area) & (frac_area > 0)
+
+    by_containment = (
+        (cl[..., 0] <= ce[..., 0] + 3)
+        & (cl[..., 1] <= ce[..., 1] + 3)
+        & (cl[..., 2] >= ce[..., 2] - 3)
+        & (cl[..., 3] >= ce[..., 3] - 3)
+    )
+
+    return by_intersection | by_containment, by_intersection, intersection
+
+
 def compute_enclosed_cells(
     cluster_bbox, raw_cells, min_cell_intersection_with_cluster=0.2
 ):
-    cells_in_cluster = []
-    cells_in_cluster_int = []
-    for ix, cell in enumerate(raw_cells):
-        cell_bbox = cell["bbox"]
-        intersection = compute_intersection(cell_bbox, cluster_bbox)
-        frac_area = area(cell_bbox) * min_cell_intersection_with_cluster
-
-        if (
-            intersection > frac_area and frac_area > 0
-        ):  # intersect > certain fraction of cell
-            cells_in_cluster.append(ix)
-            cells_in_cluster_int.append(intersection)
-        elif contains(
-            cluster_bbox,
-            [cell_bbox[0] + 3, cell_bbox[1] + 3, cell_bbox[2] - 3, cell_bbox[3] - 3],
-        ):
-            cells_in_cluster.append(ix)
+    enclosed, by_intersection, intersection = enclosed_cells_matrix(
+        bbox_array([cluster_bbox]),
+        bbox_array([cell["bbox"] for cell in raw_cells]),
+        min_cell_intersection_with_cluster,
+    )
+    cells_in_cluster = np.flatnonzero(enclosed[0]).tolist()
+    cells_in_cluster_int = intersection[0][by_intersection[0]].tolist()
     return cells_in_cluster, cells_in_cluster_int
 
 
@@ -471,26 +506,40 @@ def adapt_bbox(raw_cells, cluster, orphan_cell_indices):
 
 
 def remove_cluster_duplicates_by_conf(cluster_predictions, threshold=0.5):
-    DuplicateDeletedClusterIDs = []
-    for cluster_1 in cluster_predictions:
-        for cluster_2 in cluster_predictions:
-            if cluster_1["id"] != cluster_2["id"]:
-                if_conf = False
-                if cluster_1["confidence"] > cluster_2["confidence"]:
-                    if_conf = True
-                if if_conf == True:
-                    if bb_iou(cluster_1["bbox"], cluster_2["bbox"]) > threshold:
-                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
-                    elif contains(
-                        cluster_1["bbox"],
-                        [
-                            cluster_2["bbox"][0] + 3,
-                            cluster_2["bbox"][1] + 3,
-                            cluster_2["bbox"][2] - 3,
-                            cluster_2["bbox"][3] - 3,
-                        ],
-                    ):
-                        DuplicateDeletedClusterIDs.append(cluster_2["id"])
+    ## Pairwise comparison of all clusters (rows: cluster_1, columns: cluster_2),
+    ## with the same operations as bb_iou() and contains().
+    ids = np.array([cluster["id"] for cluster in cluster_predictions])
+    confidences = np.array(
+        [cluster["confidence"] for cluster in cluster_predictions], dtype=np.float64
+    )
+    bboxes = bbox_array([cluster["bbox"] for cluster in cluster_predictions])
+    b1 = bboxes[:, None, :]
+    b2 = bboxes[None, :, :]
+
+    xA = np.maximum(b1[..., 0], b2[..., 0])
+    yA = np.maximum(b1[..., 1], b2[..., 1])
+    xB = np.minimum(b1[..., 2], b2[..., 2])
+    yB = np.minimum(b1[..., 3], b2[..., 3])
+    interArea = np.maximum(0, xB - xA + 1) * np.maximum(0, yB - yA + 1)
+    boxArea = (bboxes[:, 2] - bboxes[:, 0] + 1) * (bboxes[:, 3] - bboxes[:, 1] + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou = interArea / (boxArea[:, None] + boxArea[None, :] - interArea)
+
+    contained = (
+        (b1[..., 0] <= b2[..., 0] + 3)
+        & (b1[..., 1] <= b2[..., 1] + 3)
+        & (b1[..., 2] >= b2[..., 2] - 3)
+        & (b1[..., 3] >= b2[..., 3] - 3)
+    )
+    is_duplicate = (
+        (ids[:, None] != ids[None, :])
+        & (confidences[:, None] > confidences[None, :])
+        & ((iou > threshold) | contained)
+    )
+
+    ## Collected in the order of the former nested loops over cluster_1, cluster_2
+    _, cluster_2_ixs = np.nonzero(is_duplicate)
+    DuplicateDeletedClusterIDs = [cluster_predictions[ix]["id"] for ix in cluster_2_ixs]
 
     DuplicateDeletedClusterIDs = list(set(DuplicateDeletedClusterIDs))
 
@@ -790,10 +839,13 @@ def clean_up_clusters(
 
 
 def assigning_cell_ids_to_clusters(clusters, raw_cells, threshold):
-    for cluster in clusters:
-        cells_in_cluster, _ = compute_enclosed_cells(
-            cluster["bbox"], raw_cells, min_cell_intersection_with_cluster=threshold
-        )
+    enclosed, _, _ = enclosed_cells_matrix(
+        bbox_array([cluster["bbox"] for cluster in clusters]),
+        bbox_array([cell["bbox"] for cell in raw_cells]),
+        min_cell_intersection_with_cluster=threshold,
+    )
+    for cluster, cluster_enclosed in zip(clusters, enclosed):
+        cells_in_cluster = np.flatnonzero(cluster_enclosed).tolist()
         cluster["cell_ids"] = cells_in_cluster
         ## These cell_ids are ids of the raw cells.
         ## They are often, but not always, the same as the "id" or the index of the "cells" list in a prediction.
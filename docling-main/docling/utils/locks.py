@@ -0,0 +1,4 @@
+import threading
+
+# pdfium is not thread-safe, all calls into pypdfium2 must hold this lock.
+pypdfium2_lock = threading.Lock()
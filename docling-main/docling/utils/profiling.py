@@ -60,3 +60,15 @@ class TimeRecorder:
             elapsed = time.monotonic() - self.start
             self.conv_res.timings[self.key].times.append(elapsed)
             self.conv_res.timings[self.key].count += 1
+
+
+def count_event(
+    conv_res: "ConversionResult",
+    key: str,
+    scope: ProfilingScope = ProfilingScope.PAGE,
+):
+    # Counts an event without a duration, e.g. a skipped model.
+    if settings.debug.profile_pipeline_timings:
+        if key not in conv_res.timings.keys():
+            conv_res.timings[key] = ProfilingItem(scope=scope)
+        conv_res.timings[key].count += 1
@@ -0,0 +1,55 @@
+from typing import List
+
+import numpy as np
+from docling_core.types.doc import BoundingBox
+
+
+class TextCellIndex:
+    """Text cells of a page, with their boxes in an array for range queries.
+
+    The boxes are [l, t, r, b] with a top-left origin. The cells are sorted by
+    their top coordinate, such that a query only compares the cells within the
+    vertical range of the query box.
+    """
+
+    def __init__(self, texts: List[str], boxes: np.ndarray):
+        self.texts = texts
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+        self._order = np.argsort(self.boxes[:, 1], kind="stable")
+        self._sorted_tops = self.boxes[self._order, 1]
+        heights = self.boxes[:, 3] - self.boxes[:, 1]
+        self._max_height = max(0.0, float(heights.max())) if len(heights) > 0 else 0.0
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def query(self, bbox: BoundingBox, min_overlap: float = 0.5) -> List[int]:
+        # Indices, in cell order, of the cells with more than min_overlap of their
+        # area inside the box. Same as comparing intersection_area_with(bbox) / area()
+        # of each cell box, but cells of zero area are never matched.
+        qt, qb = bbox.t, bbox.b
+        lo = np.searchsorted(self._sorted_tops, qt - self._max_height, side="left")
+        hi = np.searchsorted(self._sorted_tops, qb, side="left")
+        candidates = np.sort(self._order[lo:hi])
+        if len(candidates) == 0:
+            return []
+
+        l, t, r, b = self.boxes[candidates].T
+        width = np.minimum(r, bbox.r) - np.maximum(l, bbox.l)
+        height = np.minimum(b, qb) - np.maximum(t, qt)
+        intersection = np.where((width > 0) & (height > 0), width * height, 0.0)
+        area = (r - l) * (b - t)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            matched = (area != 0) & (intersection / area > min_overlap)
+
+        return candidates[matched].tolist()
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        text_piece = ""
+        for ix in self.query(bbox):
+            if len(text_piece) > 0:
+                text_piece += " "
+            text_piece += self.texts[ix]
+        return text_piece
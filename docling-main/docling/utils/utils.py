@@ -1,9 +1,15 @@
+import ctypes
 import hashlib
+import mmap
+import os
 from io import BytesIO
 from itertools import islice
 from pathlib import Path
 from typing import List, Union
 
+# Content of an input file: the bytes of a stream, or the array of a mapped file
+FileData = Union[bytes, ctypes.Array]
+
 
 def chunkify(iterator, chunk_size):
     """Yield successive chunks of chunk_size from the iterable."""
@@ -13,25 +19,34 @@ def chunkify(iterator, chunk_size):
         yield [first] + list(islice(iterator, chunk_size - 1))
 
 
-def create_file_hash(path_or_stream: Union[BytesIO, Path]) -> str:
-    """Create a stable page_hash of the path_or_stream of a file"""
+def map_file_data(path_or_stream: Union[BytesIO, Path]) -> FileData:
+    """Get the content of a file or stream in memory, without copying it
 
-    block_size = 65536
-    hasher = hashlib.sha256()
+    Files are memory-mapped copy-on-write, such that the pages are read from disk
+    once and shared by everything reading from the returned buffer.
+    """
+    if isinstance(path_or_stream, BytesIO):
+        # Shares the underlying bytes object unless the stream was modified.
+        return path_or_stream.getvalue()
 
-    def _hash_buf(binary_stream):
-        buf = binary_stream.read(block_size)  # read and page_hash in chunks
-        while len(buf) > 0:
-            hasher.update(buf)
-            buf = binary_stream.read(block_size)
+    with path_or_stream.open("rb") as afile:
+        size = os.fstat(afile.fileno()).st_size
+        if size == 0:  # an empty file can't be mapped
+            return b""
+        mapping = mmap.mmap(afile.fileno(), 0, access=mmap.ACCESS_COPY)
 
-    if isinstance(path_or_stream, Path):
-        with path_or_stream.open("rb") as afile:
-            _hash_buf(afile)
-    elif isinstance(path_or_stream, BytesIO):
-        _hash_buf(path_or_stream)
+    # The array keeps a reference to the mapping, which is closed with it.
+    return (ctypes.c_ubyte * size).from_buffer(mapping)
 
-    return hasher.hexdigest()
+
+def create_data_hash(data: FileData) -> str:
+    """Create a stable page_hash of the content of a file"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def create_file_hash(path_or_stream: Union[BytesIO, Path]) -> str:
+    """Create a stable page_hash of the path_or_stream of a file"""
+    return create_data_hash(map_file_data(path_or_stream))
 
 
 def create_hash(string: str):
@@ -1,6 +1,8 @@
+import random
 from pathlib import Path
 
 import pytest
+from docling_core.types.doc import CoordOrigin
 
 from docling.backend.docling_parse_v2_backend import (
     DoclingParseV2DocumentBackend,
@@ -74,3 +76,47 @@ def test_crop_page_image(test_doc_path):
 def test_num_pages(test_doc_path):
     doc_backend = _get_backend(test_doc_path)
     doc_backend.page_count() == 9
+
+
+def test_get_text_from_rect_matches_scan():
+    doc_backend = _get_backend(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    page_backend: DoclingParseV2PageBackend = doc_backend.load_page(0)
+
+    page_size = page_backend.get_size()
+    dimension = page_backend._dpage["sanitized"]["dimension"]
+    cells_data = page_backend._dpage["sanitized"]["cells"]["data"]
+    cells_header = page_backend._dpage["sanitized"]["cells"]["header"]
+
+    def scan(bbox):
+        text_piece = ""
+        for cell_data in cells_data:
+            cell_bbox = BoundingBox(
+                l=cell_data[cells_header.index("x0")]
+                * page_size.width
+                / dimension["width"],
+                b=cell_data[cells_header.index("y0")]
+                * page_size.height
+                / dimension["height"],
+                r=cell_data[cells_header.index("x1")]
+                * page_size.width
+                / dimension["width"],
+                t=cell_data[cells_header.index("y1")]
+                * page_size.height
+                / dimension["height"],
+                coord_origin=CoordOrigin.BOTTOMLEFT,
+            ).to_top_left_origin(page_height=page_size.height)
+            if cell_bbox.intersection_area_with(bbox) / cell_bbox.area() > 0.5:
+                if len(text_piece) > 0:
+                    text_piece += " "
+                text_piece += cell_data[cells_header.index("text")]
+        return text_piece
+
+    rng = random.Random(42)
+    for _ in range(200):
+        l, r = sorted(rng.uniform(0, page_size.width) for _ in range(2))
+        t, b = sorted(rng.uniform(0, page_size.height) for _ in range(2))
+        bbox = BoundingBox(l=l, t=t, r=r, b=b)
+        assert page_backend.get_text_in_rect(bbox) == scan(bbox)
+
+    full_page = BoundingBox(l=0, t=0, r=page_size.width, b=page_size.height)
+    assert page_backend.get_text_in_rect(full_page) == scan(full_page)
@@ -0,0 +1,210 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from docling_core.types.doc import BoundingBox
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat, OcrCell
+from docling.datamodel.pipeline_options import EasyOcrOptions, PipelineOptions
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter, HTMLFormatOption
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.utils.cache import DiskCache
+
+
+def get_input_paths():
+    html_paths = sorted(Path("./tests/data/html/").glob("*.html"))
+    docx_paths = sorted(Path("./tests/data/docx/").glob("*.docx"))
+    return html_paths + docx_paths
+
+
+@pytest.fixture
+def cache_settings(tmp_path):
+    orig_cache = settings.cache.model_copy()
+    settings.cache.cache_dir = str(tmp_path / "cache")
+    yield settings.cache
+    settings.cache = orig_cache
+
+
+def get_converter():
+    return DocumentConverter(allowed_formats=[InputFormat.HTML, InputFormat.DOCX])
+
+
+def test_conversion_cache_hits(cache_settings):
+    input_paths = get_input_paths()
+
+    expected = {
+        res.input.file.name: res.document.export_to_dict()
+        for res in get_converter().convert_all(input_paths)
+    }
+
+    converter = get_converter()
+    for res in converter.convert_all(input_paths):
+        assert res.status == ConversionStatus.SUCCESS
+        assert res.document.export_to_dict() == expected[res.input.file.name]
+
+        # Cache hits neither load a backend nor build a pipeline, nor keep their
+        # input data.
+        assert not hasattr(res.input, "_backend")
+        assert res.input._data is None
+        assert res.input._backend_args is None
+    assert len(converter.initialized_pipelines) == 0
+
+
+def test_conversion_cache_options_change(cache_settings):
+    input_paths = get_input_paths()[:1]
+
+    list(get_converter().convert_all(input_paths))
+
+    # Different pipeline options must not reuse the cached results.
+    pipeline_options = PipelineOptions(create_legacy_output=False)
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.HTML],
+        format_options={
+            InputFormat.HTML: HTMLFormatOption(pipeline_options=pipeline_options)
+        },
+    )
+    list(converter.convert_all(input_paths))
+    assert len(converter.initialized_pipelines) == 1
+
+
+def test_conversion_cache_page_selection(cache_settings):
+    input_paths = get_input_paths()[:1]
+
+    list(get_converter().convert_all(input_paths))
+
+    # Conversions of a subset of the pages are cached separately.
+    converter = get_converter()
+    list(converter.convert_all(input_paths, page_range=(1, 1)))
+    assert len(converter.initialized_pipelines) == 1
+
+    converter = get_converter()
+    list(converter.convert_all(input_paths, page_range=(1, 1)))
+    assert len(converter.initialized_pipelines) == 0
+
+
+def test_conversion_cache_streaming(cache_settings):
+    input_paths = get_input_paths()[:1]
+
+    list(get_converter().convert_streaming(input_paths[0]))
+
+    # Documents without pages are converted complete, through the cache.
+    converter = get_converter()
+    results = list(converter.convert_streaming(input_paths[0]))
+    assert len(results) == 1
+    assert results[0].status == ConversionStatus.SUCCESS
+    assert len(converter.initialized_pipelines) == 0
+
+    # Like convert(), only the allowed formats are converted.
+    with pytest.raises(AssertionError):
+        list(converter.convert_streaming(Path("./tests/data/2305.03393v1-pg9.pdf")))
+
+
+def test_conversion_cache_unreadable_entry(cache_settings):
+    input_paths = get_input_paths()[:1]
+
+    expected = get_converter().convert(input_paths[0]).document.export_to_dict()
+
+    cache_dir = Path(cache_settings.cache_dir)
+    entry_paths = [p for p in cache_dir.rglob("*") if p.is_file()]
+    for entry_path in entry_paths:
+        entry_path.write_bytes(b'{"status": "success", "document": ')
+
+    # Unreadable entries are discarded and the document is converted again.
+    converter = get_converter()
+    res = converter.convert(input_paths[0])
+    assert res.status == ConversionStatus.SUCCESS
+    assert res.document.export_to_dict() == expected
+    assert len(converter.initialized_pipelines) == 1
+
+    converter = get_converter()
+    converter.convert(input_paths[0])
+    assert len(converter.initialized_pipelines) == 0
+
+
+def test_disk_cache_replaced_entries(tmp_path):
+    cache = DiskCache(tmp_path, max_size=250)
+
+    # Replacing an entry doesn't count its previous size.
+    for _ in range(5):
+        cache.put("aa01", b"x" * 100)
+    cache.put("bb02", b"x" * 100)
+    assert cache._total_size == 200
+    assert cache.get("aa01") is not None
+
+    cache.delete("aa01")
+    cache.delete("aa01")
+    assert cache._total_size == 100
+    assert cache.get("aa01") is None
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = DiskCache(tmp_path, max_size=250)
+
+    cache.put("aa01", b"x" * 100)
+    cache.put("bb02", b"x" * 100)
+    os.utime(cache._entry_path("aa01"), (1000, 1000))
+    os.utime(cache._entry_path("bb02"), (2000, 2000))
+
+    # Reads refresh the entries, the least recently used one is evicted.
+    assert cache.get("aa01") == b"x" * 100
+    cache.put("cc03", b"x" * 100)
+
+    assert cache.get("aa01") is not None
+    assert cache.get("bb02") is None
+    assert cache.get("cc03") is not None
+
+    # Entries larger than the cache are not stored.
+    cache.put("dd04", b"x" * 300)
+    assert cache.get("dd04") is None
+
+
+class _CountingOcrModel(BaseOcrModel):
+    def __init__(self, options: EasyOcrOptions):
+        super().__init__(enabled=True, options=options)
+        self.scale = 3
+        self.calls = 0
+
+    def _ocr_region(self, image, ocr_rect, scale):
+        self.calls += 1
+        return [
+            OcrCell(
+                id=0,
+                text=f"{image.sum()}",
+                confidence=0.9,
+                bbox=BoundingBox(
+                    l=ocr_rect.l + 1,
+                    t=ocr_rect.t + 2,
+                    r=ocr_rect.l + 3,
+                    b=ocr_rect.t + 4,
+                ),
+            )
+        ]
+
+    def __call__(self, conv_res, page_batch):
+        yield from page_batch
+
+
+def test_ocr_cache_reuses_regions(cache_settings):
+    image = np.arange(300, dtype=np.uint8).reshape(10, 10, 3)
+    model = _CountingOcrModel(EasyOcrOptions())
+
+    cells = model.ocr_region(image, BoundingBox(l=10, t=20, r=20, b=30))
+    # The same region image at another position is taken from the cache.
+    moved = model.ocr_region(image, BoundingBox(l=110, t=220, r=120, b=230))
+    assert model.calls == 1
+    assert moved[0].text == cells[0].text
+    assert moved[0].bbox.as_tuple() == (111, 222, 113, 224)
+
+    # Other images or OCR options are not served from the cache.
+    model.ocr_region(image[::-1], BoundingBox(l=10, t=20, r=20, b=30))
+    assert model.calls == 2
+    other_model = _CountingOcrModel(EasyOcrOptions(lang=["de"]))
+    other_model.ocr_region(image, BoundingBox(l=10, t=20, r=20, b=30))
+    assert other_model.calls == 1
+
+    # Options deciding which regions are OCRed share the cached results.
+    forced_model = _CountingOcrModel(EasyOcrOptions(force_full_page_ocr=True))
+    forced_model.ocr_region(image, BoundingBox(l=10, t=20, r=20, b=30))
+    assert forced_model.calls == 0
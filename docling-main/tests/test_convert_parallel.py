@@ -0,0 +1,131 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from docling import document_converter
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.document import _DocumentConversionInput
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+
+
+def get_input_paths():
+    html_paths = sorted(Path("./tests/data/html/").glob("*.html"))
+    docx_paths = sorted(Path("./tests/data/docx/").glob("*.docx"))
+    return html_paths + docx_paths
+
+
+@pytest.fixture
+def parallel_settings():
+    orig_perf = settings.perf.model_copy()
+    settings.perf.doc_batch_concurrency = 2
+    yield settings.perf
+    settings.perf = orig_perf
+
+
+def get_converter():
+    return DocumentConverter(allowed_formats=[InputFormat.HTML, InputFormat.DOCX])
+
+
+def test_process_pool_input_order(parallel_settings):
+    input_paths = get_input_paths()
+    converter = get_converter()
+
+    # The reference conversion runs sequentially, in this process.
+    parallel_settings.doc_batch_concurrency = 1
+    expected = {
+        res.input.file.name: res.document.export_to_markdown()
+        for res in converter.convert_all(input_paths)
+    }
+
+    parallel_settings.doc_batch_concurrency = 2
+    parallel_settings.doc_batch_ordered = True
+    results = list(converter.convert_all(input_paths))
+
+    assert [res.input.file.name for res in results] == [p.name for p in input_paths]
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+        assert res.document.export_to_markdown() == expected[res.input.file.name]
+
+
+def test_process_pool_completion_order(parallel_settings):
+    input_paths = get_input_paths()
+    converter = get_converter()
+
+    parallel_settings.doc_batch_ordered = False
+    results = list(converter.convert_all(input_paths))
+
+    assert sorted(res.input.file.name for res in results) == sorted(
+        p.name for p in input_paths
+    )
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+
+
+def test_process_pool_prefork(parallel_settings):
+    input_paths = get_input_paths()
+    converter = get_converter()
+
+    parallel_settings.doc_batch_prefork = True
+    results = list(converter.convert_all(input_paths))
+
+    assert [res.input.file.name for res in results] == [p.name for p in input_paths]
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
+    # The pipelines are built in the parent process and inherited by the workers.
+    assert len(converter.initialized_pipelines) == 1
+
+
+def test_prefetch_input_docs(monkeypatch):
+    input_paths = get_input_paths()
+    converter = get_converter()
+
+    expected = [
+        res.document.export_to_markdown() for res in converter.convert_all(input_paths)
+    ]
+
+    opened_in_threads = []
+    guess_format = _DocumentConversionInput._guess_format
+
+    def recording_guess_format(self, obj):
+        opened_in_threads.append(threading.current_thread().name)
+        return guess_format(self, obj)
+
+    monkeypatch.setattr(
+        _DocumentConversionInput, "_guess_format", recording_guess_format
+    )
+    monkeypatch.setattr(settings, "perf", settings.perf.model_copy())
+    settings.perf.doc_prefetch = 2
+
+    results = list(converter.convert_all(input_paths))
+
+    assert [res.input.file.name for res in results] == [p.name for p in input_paths]
+    assert [res.document.export_to_markdown() for res in results] == expected
+    assert opened_in_threads == ["docling-doc-prefetch"] * len(input_paths)
+
+    # Stopping early ends the prefetch thread.
+    conv_res_iter = converter.convert_all(input_paths)
+    assert next(conv_res_iter).status == ConversionStatus.SUCCESS
+    conv_res_iter.close()
+    assert not any(t.name == "docling-doc-prefetch" for t in threading.enumerate())
+
+
+def test_process_pool_early_exit(parallel_settings, monkeypatch):
+    shutdowns = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            shutdowns.append(cancel_futures)
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(document_converter, "ProcessPoolExecutor", RecordingPool)
+    converter = get_converter()
+
+    conv_res_iter = converter.convert_all(get_input_paths() * 3)
+    assert next(conv_res_iter).status == ConversionStatus.SUCCESS
+    conv_res_iter.close()
+
+    # The queued documents are cancelled instead of being converted.
+    assert shutdowns == [True]
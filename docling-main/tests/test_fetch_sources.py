@@ -0,0 +1,197 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+from docling.utils import fetch
+from docling.utils.fetch import fetch_sources
+
+HTML_PATHS = sorted(Path("./tests/data/html/").glob("*.html"))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Serves the html test files, with a few endpoints to exercise the fetching.
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self._respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self):
+        server = self.server
+        name = self.path.rsplit("/", 1)[-1]
+        if self.path.startswith("/slow/"):
+            time.sleep(0.2)
+        elif self.path.startswith("/flaky/"):
+            with server.lock:
+                server.failures[name] = server.failures.get(name, 0) + 1
+                failing = server.failures[name] <= 2
+            if failing:
+                self.send_error(503)
+                return
+        elif self.path.startswith("/missing/"):
+            self.send_error(404)
+            return
+
+        if self.path.startswith("/big/"):
+            data = b"<html><body>" + b"x" * 1_000_000 + b"</body></html>"
+        else:
+            data = Path("./tests/data/html/", name).read_bytes()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(data)))
+        if self.path.startswith("/named/"):
+            self.send_header("Content-Disposition", 'attachment; filename="doc.html"')
+        self.end_headers()
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(fetch, "_RETRY_BACKOFF", 0.01)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.failures = {}
+    httpd.active = 0
+    httpd.max_active = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_fetch_concurrently_in_order(server):
+    urls = [_url(server, f"/slow/{p.name}") for p in HTML_PATHS]
+    local_path = HTML_PATHS[0]
+
+    start = time.monotonic()
+    results = list(
+        fetch_sources(urls[:3] + [local_path] + urls[3:], max_size=10**9, concurrency=4)
+    )
+    elapsed = time.monotonic() - start
+
+    assert [r.name for r in results] == [p.name for p in HTML_PATHS[:3]] + [
+        local_path.name
+    ] + [p.name for p in HTML_PATHS[3:]]
+    for result, path in zip(results[:3], HTML_PATHS):
+        assert result.stream.read() == path.read_bytes()
+    assert results[3] == local_path
+
+    assert server.max_active > 1
+    assert elapsed < 0.2 * len(urls)
+
+
+def test_fetch_completion_order(server):
+    urls = [_url(server, "/slow/example_01.html"), _url(server, "/example_02.html")]
+
+    results = list(fetch_sources(urls, max_size=10**9, ordered=False))
+
+    assert [r.name for r in results] == ["example_02.html", "example_01.html"]
+
+
+def test_fetch_retries(server):
+    results = list(
+        fetch_sources(
+            [_url(server, "/flaky/example_01.html")], max_size=10**9, retries=2
+        )
+    )
+    assert (
+        results[0].stream.read()
+        == Path("./tests/data/html/example_01.html").read_bytes()
+    )
+    assert server.requests.count("/flaky/example_01.html") == 3
+
+    with pytest.raises(requests.HTTPError):
+        list(
+            fetch_sources(
+                [_url(server, "/flaky/example_02.html")], max_size=10**9, retries=1
+            )
+        )
+
+    # Client errors are not retried.
+    with pytest.raises(requests.HTTPError):
+        list(fetch_sources([_url(server, "/missing/example_01.html")], max_size=10**9))
+    assert server.requests.count("/missing/example_01.html") == 1
+
+
+def test_fetch_size_cap_and_name(server):
+    big, named = fetch_sources(
+        [_url(server, "/big/big.html"), _url(server, "/named/example_01.html")],
+        max_size=100_000,
+    )
+    assert 100_000 < len(big.stream.getvalue()) < 1_000_000
+    assert named.name == "doc.html"
+
+
+def test_convert_all_urls(server):
+    converter = DocumentConverter(allowed_formats=[InputFormat.HTML])
+    urls = [_url(server, f"/{p.name}") for p in HTML_PATHS]
+
+    results = list(converter.convert_all(urls))
+
+    assert [res.input.file.name for res in results] == [p.name for p in HTML_PATHS]
+    for res, path in zip(results, HTML_PATHS):
+        assert res.status == ConversionStatus.SUCCESS
+        expected = converter.convert(path).document.export_to_markdown()
+        assert res.document.export_to_markdown() == expected
+
+    # Documents past the size limit are cut off and rejected.
+    results = list(
+        converter.convert_streaming(
+            _url(server, "/big/big.html"),
+            raises_on_error=False,
+            max_file_size=100_000,
+        )
+    )
+    assert results[0].status == ConversionStatus.FAILURE
+
+
+def test_convert_all_urls_in_process_pool(server, monkeypatch):
+    fetched = []
+    fetch_url = fetch.fetch_url
+
+    def recording_fetch_url(session, http_url, **kwargs):
+        fetched.append(http_url.path)
+        return fetch_url(session, http_url, **kwargs)
+
+    monkeypatch.setattr(fetch, "fetch_url", recording_fetch_url)
+    monkeypatch.setattr(settings, "perf", settings.perf.model_copy())
+    settings.perf.doc_batch_concurrency = 2
+
+    converter = DocumentConverter(allowed_formats=[InputFormat.HTML])
+    urls = [_url(server, f"/{p.name}") for p in HTML_PATHS]
+
+    results = list(converter.convert_all(urls))
+
+    # The sources are downloaded in this process, not by the workers.
+    assert sorted(fetched) == sorted(f"/{p.name}" for p in HTML_PATHS)
+    assert [res.input.file.name for res in results] == [p.name for p in HTML_PATHS]
+    for res in results:
+        assert res.status == ConversionStatus.SUCCESS
@@ -1,9 +1,20 @@
+import ctypes
+import gc
+import hashlib
+import os
 from io import BytesIO
 from pathlib import Path
 
+import pytest
+
+from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
-from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel import document
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import DocumentLimits
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.utils.utils import create_file_hash
 
 
 def test_in_doc_from_valid_path():
@@ -39,6 +50,29 @@ def test_in_doc_from_invalid_buf():
     assert doc.valid == False
 
 
+def test_in_doc_hash_from_mapped_data(tmp_path):
+    data = Path("./tests/data/2305.03393v1-pg9.pdf").read_bytes()
+    ref_hash = hashlib.sha256(data).hexdigest()
+
+    doc = _make_input_doc(Path("./tests/data/2305.03393v1-pg9.pdf"))
+    assert doc.valid
+    assert doc.document_hash == ref_hash
+    assert doc.page_count == 1
+    # The backend opened pdfium on the mapped data, and the document let go of it.
+    assert isinstance(doc._backend._pdfium_input, ctypes.Array)
+    assert doc._data is None
+
+    stream = DocumentStream(name="my_doc.pdf", stream=BytesIO(data))
+    doc = _make_input_doc_from_stream(stream)
+    assert doc.valid
+    assert doc.document_hash == ref_hash
+
+    empty_path = tmp_path / "empty.pdf"
+    empty_path.write_bytes(b"")
+    assert create_file_hash(empty_path) == hashlib.sha256(b"").hexdigest()
+    assert not _make_input_doc(empty_path).valid
+
+
 def _make_input_doc(path):
     in_doc = InputDocument(
         path_or_stream=path,
@@ -56,3 +90,98 @@ def _make_input_doc_from_stream(doc_stream):
         backend=PyPdfiumDocumentBackend,
     )
     return in_doc
+
+
+def test_in_doc_page_limit_probe(monkeypatch):
+    test_doc_path = Path("./tests/data/redp5110_sampled.pdf")
+
+    loaded_backends = []
+    init_backend = DoclingParseDocumentBackend.__init__
+
+    def recording_init(self, *args, **kwargs):
+        loaded_backends.append(self)
+        init_backend(self, *args, **kwargs)
+
+    monkeypatch.setattr(DoclingParseDocumentBackend, "__init__", recording_init)
+
+    def make_doc(max_num_pages):
+        return InputDocument(
+            path_or_stream=test_doc_path,
+            format=InputFormat.PDF,
+            backend=DoclingParseDocumentBackend,
+            limits=DocumentLimits(max_num_pages=max_num_pages),
+        )
+
+    # The page count is probed before the backend is loaded, documents over the
+    # limit never load it.
+    doc = make_doc(max_num_pages=2)
+    assert not doc.valid
+    assert doc.page_count == 18
+    assert loaded_backends == []
+
+    doc = make_doc(max_num_pages=18)
+    assert doc.valid
+    assert doc.page_count == 18
+    assert len(loaded_backends) == 1
+
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(backend=DoclingParseDocumentBackend)
+        }
+    )
+    conv_res = next(
+        converter.convert_all([test_doc_path], raises_on_error=False, max_num_pages=2)
+    )
+    assert conv_res.status == ConversionStatus.FAILURE
+    assert len(loaded_backends) == 1
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="needs /proc to count descriptors"
+)
+def test_deferred_in_doc_maps_file_once(monkeypatch):
+    test_doc_path = Path("./tests/data/2305.03393v1-pg9.pdf")
+
+    mapped = []
+    map_file_data = document.map_file_data
+
+    def recording_map_file_data(path_or_stream):
+        mapped.append(map_file_data(path_or_stream))
+        return mapped[-1]
+
+    monkeypatch.setattr(document, "map_file_data", recording_map_file_data)
+
+    gc.collect()
+    num_fds = len(os.listdir("/proc/self/fd"))
+    docs = [
+        InputDocument(
+            path_or_stream=test_doc_path,
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+            defer_backend=True,
+        )
+        for _ in range(3)
+    ]
+    assert len(mapped) == 3
+
+    # The mapping used for the hash is the input of pdfium.
+    docs[0].load_backend()
+    assert docs[0].valid
+    assert docs[0].page_count == 1
+    assert docs[0]._backend._pdfium_input is mapped[0]
+    assert docs[0]._data is None
+    assert len(mapped) == 3
+
+    # Documents whose backend is not loaded, e.g. cache hits, let go of the file.
+    del mapped[:]
+    for doc in docs[1:]:
+        doc.release()
+        assert doc._data is None
+        doc.load_backend()
+        assert not hasattr(doc, "_backend")
+    assert len(os.listdir("/proc/self/fd")) == num_fds + 1
+
+    docs[0]._backend.unload()
+    del doc, docs
+    gc.collect()
+    assert len(os.listdir("/proc/self/fd")) == num_fds
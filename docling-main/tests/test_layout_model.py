@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from docling.datamodel.base_models import Page
+from docling.models import layout_model
+from docling.models.layout_model import LayoutModel
+
+
+def _get_pages(sizes):
+    pages = []
+    for page_no, (size, color) in enumerate(sizes):
+        page = Page(page_no=page_no)
+        page._image_cache = {1.0: Image.new("RGB", size, color)}
+        pages.append(page)
+    return pages
+
+
+class _PagePredictor:
+    # Predicts the page image size, one page at a time.
+    def predict(self, orig_img):
+        w, h = orig_img.size
+        yield {"l": 0, "t": 0, "r": w, "b": h, "label": "Text", "confidence": 0.9}
+
+
+def test_supports_batched_predict(monkeypatch):
+    class _Predictor:
+        model = None
+        _classes_map: dict = {}
+        _black_classes: set = set()
+        _threshold = 0.3
+
+    monkeypatch.setattr(layout_model, "version", lambda name: "2.0.3")
+    assert layout_model._supports_batched_predict(_Predictor())
+    assert not layout_model._supports_batched_predict(_PagePredictor())
+
+    monkeypatch.setattr(layout_model, "version", lambda name: "3.0.0")
+    assert not layout_model._supports_batched_predict(_Predictor())
+
+
+def test_batched_predict_falls_back_per_batch():
+    model = LayoutModel(artifacts_path=Path("."))
+    model._layout_predictor = _PagePredictor()  # type: ignore
+    model._batched_predict = True
+
+    batch_calls = []
+
+    def _predict_batch(images):
+        batch_calls.append(len(images))
+        if len(batch_calls) == 1:
+            raise RuntimeError("out of memory")
+        return [[] for _ in images]
+
+    model._predict_batch = _predict_batch  # type: ignore
+
+    pages = _get_pages([((20, 10), "white"), ((30, 15), "white")])
+
+    # The failing batch is predicted page by page.
+    predictions = model._predict_pages(pages)
+    assert [[p["r"] for p in preds] for preds in predictions] == [[20], [30]]
+
+    # The following batches are still predicted together.
+    assert model._predict_pages(pages) == [[], []]
+    assert batch_calls == [2, 2]
+    assert model._batched_predict
+
+
+def test_batched_predict_matches_predict():
+    torch = pytest.importorskip("torch", minversion="2.0")
+    T = pytest.importorskip("torchvision.transforms")
+
+    class _Detector:
+        # Detections derived from each page image and its original size.
+        def __call__(self, images, orig_sizes):
+            labels, boxes, scores = [], [], []
+            for image, (w, h) in zip(images, orig_sizes.tolist()):
+                level = float(image.mean())
+                labels.append(torch.tensor([0, 1, 2]))
+                boxes.append(
+                    torch.tensor(
+                        [
+                            [-5.0, 10 * level, w / 2, h + 5],
+                            [1.0, 1.0, w, h],
+                            [0.0, 0.0, 1.0, 1.0],
+                        ]
+                    )
+                )
+                scores.append(torch.tensor([0.9, 0.8, 0.1]))
+            return torch.stack(labels), torch.stack(boxes), torch.stack(scores)
+
+    class _Predictor:
+        _classes_map = {1: "Text", 2: "Page-header", 3: "Picture"}
+        _black_classes = {"Page-header"}
+        _threshold = 0.3
+
+        def __init__(self):
+            self.model = _Detector()
+
+        def predict(self, orig_img):
+            # As LayoutPredictor.predict() of docling-ibm-models 2.x
+            page_img = orig_img.convert("RGB")
+            w, h = page_img.size
+            orig_size = torch.tensor([w, h])[None]
+            transforms = T.Compose([T.Resize((640, 640)), T.ToTensor()])
+            img = transforms(page_img)[None]
+            with torch.no_grad():
+                labels, boxes, scores = self.model(img, orig_size)
+            for label_idx, box, score in zip(labels[0], boxes[0], scores[0]):
+                label = self._classes_map[label_idx.item() + 1]
+                confidence = score.item()
+                if label in self._black_classes:
+                    continue
+                if confidence > self._threshold:
+                    yield {
+                        "l": min(w, max(0, box[0])),
+                        "t": min(h, max(0, box[1])),
+                        "r": min(w, max(0, box[2])),
+                        "b": min(h, max(0, box[3])),
+                        "label": label,
+                        "confidence": confidence,
+                    }
+
+    def _as_floats(predictions):
+        return [
+            [
+                {k: v if k == "label" else float(v) for k, v in pred.items()}
+                for pred in preds
+            ]
+            for preds in predictions
+        ]
+
+    model = LayoutModel(artifacts_path=Path("."))
+    model._layout_predictor = _Predictor()  # type: ignore
+    model._batched_predict = True
+
+    pages = _get_pages(
+        [((200, 100), "white"), ((120, 300), "black"), ((50, 50), "gray")]
+    )
+    images = [page.get_image(scale=1.0) for page in pages]
+
+    batched = model._predict_pages(pages)
+    per_page = [list(model.layout_predictor.predict(image)) for image in images]
+
+    assert len(batched) == 3
+    assert _as_floats(batched) == _as_floats(per_page)
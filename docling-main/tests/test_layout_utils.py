@@ -0,0 +1,106 @@
+import copy
+import random
+
+import numpy as np
+
+from docling.utils import layout_utils as lu
+
+
+def _random_boxes(rnd, count, max_size):
+    boxes = []
+    for _ in range(count):
+        x0, y0 = rnd.uniform(0, 600), rnd.uniform(0, 800)
+        boxes.append(
+            [x0, y0, x0 + rnd.uniform(0, max_size), y0 + rnd.uniform(0, max_size)]
+        )
+    return boxes
+
+
+def _reference_enclosed_cells(cluster_bbox, raw_cells, threshold):
+    cell_ids = []
+    for ix, cell in enumerate(raw_cells):
+        cell_bbox = cell["bbox"]
+        intersection = lu.compute_intersection(cell_bbox, cluster_bbox)
+        frac_area = lu.area(cell_bbox) * threshold
+        if (intersection > frac_area and frac_area > 0) or lu.contains(
+            cluster_bbox,
+            [cell_bbox[0] + 3, cell_bbox[1] + 3, cell_bbox[2] - 3, cell_bbox[3] - 3],
+        ):
+            cell_ids.append(ix)
+    return cell_ids
+
+
+def _reference_duplicates(clusters, threshold):
+    deleted = set()
+    for c1 in clusters:
+        for c2 in clusters:
+            if c1["id"] != c2["id"] and c1["confidence"] > c2["confidence"]:
+                b2 = c2["bbox"]
+                if lu.bb_iou(c1["bbox"], b2) > threshold or lu.contains(
+                    c1["bbox"], [b2[0] + 3, b2[1] + 3, b2[2] - 3, b2[3] - 3]
+                ):
+                    deleted.add(c2["id"])
+    return [c for c in clusters if c["id"] not in deleted]
+
+
+def test_vectorized_cluster_passes_match_reference():
+    rnd = random.Random(42)
+    for _ in range(50):
+        raw_cells = [
+            {"id": ix, "bbox": bbox, "text": "x"}
+            for ix, bbox in enumerate(_random_boxes(rnd, rnd.randint(0, 200), 60))
+        ]
+        clusters = [
+            {"id": ix, "bbox": bbox, "confidence": rnd.random(), "cell_ids": []}
+            for ix, bbox in enumerate(_random_boxes(rnd, rnd.randint(0, 30), 300))
+        ]
+
+        assigned = lu.assigning_cell_ids_to_clusters(
+            copy.deepcopy(clusters), raw_cells, 0.2
+        )
+        for cluster in assigned:
+            assert cluster["cell_ids"] == _reference_enclosed_cells(
+                cluster["bbox"], raw_cells, 0.2
+            )
+
+        assert lu.remove_cluster_duplicates_by_conf(
+            copy.deepcopy(clusters), 0.8
+        ) == _reference_duplicates(clusters, 0.8)
+
+
+def test_cell_bbox_arrays_match_bounding_box():
+    from docling_core.types.doc import BoundingBox, CoordOrigin
+
+    from docling.datamodel.base_models import Cell
+    from docling.models.layout_model import (
+        _bboxes_to_top_left,
+        _cell_bboxes_bottom_left,
+    )
+
+    rnd = random.Random(7)
+    page_height = 792.0
+    cells = [
+        Cell(
+            id=ix,
+            text="",
+            bbox=BoundingBox.from_tuple(
+                tuple(box), origin=rnd.choice(list(CoordOrigin))
+            ),
+        )
+        for ix, box in enumerate(_random_boxes(rnd, 200, 40))
+    ]
+
+    bottom_left = _cell_bboxes_bottom_left(cells, page_height)
+    assert bottom_left.tolist() == [
+        list(c.bbox.to_bottom_left_origin(page_height).as_tuple()) for c in cells
+    ]
+
+    boxes = _random_boxes(rnd, 200, 40) + [[50.0, 60.0, 10.0, 20.0]]
+    assert _bboxes_to_top_left(np.array(boxes), page_height).tolist() == [
+        list(
+            BoundingBox.from_tuple(tuple(box), origin=CoordOrigin.BOTTOMLEFT)
+            .to_top_left_origin(page_height)
+            .as_tuple()
+        )
+        for box in boxes
+    ]
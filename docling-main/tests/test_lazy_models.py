@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, LayoutPrediction, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.models.layout_model import LayoutModel
+from docling.models.table_structure_model import TableStructureModel
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+
+
+def test_pipeline_init_does_not_load_models(tmp_path):
+    # No model artifacts exist in tmp_path, loading any model would fail.
+    pipeline_options = PdfPipelineOptions(artifacts_path=tmp_path)
+    pipeline = StandardPdfPipeline(pipeline_options)
+
+    layout_model = next(m for m in pipeline.build_pipe if isinstance(m, LayoutModel))
+    table_model = next(
+        m for m in pipeline.build_pipe if isinstance(m, TableStructureModel)
+    )
+    assert layout_model._layout_predictor is None
+    assert table_model._tf_predictor is None
+    assert pipeline.glm_model._model is None
+
+
+def test_table_model_skips_loading_without_tables(tmp_path):
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+
+    page = Page(page_no=0)
+    page._backend = in_doc._backend.load_page(0)
+    page.size = page._backend.get_size()
+    page.predictions.layout = LayoutPrediction(clusters=[])
+
+    model = TableStructureModel(
+        enabled=True,
+        artifacts_path=tmp_path,
+        options=PdfPipelineOptions().table_structure_options,
+    )
+    out_pages = list(model(conv_res, [page]))
+
+    assert out_pages[0].predictions.tablestructure is not None
+    assert len(out_pages[0].predictions.tablestructure.table_map) == 0
+    assert model._tf_predictor is None
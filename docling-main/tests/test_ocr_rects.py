@@ -0,0 +1,183 @@
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+from docling_core.types.doc import BoundingBox, Size
+from PIL import Image, ImageDraw
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, OcrCell, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import EasyOcrOptions
+from docling.datamodel.settings import settings
+from docling.models.base_ocr_model import (
+    BaseOcrModel,
+    _bitmap_components,
+    _estimate_text_height,
+)
+
+
+def _reference_components(boxes, width, height):
+    ndimage = pytest.importorskip("scipy.ndimage")
+
+    image = Image.new("1", (width, height))
+    draw = ImageDraw.Draw(image)
+    for x0, y0, x1, y1 in boxes:
+        draw.rectangle([(x0, y0), (x1, y1)], fill=1)
+
+    np_image = np.array(image)
+    labeled_image, _ = ndimage.label(np_image > 0)
+    components = [
+        [slc[1].start, slc[0].start, slc[1].stop - 1, slc[0].stop - 1]
+        for slc in ndimage.find_objects(labeled_image)
+    ]
+    return int(np.sum(np_image > 0)), components
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_bitmap_components_match_labeling(seed):
+    rnd = random.Random(seed)
+    width, height = rnd.randint(50, 300), rnd.randint(50, 300)
+
+    boxes = []
+    for _ in range(rnd.randint(0, 40)):
+        x0, y0 = rnd.randint(-20, width), rnd.randint(-20, height)
+        # Include single pixel lines and boxes sharing only an edge or a corner.
+        boxes.append(
+            [x0, y0, x0 + rnd.randint(0, 60), y0 + rnd.randint(0, 60)]
+            if rnd.random() < 0.7
+            else [x0, y0, x0 + rnd.choice([0, 1]), y0 + rnd.randint(0, 3)]
+        )
+    if boxes and seed % 2 == 0:
+        x0, y0, x1, y1 = boxes[0]
+        boxes.append([x1 + 1, y0, x1 + 5, y1])  # touching edge: connected
+        boxes.append([x1 + 6, y1 + 1, x1 + 9, y1 + 4])  # touching corner: not
+
+    covered_pixels, components = _bitmap_components(
+        np.array(boxes, dtype=np.int64), width, height
+    )
+    assert (covered_pixels, components.tolist()) == _reference_components(
+        boxes, width, height
+    )
+
+
+def test_bitmap_components_many_boxes():
+    # More box edges than page pixels, the union area is taken from a page mask.
+    rnd = random.Random(0)
+    boxes = [
+        [x0, y0, x0 + rnd.randint(0, 2), y0 + rnd.randint(0, 2)]
+        for x0, y0 in ((rnd.randint(0, 20), rnd.randint(0, 20)) for _ in range(300))
+    ]
+    covered_pixels, components = _bitmap_components(np.array(boxes), 20, 20)
+    assert (covered_pixels, components.tolist()) == _reference_components(boxes, 20, 20)
+
+
+def _lines_image(width, height, line_height, gap):
+    # Two columns of text lines with shifted baselines
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    for x0, offset in ((5, 0), (width // 2 + 5, line_height // 2)):
+        for y0 in range(5 + offset, height - line_height, line_height + gap):
+            draw.rectangle(
+                [(x0, y0), (x0 + width // 2 - 15, y0 + line_height - 1)], fill="black"
+            )
+    return image
+
+
+class _OcrModel(BaseOcrModel):
+    def __init__(self, **options):
+        super().__init__(enabled=True, options=EasyOcrOptions(**options))
+        self.scale = 3
+
+    def _ocr_region(self, image, ocr_rect, scale):
+        return []
+
+    def __call__(self, conv_res, page_batch):
+        yield from page_batch
+
+
+def test_estimate_text_height():
+    image = np.asarray(_lines_image(200, 300, line_height=12, gap=6))
+    assert _estimate_text_height(image) == 12
+    assert _estimate_text_height(np.full((50, 50, 3), 255, dtype=np.uint8)) is None
+
+
+@pytest.mark.parametrize(
+    "line_height,expected_scale", [(6, 3.0), (12, 3.0), (20, 2.0), (40, 1.0)]
+)
+def test_adaptive_region_scale(line_height, expected_scale):
+    page = Page(page_no=0, size=Size(width=300, height=400))
+    page._image_cache = {
+        1.0: _lines_image(300, 400, line_height=line_height, gap=line_height // 2)
+    }
+    ocr_rect = BoundingBox(l=0, t=0, r=300, b=400)
+
+    assert _OcrModel().get_region_scale(page, ocr_rect) == 3
+    model = _OcrModel(adaptive_scale=True)
+    assert model.get_region_scale(page, ocr_rect) == expected_scale
+
+
+class _ThumbnailOcrModel(_OcrModel):
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.scales = []
+
+    def _ocr_region(self, image, ocr_rect, scale):
+        # A confident cell for images with ink, low confidence noise otherwise.
+        self.scales.append(scale)
+        has_ink = np.asarray(image).min() < 128
+        return [
+            OcrCell(
+                id=0,
+                text="text" if has_ink else "~",
+                confidence=0.9 if has_ink else 0.1,
+                bbox=ocr_rect,
+            )
+        ]
+
+
+def test_thumbnail_skips_blank_pages():
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+    )
+    blank_page = Page(page_no=0, size=Size(width=300, height=400))
+    blank_page._image_cache = {1.0: Image.new("RGB", (300, 400), "white")}
+    text_page = Page(page_no=1, size=Size(width=300, height=400))
+    text_page._image_cache = {1.0: _lines_image(300, 400, line_height=12, gap=6)}
+    full_rect = BoundingBox(l=0, t=0, r=300, b=400)
+    small_rect = BoundingBox(l=10, t=10, r=100, b=100)
+
+    model = _ThumbnailOcrModel()
+    assert model.skip_blank_regions(conv_res, blank_page, [full_rect]) == [full_rect]
+    assert model.scales == []
+
+    model = _ThumbnailOcrModel(thumbnail_scale=0.5)
+    orig_profile = settings.debug.profile_pipeline_timings
+    settings.debug.profile_pipeline_timings = True
+    try:
+        assert model.skip_blank_regions(conv_res, blank_page, [full_rect]) == []
+        assert model.skip_blank_regions(conv_res, text_page, [full_rect]) == [full_rect]
+        # Only the full page regions are checked on a thumbnail.
+        assert model.skip_blank_regions(conv_res, blank_page, [small_rect]) == [
+            small_rect
+        ]
+    finally:
+        settings.debug.profile_pipeline_timings = orig_profile
+
+    assert model.scales == [0.5, 0.5]
+    assert conv_res.timings["ocr_thumbnail"].count == 2
+    assert conv_res.timings["ocr_thumbnail_skipped"].count == 1
+
+
+def test_ocr_region_is_required():
+    class _IncompleteOcrModel(BaseOcrModel):
+        def __call__(self, conv_res, page_batch):
+            yield from page_batch
+
+    with pytest.raises(TypeError):
+        _IncompleteOcrModel(enabled=True, options=EasyOcrOptions())
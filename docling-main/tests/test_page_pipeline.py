@@ -0,0 +1,373 @@
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pytest
+from docling_core.types.doc import BoundingBox, DocItemLabel
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cell,
+    Cluster,
+    FigureElement,
+    InputFormat,
+    Page,
+    Table,
+    TextElement,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.datamodel.settings import DocumentLimits, settings
+from docling.models.base_model import BasePageModel
+from docling.pipeline.base_pipeline import PaginatedPipeline
+
+
+class _RecordingModel(BasePageModel):
+    def __init__(self, name: str, fail_on_page: int = -1):
+        self.name = name
+        self.fail_on_page = fail_on_page
+        self.threads = set()
+        self.page_nos = []
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            self.threads.add(threading.current_thread().name)
+            if page.page_no == self.fail_on_page:
+                raise ValueError(f"{self.name} failed on page {page.page_no}")
+            time.sleep(0.001)
+            self.page_nos.append(page.page_no)
+            page.cells = [
+                *page.cells,
+                Cell(
+                    id=len(page.cells),
+                    text=self.name,
+                    bbox=BoundingBox(l=0, t=0, r=1, b=1),
+                ),
+            ]
+            yield page
+
+
+class _DummyPipeline(PaginatedPipeline):
+    def __init__(self, models, fingerprints=None):
+        super().__init__(PdfPipelineOptions())
+        self.build_pipe = models
+        self.fingerprints = fingerprints or [None] * len(models)
+
+    def _get_page_stage_fingerprints(self):
+        return self.fingerprints
+
+    def initialize_page(self, conv_res: ConversionResult, page: Page) -> Page:
+        if page.page_no < conv_res.input.page_count:
+            page._backend = conv_res.input._backend.load_page(page.page_no)
+        return page
+
+    @classmethod
+    def get_default_options(cls):
+        return PdfPipelineOptions()
+
+    @classmethod
+    def is_backend_supported(cls, backend):
+        return True
+
+
+@pytest.fixture
+def conv_res():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    return ConversionResult(input=in_doc)
+
+
+def test_staged_pages_keep_order(conv_res):
+    models = [_RecordingModel(f"stage-{i}") for i in range(3)]
+    pipeline = _DummyPipeline(models)
+    pages = [Page(page_no=i) for i in range(25)]
+
+    out_pages = list(pipeline._apply_on_pages_staged(conv_res, pages))
+
+    assert [p.page_no for p in out_pages] == list(range(25))
+    # every model ran in its own worker thread
+    model_threads = [m.threads for m in models]
+    assert all(len(t) == 1 for t in model_threads)
+    assert len(set.union(*model_threads)) == len(models)
+
+
+def test_staged_pages_raise_stage_error(conv_res):
+    models = [
+        _RecordingModel("stage-0"),
+        _RecordingModel("stage-1", fail_on_page=7),
+        _RecordingModel("stage-2"),
+    ]
+    pipeline = _DummyPipeline(models)
+    pages = [Page(page_no=i) for i in range(50)]
+
+    orig_concurrency = settings.perf.page_batch_concurrency
+    settings.perf.page_batch_concurrency = 1  # smallest queues
+    try:
+        with pytest.raises(ValueError, match="stage-1 failed on page 7"):
+            list(pipeline._apply_on_pages_staged(conv_res, pages))
+    finally:
+        settings.perf.page_batch_concurrency = orig_concurrency
+
+    assert not any(
+        t.name.startswith("docling-page-stage") for t in threading.enumerate()
+    )
+
+
+def test_page_cache_resumes_pages(conv_res, tmp_path):
+    def run(fingerprints):
+        models = [_RecordingModel(f"stage-{i}") for i in range(3)]
+        pipeline = _DummyPipeline(models, fingerprints=fingerprints)
+        pages = [Page(page_no=i) for i in range(conv_res.input.page_count)]
+        out_pages = list(pipeline._apply_on_pages_staged(conv_res, pages))
+        return [m.page_nos for m in models], [c.text for c in out_pages[0].cells]
+
+    orig_cache = settings.cache.model_copy()
+    settings.cache.cache_dir = str(tmp_path)
+    try:
+        seen, texts = run([None, "a", "b"])
+        assert seen == [[0], [0], [0]]
+        assert texts == ["stage-0", "stage-1", "stage-2"]
+
+        # Stages without fingerprint always run, the others are restored.
+        seen, texts = run([None, "a", "b"])
+        assert seen == [[0], [], []]
+        assert texts == ["stage-0", "stage-1", "stage-2"]
+
+        # A changed fingerprint re-runs the stage, resuming from the previous one.
+        seen, texts = run([None, "a", "c"])
+        assert seen == [[0], [], [0]]
+        assert texts == ["stage-0", "stage-1", "stage-2"]
+    finally:
+        settings.cache = orig_cache
+
+
+def test_page_cache_drops_unreadable_pages(conv_res, tmp_path):
+    def run():
+        models = [_RecordingModel(f"stage-{i}") for i in range(3)]
+        pipeline = _DummyPipeline(models, fingerprints=[None, "a", "b"])
+        pages = [Page(page_no=i) for i in range(conv_res.input.page_count)]
+        out_pages = list(pipeline._apply_on_pages_staged(conv_res, pages))
+        return [m.page_nos for m in models], [c.text for c in out_pages[0].cells]
+
+    orig_cache = settings.cache.model_copy()
+    settings.cache.cache_dir = str(tmp_path)
+    try:
+        run()
+        entry_paths = [p for p in (tmp_path / "pages").rglob("*") if p.is_file()]
+        assert len(entry_paths) == 2
+        for entry_path in entry_paths:
+            entry_path.write_bytes(b'{"size": {"width": ')
+
+        # Unreadable entries are discarded and their stages run again.
+        seen, texts = run()
+        assert seen == [[0], [0], [0]]
+        assert texts == ["stage-0", "stage-1", "stage-2"]
+
+        seen, texts = run()
+        assert seen == [[0], [], []]
+    finally:
+        settings.cache = orig_cache
+
+
+class _AssembleModel(_RecordingModel):
+    def __init__(self):
+        super().__init__("assemble")
+        self.restored = []
+
+    def __call__(self, conv_res, page_batch):
+        for page in super().__call__(conv_res, page_batch):
+            cluster = Cluster(
+                id=0, label=DocItemLabel.TEXT, bbox=BoundingBox(l=0, t=0, r=1, b=1)
+            )
+            text = TextElement(
+                label=DocItemLabel.TEXT,
+                id=0,
+                page_no=page.page_no,
+                cluster=cluster,
+                text="text",
+            )
+            table = Table(
+                label=DocItemLabel.TABLE,
+                id=1,
+                page_no=page.page_no,
+                cluster=cluster,
+                text="",
+                otsl_seq=["fcel", "nl"],
+                table_cells=[],
+            )
+            figure = FigureElement(
+                label=DocItemLabel.PICTURE, id=2, page_no=page.page_no, cluster=cluster
+            )
+            page.assembled = AssembledUnit(
+                elements=[text, table, figure], body=[text, table, figure]
+            )
+            yield page
+
+    def on_page_restored(self, conv_res, page):
+        self.restored.append(page.page_no)
+
+
+def test_page_cache_restores_assembled_pages(conv_res, tmp_path):
+    def run():
+        models = [_RecordingModel("stage-0"), _AssembleModel()]
+        pipeline = _DummyPipeline(models, fingerprints=[None, "assemble"])
+        pages = [Page(page_no=i) for i in range(conv_res.input.page_count)]
+        out_pages = list(pipeline._apply_on_pages_staged(conv_res, pages))
+        return models[-1], out_pages[0]
+
+    orig_cache = settings.cache.model_copy()
+    settings.cache.cache_dir = str(tmp_path)
+    try:
+        model, page = run()
+        assert model.page_nos == [0]
+        assert model.restored == []
+        expected = page.assembled
+
+        # The assembled elements are restored, with their types.
+        model, page = run()
+        assert model.page_nos == []
+        assert model.restored == [0]
+        assert [type(el) for el in page.assembled.elements] == [
+            TextElement,
+            Table,
+            FigureElement,
+        ]
+        assert page.assembled == expected
+    finally:
+        settings.cache = orig_cache
+
+
+def test_execute_pages_yields_fragments():
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/redp5110_sampled.pdf"),
+        format=InputFormat.PDF,
+        backend=PyPdfiumDocumentBackend,
+    )
+    models = [_RecordingModel(f"stage-{i}") for i in range(2)]
+    pipeline = _DummyPipeline(models)
+
+    orig_batch_size = settings.perf.page_batch_size
+    settings.perf.page_batch_size = 3
+    try:
+        fragments = list(pipeline.execute_pages(in_doc, raises_on_error=True))
+    finally:
+        settings.perf.page_batch_size = orig_batch_size
+
+    page_nos = list(range(in_doc.page_count))
+    assert in_doc.page_count > 3
+    assert [[p.page_no for p in f.pages] for f in fragments] == [
+        page_nos[i : i + 3] for i in range(0, len(page_nos), 3)
+    ]
+    assert models[-1].page_nos == page_nos
+
+
+def test_page_images_render_once(conv_res):
+    page_backend = conv_res.input._backend.load_page(0)
+    rendered = []
+    get_page_image = page_backend.get_page_image
+
+    def counting_get_page_image(scale=1, cropbox=None):
+        rendered.append((scale, cropbox is not None))
+        return get_page_image(scale=scale, cropbox=cropbox)
+
+    page_backend.get_page_image = counting_get_page_image
+    page = Page(page_no=0, size=page_backend.get_size())
+    page._backend = page_backend
+
+    full = page.get_image(scale=2.0)
+    small = page.get_image(scale=1.0)
+    crop = page.get_image(scale=2.0, cropbox=BoundingBox(l=10, t=20, r=110, b=70))
+    thumbnail = page.get_image(scale=0.5)
+    # The model input scales are rendered, thumbnails and crops are derived.
+    assert rendered == [(2.0, False), (1.0, False)]
+    assert full.size == (round(page.size.width * 2), round(page.size.height * 2))
+    assert small.size == (round(page.size.width), round(page.size.height))
+    assert crop.size == (200, 100)
+    assert thumbnail.size == (round(page.size.width / 2), round(page.size.height / 2))
+
+    # A crop at a scale without page image is rendered on its own.
+    page.get_image(scale=3.0, cropbox=BoundingBox(l=10, t=20, r=110, b=70))
+    assert rendered == [(2.0, False), (1.0, False), (3.0, True)]
+
+    # Released scales are dropped, except the default one.
+    page.get_image_array(scale=2.0)
+    page._release_image(2.0)
+    page._release_image(1.0)
+    assert sorted(page._image_cache) == [0.5, 1.0]
+    assert 2.0 not in page._image_array_cache
+    page_backend.unload()
+
+
+def test_page_image_arrays_are_shared(conv_res):
+    page_backend = conv_res.input._backend.load_page(0)
+    page = Page(page_no=0, size=page_backend.get_size())
+    page._backend = page_backend
+
+    page_array = page.get_image_array(scale=2.0)
+    crop = page.get_image_array(scale=2.0, cropbox=BoundingBox(l=10, t=20, r=110, b=70))
+    assert page.get_image_array(scale=2.0) is page_array
+    assert crop.shape[:2] == (100, 200)
+    assert np.shares_memory(crop, page_array)
+    assert (crop == np.asarray(page.get_image(scale=2.0))[40:140, 20:220]).all()
+
+    # Crops which are not in the cached images come from the backend.
+    crop = page.get_image_array(scale=3.0, cropbox=BoundingBox(l=10, t=20, r=110, b=70))
+    assert crop.shape[:2] == (150, 300)
+
+    # Crops past the page borders are padded, like the crops of the page image.
+    width, height = page.size.width, page.size.height
+    for cropbox in [
+        BoundingBox(l=-10, t=-5, r=90, b=45),
+        BoundingBox(l=width - 50, t=height - 20, r=width + 10, b=height + 30),
+        BoundingBox(l=-10, t=-5, r=width + 10, b=height + 5),
+    ]:
+        crop = page.get_image_array(scale=2.0, cropbox=cropbox)
+        expected = np.asarray(page.get_image(scale=2.0, cropbox=cropbox))
+        assert crop.shape == expected.shape
+        assert (crop == expected).all()
+    page_backend.unload()
+
+
+def test_page_selection():
+    def make_doc(**limits):
+        return InputDocument(
+            path_or_stream=Path("./tests/data/redp5110_sampled.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+            limits=DocumentLimits(**limits),
+        )
+
+    in_doc = make_doc(page_range=(2, 10), page_numbers=[1, 3, 5, 12])
+    assert in_doc.valid
+    assert in_doc.page_count == 18
+    assert in_doc.get_page_nos() == [2, 4]
+
+    models = [_RecordingModel("stage-0")]
+    conv_res = _DummyPipeline(models).execute(in_doc, raises_on_error=True)
+    assert [p.page_no for p in conv_res.pages] == [2, 4]
+    assert models[0].page_nos == [2, 4]
+
+    in_doc = make_doc(page_range=(16, 100))
+    models = [_RecordingModel("stage-0")]
+    fragments = list(_DummyPipeline(models).execute_pages(in_doc, raises_on_error=True))
+    assert [p.page_no for f in fragments for p in f.pages] == [15, 16, 17]
+    assert models[0].page_nos == [15, 16, 17]
+
+    # The page limit applies to the selected pages.
+    assert make_doc(page_range=(1, 3), max_num_pages=3).valid
+    assert not make_doc(page_range=(1, 4), max_num_pages=3).valid
+    # No selected pages.
+    assert not make_doc(page_range=(19, 20)).valid
+
+    with pytest.raises(ValueError):
+        DocumentLimits(page_range=(3, 2))
+    with pytest.raises(ValueError):
+        DocumentLimits(page_numbers=[0])
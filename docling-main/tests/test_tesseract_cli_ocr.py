@@ -0,0 +1,152 @@
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import BoundingBox, Size
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TesseractCliOcrOptions
+from docling.datamodel.settings import settings
+from docling.models.tesseract_ocr_cli_model import (
+    TesseractOcrCliModel,
+    parse_tesseract_tsv,
+)
+
+# Prints one word per image, with the image size as text, and logs its calls.
+FAKE_TESSERACT = """#!{python}
+import sys
+from PIL import Image
+
+if sys.argv[1] == "--version":
+    print("tesseract 5.3.0")
+    sys.exit(0)
+
+ifilename = sys.argv[-3]
+with open({log!r}, "a") as log:
+    log.write(ifilename + "\\n")
+
+if ifilename == "stdin":
+    images = [Image.open(sys.stdin.buffer)]
+else:
+    with open(ifilename) as fr:
+        images = [Image.open(line.strip()) for line in fr if line.strip()]
+
+header = "level page_num block_num par_num line_num word_num left top width height conf text"
+print("\\t".join(header.split()))
+for page_num, image in enumerate(images, start=1):
+    print(f"1\\t{{page_num}}\\t0\\t0\\t0\\t0\\t0\\t0\\t{{image.width}}\\t{{image.height}}\\t-1\\t")
+    print(f"5\\t{{page_num}}\\t1\\t1\\t1\\t1\\t3\\t6\\t9\\t12\\t90\\t{{image.width}}x{{image.height}}")
+"""
+
+
+@pytest.fixture
+def fake_tesseract(tmp_path):
+    log_path = tmp_path / "calls.log"
+    cmd_path = tmp_path / "tesseract"
+    cmd_path.write_text(FAKE_TESSERACT.format(python=sys.executable, log=str(log_path)))
+    cmd_path.chmod(cmd_path.stat().st_mode | stat.S_IEXEC)
+    return str(cmd_path), log_path
+
+
+def test_parse_tesseract_tsv():
+    data = (
+        "level\tpage_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+        "1\t1\t0\t0\t100\t50\t-1\t\n"
+        '5\t1\t3\t4\t5\t6\t95.5\t"quoted\n'
+        "5\t2\t3\t4\t5\t6\t90\t0042\n"
+    )
+    rows = parse_tesseract_tsv(data)
+    assert [row["text"] for row in rows] == ["", '"quoted', "0042"]
+    assert rows[1]["conf"] == "95.5"
+    assert parse_tesseract_tsv("") == []
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_tesseract_cli_batches_regions(fake_tesseract, concurrency):
+    cmd, log_path = fake_tesseract
+    model = TesseractOcrCliModel(
+        enabled=True, options=TesseractCliOcrOptions(tesseract_cmd=cmd)
+    )
+
+    sizes = [(30 + ix, 20 + ix) for ix in range(5)]
+    images = [Image.new("RGB", size, "white") for size in sizes]
+    ocr_rects = [
+        BoundingBox(l=10 * ix, t=100, r=10 * ix + 10, b=110) for ix in range(5)
+    ]
+
+    orig_perf = settings.perf.model_copy()
+    settings.perf.ocr_batch_size = 2
+    settings.perf.ocr_concurrency = concurrency
+    try:
+        results = model.ocr_regions(images, ocr_rects)
+    finally:
+        settings.perf = orig_perf
+
+    # Batches of two images are passed as file lists, the last single image via stdin.
+    calls = log_path.read_text().split()
+    assert len(calls) == 3
+    assert sorted(calls).count("stdin") == 1
+
+    assert [[cell.text for cell in cells] for cells in results] == [
+        [f"{w}x{h}"] for w, h in sizes
+    ]
+    for cells, ocr_rect in zip(results, ocr_rects):
+        assert cells[0].id == 1
+        assert cells[0].confidence == 0.9
+        assert cells[0].bbox.as_tuple() == (
+            ocr_rect.l + 1,
+            ocr_rect.t + 2,
+            ocr_rect.l + 4,
+            ocr_rect.t + 6,
+        )
+
+
+class _FakePageBackend:
+    def is_valid(self):
+        return True
+
+    def get_bitmap_rects(self, scale=1):
+        return []
+
+
+def test_tesseract_cli_batches_pages(fake_tesseract):
+    cmd, log_path = fake_tesseract
+    model = TesseractOcrCliModel(
+        enabled=True,
+        options=TesseractCliOcrOptions(tesseract_cmd=cmd, force_full_page_ocr=True),
+    )
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+    )
+
+    # Scanned pages, with a single full page region each.
+    pages = []
+    for page_no in range(6):
+        page = Page(page_no=page_no, size=Size(width=20 + page_no, height=10))
+        page._backend = _FakePageBackend()
+        page._image_cache = {3.0: Image.new("RGB", (3 * (20 + page_no), 30), "white")}
+        pages.append(page)
+
+    orig_perf = settings.perf.model_copy()
+    settings.perf.page_batch_size = 4
+    settings.perf.ocr_batch_size = 16
+    try:
+        out_pages = list(model(conv_res, pages))
+    finally:
+        settings.perf = orig_perf
+
+    # One tesseract run per chunk of pages, instead of one per page.
+    assert len(log_path.read_text().split()) == 2
+
+    assert [p.page_no for p in out_pages] == list(range(6))
+    assert [[c.text for c in p.cells] for p in out_pages] == [
+        [f"{3 * (20 + page_no)}x30"] for page_no in range(6)
+    ]
@@ -0,0 +1,158 @@
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+from docling_core.types.doc import BoundingBox, Size
+from PIL import Image
+
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import TesseractOcrOptions
+from docling.datamodel.settings import settings
+from docling.models.tesseract_ocr_model import TesseractOcrModel
+
+
+class _FakeTessBaseAPI:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.threads = set()
+        self.image = None
+        self.busy = False
+        _FakeTessBaseAPI.instances.append(self)
+
+    def SetImage(self, image):
+        assert not self.busy, "an instance is used by several threads"
+        self.busy = True
+        self.threads.add(threading.current_thread().name)
+        self.image = image
+
+    def GetComponentImages(self, level, text_only):
+        time.sleep(0.01)
+        width, height = self.image.size
+        return [(None, {"x": 0, "y": 0, "w": width, "h": height}, None, None)]
+
+    def SetRectangle(self, x, y, w, h):
+        pass
+
+    def GetUTF8Text(self):
+        self.busy = False
+        return f"{self.image.width} "
+
+    def MeanTextConf(self):
+        return 90
+
+    def End(self):
+        pass
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch):
+    module = types.ModuleType("tesserocr")
+    module.tesseract_version = lambda: "5.3.0"
+    module.get_languages = lambda: ("/tessdata", ["eng"])
+    module.RIL = types.SimpleNamespace(TEXTLINE=2)
+    module.PSM = types.SimpleNamespace(AUTO=3)
+    module.OEM = types.SimpleNamespace(DEFAULT=3)
+    module.PyTessBaseAPI = _FakeTessBaseAPI
+    monkeypatch.setitem(sys.modules, "tesserocr", module)
+    _FakeTessBaseAPI.instances = []
+    yield module
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_tesserocr_pool_keeps_region_order(fake_tesserocr, concurrency):
+    model = TesseractOcrModel(enabled=True, options=TesseractOcrOptions())
+
+    images = [Image.new("RGB", (10 + ix, 10), "white") for ix in range(12)]
+    ocr_rects = [BoundingBox(l=ix, t=0, r=ix + 1, b=1) for ix in range(12)]
+
+    orig_perf = settings.perf.model_copy()
+    settings.perf.ocr_concurrency = concurrency
+    try:
+        results = model.ocr_regions(images, ocr_rects)
+        results_again = model.ocr_regions(images, ocr_rects)
+    finally:
+        settings.perf = orig_perf
+
+    assert [[c.text for c in cells] for cells in results] == [
+        [f"{10 + ix}"] for ix in range(12)
+    ]
+    assert [[c.id for c in cells] for cells in results] == [[0]] * 12
+    assert [c.model_dump() for cells in results_again for c in cells] == [
+        c.model_dump() for cells in results for c in cells
+    ]
+
+    # The instances are initialized once and reused by the later calls.
+    assert 1 <= len(_FakeTessBaseAPI.instances) <= concurrency
+    if concurrency > 1:
+        threads = set().union(*(api.threads for api in _FakeTessBaseAPI.instances))
+        assert len(threads) > 1
+    assert all(
+        api.kwargs["lang"] == "fra+deu+spa+eng" for api in _FakeTessBaseAPI.instances
+    )
+
+
+class _FakePageBackend:
+    def is_valid(self):
+        return True
+
+    def get_bitmap_rects(self, scale=1):
+        return []
+
+
+def test_tesserocr_streams_pages(fake_tesserocr):
+    model = TesseractOcrModel(enabled=True, options=TesseractOcrOptions())
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=Path("./tests/data/2305.03393v1-pg9.pdf"),
+            format=InputFormat.PDF,
+            backend=PyPdfiumDocumentBackend,
+        )
+    )
+
+    pulled = []
+
+    def pages():
+        for page_no in range(50):
+            pulled.append(page_no)
+            page = Page(page_no=page_no, size=Size(width=100, height=100))
+            page._backend = _FakePageBackend()
+            yield page
+
+    page_iter = iter(model(conv_res, pages()))
+    first = next(page_iter)
+
+    # Only the first chunk of pages is read before the first page comes out.
+    assert first.page_no == 0
+    assert len(pulled) <= settings.perf.page_batch_size
+    assert [first.page_no] + [p.page_no for p in page_iter] == list(range(50))
+
+
+def test_tesserocr_cells_in_page_coordinates(fake_tesserocr, tmp_path):
+    model = TesseractOcrModel(enabled=True, options=TesseractOcrOptions())
+    image = Image.new("RGB", (30, 15), "white")
+    rect_a = BoundingBox(l=10, t=20, r=20, b=25)
+    rect_b = BoundingBox(l=100, t=200, r=110, b=205)
+
+    (uncached,) = model.ocr_regions([image], [rect_b], [3])
+    assert uncached[0].bbox.as_tuple() == (100, 200, 110, 205)
+
+    orig_cache = settings.cache.model_copy()
+    settings.cache.cache_dir = str(tmp_path / "cache")
+    try:
+        # The same region image at another position is a cache hit, its cells
+        # are moved to the new position.
+        (cells_a,) = model.ocr_regions([image], [rect_a], [3])
+        model._ocr_region = None  # type: ignore[assignment]
+        (cells_b,) = model.ocr_regions([image], [rect_b], [3])
+    finally:
+        settings.cache = orig_cache
+
+    assert cells_a[0].bbox.as_tuple() == (10, 20, 20, 25)
+    assert [c.model_dump() for c in cells_b] == [c.model_dump() for c in uncached]